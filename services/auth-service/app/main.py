@@ -18,12 +18,15 @@ from .core.database import init_db, close_db
 from .api import auth
 
 try:
-    from logging.logger import setup_logging
+    from logging.logger import setup_logging, shutdown_logging
     from middleware.request_id import RequestIDMiddleware
+    from health.checks import close_health_session
 except ImportError:
     # Fallback if shared modules not available
     setup_logging = None
+    shutdown_logging = None
     RequestIDMiddleware = None
+    close_health_session = None
 
 
 settings = get_settings()
@@ -66,6 +69,14 @@ async def lifespan(app: FastAPI):
         logger.info("Database connections closed")
     except Exception as e:
         logger.error(f"Error during shutdown: {e}", exc_info=True)
+    
+    # Close the shared health-check HTTP session, if one was opened
+    if close_health_session:
+        await close_health_session()
+    
+    # Flush buffered file logs last, after the shutdown messages above
+    if shutdown_logging:
+        shutdown_logging()
 
 
 # Create FastAPI application
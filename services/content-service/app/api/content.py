@@ -6,6 +6,7 @@ This module defines all REST API endpoints for content generation.
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks, status
 from fastapi.responses import JSONResponse
+import asyncio
 import logging
 import uuid
 from typing import Dict
@@ -13,7 +14,10 @@ from typing import Dict
 from app.models.article import (
     ArticleGenerationRequest,
     ArticleGenerationResponse,
-    ArticleGenerationStatus
+    ArticleGenerationStatus,
+    ArticleBatchGenerationRequest,
+    ArticleBatchItem,
+    ArticleBatchGenerationResponse
 )
 from app.services.content_generator import ContentGenerator
 
@@ -62,6 +66,38 @@ async def generate_article(request: ArticleGenerationRequest):
         )
 
 
+@router.post(
+    "/generate/bulk",
+    response_model=ArticleBatchGenerationResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Generate Articles (Bulk)",
+    description="Generate several articles concurrently in a single request."
+)
+async def generate_articles_bulk(request: ArticleBatchGenerationRequest):
+    """
+    Generate multiple articles in one call.
+    
+    All articles are generated concurrently. A failure in one article does not
+    fail the whole batch; its error is reported at the same position instead.
+    """
+    logger.info(f"Received bulk article generation request: {len(request.requests)} articles")
+    
+    outcomes = await asyncio.gather(
+        *(content_generator.generate_article(r) for r in request.requests),
+        return_exceptions=True
+    )
+    
+    results = []
+    for article_request, outcome in zip(request.requests, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error(f"Error generating article '{article_request.topic}': {outcome}")
+            results.append(ArticleBatchItem(error=str(outcome)))
+        else:
+            results.append(ArticleBatchItem(result=outcome))
+    
+    return ArticleBatchGenerationResponse(results=results)
+
+
 @router.post(
     "/generate-async",
     response_model=ArticleGenerationStatus,
@@ -226,6 +262,7 @@ async def health_check():
         "service": "content-api",
         "endpoints": {
             "generate": "/api/v1/content/generate",
+            "generate_bulk": "/api/v1/content/generate/bulk",
             "generate_async": "/api/v1/content/generate-async",
             "status": "/api/v1/content/status/{task_id}",
             "tasks": "/api/v1/content/tasks"
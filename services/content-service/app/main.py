@@ -35,6 +35,11 @@ except ImportError:
     logger = logging.getLogger(__name__)
     has_middleware = False
 
+try:
+    from health.checks import close_health_session
+except ImportError:
+    close_health_session = None
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -50,6 +55,10 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("🛑 Content Service is shutting down...")
+    
+    # Close the shared health-check HTTP session, if one was opened
+    if close_health_session:
+        await close_health_session()
 
 
 # Initialize FastAPI application
@@ -6,6 +6,9 @@ from app.models.article import (
     ArticleGenerationRequest,
     ArticleGenerationResponse,
     ArticleGenerationStatus,
+    ArticleBatchGenerationRequest,
+    ArticleBatchItem,
+    ArticleBatchGenerationResponse,
     KeywordAnalysis,
     ArticleSection,
     FAQItem,
@@ -20,6 +23,9 @@ __all__ = [
     "ArticleGenerationRequest",
     "ArticleGenerationResponse",
     "ArticleGenerationStatus",
+    "ArticleBatchGenerationRequest",
+    "ArticleBatchItem",
+    "ArticleBatchGenerationResponse",
     "KeywordAnalysis",
     "ArticleSection",
     "FAQItem",
@@ -218,3 +218,27 @@ class ArticleGenerationStatus(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+
+
+class ArticleBatchGenerationRequest(BaseModel):
+    """Request to generate several articles in a single call."""
+    
+    requests: List[ArticleGenerationRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="Article generation requests"
+    )
+
+
+class ArticleBatchItem(BaseModel):
+    """Outcome of one article in a batch generation call."""
+    
+    result: Optional[ArticleGenerationResponse] = Field(None, description="Generated article if successful")
+    error: Optional[str] = Field(None, description="Error message if generation failed")
+
+
+class ArticleBatchGenerationResponse(BaseModel):
+    """Response for a batch generation call, in request order."""
+    
+    results: List[ArticleBatchItem] = Field(..., description="Per-request outcomes")
@@ -18,7 +18,7 @@ from app.models.workflow import (
     BulkWorkflowRequest,
     BulkWorkflowResponse
 )
-from app.tasks.workflow import generate_and_publish
+from app.tasks.workflow import generate_and_publish, generate_bulk_content
 from app.core.celery_app import celery_app
 
 logger = logging.getLogger(__name__)
@@ -124,6 +124,15 @@ async def get_workflow_status(workflow_id: str):
         elif task_result.state == 'SUCCESS':
             result = task_result.result or {}
             
+            # Workflow tasks report their own failures in the result
+            if result.get('status') == 'failed':
+                return WorkflowResponse(
+                    workflow_id=workflow_id,
+                    status=WorkflowStatus.FAILED,
+                    progress_percentage=0,
+                    error_message=result.get('error_message') or "Unknown error"
+                )
+            
             # Extract content info
             content = result.get('content', {})
             
@@ -192,25 +201,43 @@ async def execute_bulk_workflows(request: BulkWorkflowRequest):
     try:
         logger.info(f"Executing {len(request.workflows)} workflows")
         
-        workflows = []
-        
-        for workflow_request in request.workflows:
-            workflow_data = {
+        workflows_data = [
+            {
                 'content_params': workflow_request.content_params.model_dump(),
                 'publishing_targets': [t.model_dump() for t in workflow_request.publishing_targets],
                 'auto_publish': workflow_request.auto_publish,
                 'metadata': workflow_request.metadata
             }
+            for workflow_request in request.workflows
+        ]
+        
+        workflows = []
+        
+        if request.parallel_execution:
+            # Generate all content through a single bulk call to the content
+            # service; each workflow is then published by its own task under
+            # the ID assigned here, so status and cancel work per workflow
+            workflow_ids = [str(uuid.uuid4()) for _ in workflows_data]
+            generate_bulk_content.apply_async(args=[workflows_data, workflow_ids])
             
-            # Submit to Celery
-            task = generate_and_publish.apply_async(args=[workflow_data])
-            
-            workflows.append(WorkflowResponse(
-                workflow_id=task.id,
-                status=WorkflowStatus.PENDING,
-                progress_percentage=0,
-                current_step="Workflow queued"
-            ))
+            for workflow_id in workflow_ids:
+                workflows.append(WorkflowResponse(
+                    workflow_id=workflow_id,
+                    status=WorkflowStatus.PENDING,
+                    progress_percentage=0,
+                    current_step="Workflow queued"
+                ))
+        else:
+            for workflow_data in workflows_data:
+                # Submit to Celery
+                task = generate_and_publish.apply_async(args=[workflow_data])
+                
+                workflows.append(WorkflowResponse(
+                    workflow_id=task.id,
+                    status=WorkflowStatus.PENDING,
+                    progress_percentage=0,
+                    current_step="Workflow queued"
+                ))
         
         return BulkWorkflowResponse(
             total=len(workflows),
@@ -56,6 +56,8 @@ celery_app.conf.update(
 # Task routes (optional: route specific tasks to specific queues)
 celery_app.conf.task_routes = {
     'app.tasks.workflow.generate_and_publish': {'queue': 'default'},
+    'app.tasks.workflow.generate_bulk_content': {'queue': 'default'},
+    'app.tasks.workflow.publish_generated_content': {'queue': 'default'},
     'app.tasks.workflow.generate_content_task': {'queue': 'content'},
     'app.tasks.workflow.publish_content_task': {'queue': 'publishing'},
 }
@@ -0,0 +1,44 @@
+"""
+Coarse UTC Clock
+
+Cheap timestamps for model defaults and task results.
+Timestamps are cached and only refreshed every 10ms, which is far finer
+than anything the workflow timing fields need.
+"""
+
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+# Refresh interval for the cached timestamp (10ms)
+_RESOLUTION_NS = 10_000_000
+
+_cached_ns: int = 0
+_cached_now: Optional[datetime] = None
+
+
+def utcnow() -> datetime:
+    """
+    Get the current UTC time, accurate to roughly 10ms.
+    
+    Returns:
+        Naive UTC datetime (same semantics as datetime.utcnow)
+    """
+    global _cached_ns, _cached_now
+    
+    now_ns = time.time_ns()
+    if _cached_now is None or now_ns - _cached_ns >= _RESOLUTION_NS:
+        _cached_now = datetime.fromtimestamp(now_ns / 1e9, tz=timezone.utc).replace(tzinfo=None)
+        _cached_ns = now_ns
+    
+    return _cached_now
+
+
+def utcnow_iso() -> str:
+    """
+    Get the current UTC time as an ISO 8601 string.
+    
+    Returns:
+        ISO formatted timestamp
+    """
+    return utcnow().isoformat()
@@ -18,6 +18,12 @@ try:
     has_middleware = True
 except ImportError:
     has_middleware = False
+
+try:
+    from health.checks import close_health_session
+except ImportError:
+    close_health_session = None
+
 from fastapi.responses import JSONResponse
 import logging
 from contextlib import asynccontextmanager
@@ -79,6 +85,10 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("🛑 Orchestrator Service is shutting down...")
+    
+    # Close the shared health-check HTTP session, if one was opened
+    if close_health_session:
+        await close_health_session()
 
 
 # Initialize FastAPI application
@@ -4,11 +4,13 @@ Workflow Data Models
 Models for orchestrating the complete content generation and publishing workflow.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
 
+from app.core.clock import utcnow
+
 
 class WorkflowStatus(str, Enum):
     """Workflow execution status."""
@@ -51,6 +53,38 @@ class PublishingTarget(BaseModel):
     schedule_time: Optional[datetime] = Field(None, description="When to publish")
 
 
+def _workflow_request_example(schema: Dict[str, Any]) -> None:
+    """
+    Attach the WorkflowRequest example to the generated JSON schema.
+    
+    Kept as a callable so the example is only built when the OpenAPI
+    schema is actually requested, not at model import time.
+    """
+    schema["example"] = {
+        "content_params": {
+            "topic": "فوائد العمل عن بعد للشركات الناشئة",
+            "language": "ar",
+            "target_length": 1500,
+            "seo_level": "high",
+            "include_image": True,
+            "include_faq": True
+        },
+        "publishing_targets": [
+            {
+                "platform": "wordpress",
+                "post_status": "publish",
+                "categories": ["تقنية", "عمل"],
+                "tags": ["عمل عن بعد", "شركات ناشئة"]
+            },
+            {
+                "platform": "instagram",
+                "hashtags": ["عمل_عن_بعد", "تقنية", "شركات_ناشئة"]
+            }
+        ],
+        "auto_publish": True
+    }
+
+
 class WorkflowRequest(BaseModel):
     """
     Request to execute a complete workflow.
@@ -76,32 +110,7 @@ class WorkflowRequest(BaseModel):
     # Metadata
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "content_params": {
-                    "topic": "فوائد العمل عن بعد للشركات الناشئة",
-                    "language": "ar",
-                    "target_length": 1500,
-                    "seo_level": "high",
-                    "include_image": True,
-                    "include_faq": True
-                },
-                "publishing_targets": [
-                    {
-                        "platform": "wordpress",
-                        "post_status": "publish",
-                        "categories": ["تقنية", "عمل"],
-                        "tags": ["عمل عن بعد", "شركات ناشئة"]
-                    },
-                    {
-                        "platform": "instagram",
-                        "hashtags": ["عمل_عن_بعد", "تقنية", "شركات_ناشئة"]
-                    }
-                ],
-                "auto_publish": True
-            }
-        }
+    model_config = ConfigDict(json_schema_extra=_workflow_request_example)
 
 
 class WorkflowResult(BaseModel):
@@ -141,8 +150,8 @@ class WorkflowResponse(BaseModel):
     error_message: Optional[str] = Field(None, description="Error message if workflow failed")
     
     # Timing
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     completed_at: Optional[datetime] = Field(None, description="When workflow completed")
     
     # Metadata
@@ -191,5 +200,5 @@ class ScheduledWorkflow(BaseModel):
     recurring: bool = Field(default=False, description="Whether this is a recurring schedule")
     cron_expression: Optional[str] = Field(None, description="Cron expression for recurring schedules")
     enabled: bool = Field(default=True, description="Whether schedule is enabled")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
 
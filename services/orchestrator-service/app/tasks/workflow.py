@@ -7,15 +7,60 @@ These tasks run asynchronously using Celery.
 
 import httpx
 import logging
-from typing import Dict, Any, List
-from datetime import datetime, timedelta
+from celery import states
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, List, Optional
 
 from app.core.celery_app import celery_app
 from app.core.config import settings
+from app.core.clock import utcnow_iso
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True, frozen=True)
+class ContentView:
+    """
+    Read-only view over the content service's article payload.
+    
+    Built once per publish so the builders read attributes instead of
+    repeating nested dict lookups with throwaway defaults.
+    """
+    title: str
+    introduction: str
+    sections: List[Dict[str, Any]]
+    faq: List[Dict[str, Any]]
+    conclusion: str
+    featured_image_url: Optional[str]
+    slug: Optional[str]
+    meta_description: Optional[str]
+    
+    @classmethod
+    def from_dict(cls, content: Dict[str, Any]) -> "ContentView":
+        """
+        Build a view from the content service response.
+        
+        Args:
+            content: Generated content
+            
+        Returns:
+            ContentView over the content
+        """
+        featured_image = content.get('featured_image') or {}
+        metadata = content.get('metadata') or {}
+        return cls(
+            title=content.get('title') or '',
+            introduction=content.get('introduction') or '',
+            sections=content.get('sections') or [],
+            faq=content.get('faq') or [],
+            conclusion=content.get('conclusion') or '',
+            featured_image_url=featured_image.get('url'),
+            slug=metadata.get('slug'),
+            meta_description=metadata.get('meta_description')
+        )
+
+
 @celery_app.task(name="app.tasks.workflow.generate_and_publish", bind=True)
 def generate_and_publish(self, workflow_data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -48,37 +93,13 @@ def generate_and_publish(self, workflow_data: Dict[str, Any]) -> Dict[str, Any]:
         
         content_result = generate_content_sync(workflow_data['content_params'])
         
-        if not content_result or 'error' in content_result:
-            raise Exception(f"Content generation failed: {content_result.get('error', 'Unknown error')}")
-        
-        logger.info(f"Workflow {workflow_id}: Content generated successfully")
-        
         # Step 2: Publish to each platform
-        if workflow_data.get('auto_publish', True):
-            logger.info(f"Workflow {workflow_id}: Publishing to platforms...")
-            self.update_state(
-                state='PROGRESS',
-                meta={'progress': 60, 'step': 'Publishing content'}
-            )
-            
-            publishing_results = []
-            
-            for target in workflow_data['publishing_targets']:
-                try:
-                    result = publish_content_sync(content_result, target)
-                    publishing_results.append(result)
-                except Exception as e:
-                    logger.error(f"Failed to publish to {target['platform']}: {e}")
-                    publishing_results.append({
-                        'platform': target['platform'],
-                        'success': False,
-                        'error_message': str(e)
-                    })
-            
-            logger.info(f"Workflow {workflow_id}: Publishing completed")
-        else:
-            publishing_results = []
-            logger.info(f"Workflow {workflow_id}: Auto-publish disabled, skipping")
+        self.update_state(
+            state='PROGRESS',
+            meta={'progress': 60, 'step': 'Publishing content'}
+        )
+        
+        result = _complete_workflow(workflow_id, workflow_data, content_result)
         
         # Step 3: Complete
         self.update_state(
@@ -86,13 +107,113 @@ def generate_and_publish(self, workflow_data: Dict[str, Any]) -> Dict[str, Any]:
             meta={'progress': 100, 'step': 'Workflow completed'}
         )
         
+        return result
+        
+    except Exception as e:
+        logger.error(f"Workflow {workflow_id} failed: {e}", exc_info=True)
         return {
             'workflow_id': workflow_id,
-            'status': 'completed',
-            'content': content_result,
-            'publishing_results': publishing_results,
-            'completed_at': datetime.utcnow().isoformat()
+            'status': 'failed',
+            'error_message': str(e)
         }
+
+
+@celery_app.task(name="app.tasks.workflow.generate_bulk_content")
+def generate_bulk_content(
+    workflows_data: List[Dict[str, Any]],
+    workflow_ids: List[str]
+) -> Dict[str, Any]:
+    """
+    Generate content for several workflows in one batch call, then fan out.
+    
+    Each workflow is published by its own publish_generated_content task,
+    submitted under the workflow ID the API already handed back, so status
+    and cancel keep working per workflow. If anything fails before a
+    workflow's task is submitted, that workflow gets a failed result.
+    
+    Args:
+        workflows_data: List of workflow request data dictionaries
+        workflow_ids: Pre-assigned workflow (task) IDs, one per workflow
+        
+    Returns:
+        Dictionary with the workflow IDs that were dispatched
+    """
+    logger.info(f"Generating content for {len(workflows_data)} bulk workflows")
+    
+    dispatched = 0
+    try:
+        content_results = generate_content_batch_sync(
+            [w['content_params'] for w in workflows_data]
+        )
+        
+        for workflow_id, data, content_result in zip(workflow_ids, workflows_data, content_results):
+            publish_generated_content.apply_async(
+                args=[data, content_result],
+                task_id=workflow_id
+            )
+            dispatched += 1
+        
+        if dispatched < len(workflow_ids):
+            raise Exception(
+                f"Content service returned {len(content_results)} results "
+                f"for {len(workflow_ids)} workflows"
+            )
+        
+    except Exception as e:
+        # Nothing else will ever write a result for the remaining IDs,
+        # so record them as failed rather than leave them PENDING
+        logger.error(f"Bulk content generation failed: {e}", exc_info=True)
+        _fail_workflows(workflow_ids[dispatched:], str(e))
+        return {'status': 'failed', 'workflow_ids': workflow_ids, 'error_message': str(e)}
+    
+    return {'status': 'dispatched', 'workflow_ids': workflow_ids}
+
+
+def _fail_workflows(workflow_ids: List[str], error_message: str) -> None:
+    """
+    Store a failed result for workflows whose task was never submitted.
+    
+    Args:
+        workflow_ids: Workflow (task) IDs to mark as failed
+        error_message: Error reported for each workflow
+    """
+    for workflow_id in workflow_ids:
+        celery_app.backend.store_result(
+            workflow_id,
+            {
+                'workflow_id': workflow_id,
+                'status': 'failed',
+                'error_message': error_message
+            },
+            states.SUCCESS
+        )
+
+
+@celery_app.task(name="app.tasks.workflow.publish_generated_content", bind=True)
+def publish_generated_content(
+    self,
+    workflow_data: Dict[str, Any],
+    content_result: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Publish content generated by a bulk run for one workflow.
+    
+    Args:
+        workflow_data: Dictionary containing workflow request data
+        content_result: Output of the content service for this workflow
+        
+    Returns:
+        Dictionary with workflow results
+    """
+    workflow_id = self.request.id
+    
+    try:
+        self.update_state(
+            state='PROGRESS',
+            meta={'progress': 60, 'step': 'Publishing content'}
+        )
+        
+        return _complete_workflow(workflow_id, workflow_data, content_result)
         
     except Exception as e:
         logger.error(f"Workflow {workflow_id} failed: {e}", exc_info=True)
@@ -103,6 +224,54 @@ def generate_and_publish(self, workflow_data: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
+def _complete_workflow(
+    workflow_id: str,
+    workflow_data: Dict[str, Any],
+    content_result: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Publish already generated content and build the workflow result.
+    
+    Args:
+        workflow_id: Workflow ID used for logging and the result
+        workflow_data: Dictionary containing workflow request data
+        content_result: Output of the content service for this workflow
+        
+    Returns:
+        Dictionary with workflow results
+        
+    Raises:
+        Exception: If content generation failed
+    """
+    if not content_result or 'error' in content_result:
+        raise Exception(f"Content generation failed: {content_result.get('error', 'Unknown error')}")
+    
+    logger.info(f"Workflow {workflow_id}: Content generated successfully")
+    
+    if workflow_data.get('auto_publish', True):
+        logger.info(f"Workflow {workflow_id}: Publishing to platforms...")
+        
+        targets = workflow_data['publishing_targets']
+        
+        # Platforms are independent, so publish to them concurrently.
+        # ex.map keeps results in target order regardless of completion order.
+        with ThreadPoolExecutor(max_workers=max(1, min(len(targets), settings.MAX_CONCURRENT_TASKS))) as ex:
+            publishing_results = list(ex.map(lambda t: _safe_publish(content_result, t), targets))
+        
+        logger.info(f"Workflow {workflow_id}: Publishing completed")
+    else:
+        publishing_results = []
+        logger.info(f"Workflow {workflow_id}: Auto-publish disabled, skipping")
+    
+    return {
+        'workflow_id': workflow_id,
+        'status': 'completed',
+        'content': content_result,
+        'publishing_results': publishing_results,
+        'completed_at': utcnow_iso()
+    }
+
+
 @celery_app.task(name="app.tasks.workflow.generate_content_task")
 def generate_content_task(content_params: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -160,6 +329,40 @@ def generate_content_sync(content_params: Dict[str, Any]) -> Dict[str, Any]:
         return {'error': str(e)}
 
 
+def generate_content_batch_sync(params_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Synchronous function to generate several articles in one content service call.
+    
+    Args:
+        params_list: Content generation parameters, one per article
+        
+    Returns:
+        Generated content data (or an error dict) per article, in request order
+    """
+    try:
+        url = f"{settings.CONTENT_SERVICE_URL}/api/v1/content/generate/bulk"
+        
+        with httpx.Client(timeout=300.0) as client:
+            response = client.post(url, json={'requests': params_list})
+            response.raise_for_status()
+            items = response.json()['results']
+        
+        return [
+            item['result'] if item.get('result') is not None
+            else {'error': item.get('error') or 'Unknown error'}
+            for item in items
+        ]
+            
+    except httpx.HTTPStatusError as e:
+        logger.error(f"Content service error: {e.response.status_code} - {e.response.text}")
+        error = {'error': f"HTTP {e.response.status_code}: {e.response.text}"}
+    except Exception as e:
+        logger.error(f"Failed to generate content batch: {e}")
+        error = {'error': str(e)}
+    
+    return [dict(error) for _ in params_list]
+
+
 def publish_content_sync(content: Dict[str, Any], target: Dict[str, Any]) -> Dict[str, Any]:
     """
     Synchronous function to call the publishing service.
@@ -175,39 +378,16 @@ def publish_content_sync(content: Dict[str, Any], target: Dict[str, Any]) -> Dic
         platform = target['platform']
         
         # Build publishing request based on platform
-        if platform == 'wordpress':
-            publish_data = {
-                'platform': 'wordpress',
-                'wordpress_data': {
-                    'title': content.get('title', ''),
-                    'content': _convert_to_html(content),
-                    'status': target.get('post_status', 'publish'),
-                    'categories': target.get('categories', []),
-                    'tags': target.get('tags', []),
-                    'featured_image_url': content.get('featured_image', {}).get('url'),
-                    'slug': content.get('metadata', {}).get('slug'),
-                    'meta_description': content.get('metadata', {}).get('meta_description')
-                }
-            }
-        
-        elif platform == 'instagram':
-            publish_data = {
-                'platform': 'instagram',
-                'instagram_data': {
-                    'caption': _create_instagram_caption(content),
-                    'image_url': content.get('featured_image', {}).get('url', ''),
-                    'hashtags': target.get('hashtags', []),
-                    'location_id': target.get('location_id')
-                }
-            }
-        
-        else:
+        builder = _PAYLOAD_BUILDERS.get(platform)
+        if builder is None:
             return {
                 'platform': platform,
                 'success': False,
                 'error_message': f"Unsupported platform: {platform}"
             }
         
+        publish_data = builder(ContentView.from_dict(content), target)
+        
         # Add scheduling if specified
         if target.get('schedule_time'):
             publish_data['schedule_time'] = target['schedule_time']
@@ -244,12 +424,90 @@ def publish_content_sync(content: Dict[str, Any], target: Dict[str, Any]) -> Dic
         }
 
 
-def _convert_to_html(content: Dict[str, Any]) -> str:
+def _safe_publish(content: Dict[str, Any], target: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Publish to a target, turning any unexpected error into a failure result.
+    
+    Args:
+        content: Generated content
+        target: Publishing target configuration
+        
+    Returns:
+        Publishing result
+    """
+    try:
+        return publish_content_sync(content, target)
+    except Exception as e:
+        logger.error(f"Failed to publish to {target['platform']}: {e}")
+        return {
+            'platform': target['platform'],
+            'success': False,
+            'error_message': str(e)
+        }
+
+
+def _build_wordpress_payload(content: ContentView, target: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the publishing service request body for WordPress.
+    
+    Args:
+        content: View over the generated content
+        target: Publishing target configuration
+        
+    Returns:
+        Publishing request body
+    """
+    return {
+        'platform': 'wordpress',
+        'wordpress_data': {
+            'title': content.title,
+            'content': _convert_to_html(content),
+            'status': target.get('post_status', 'publish'),
+            'categories': target.get('categories', []),
+            'tags': target.get('tags', []),
+            'featured_image_url': content.featured_image_url,
+            'slug': content.slug,
+            'meta_description': content.meta_description
+        }
+    }
+
+
+def _build_instagram_payload(content: ContentView, target: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the publishing service request body for Instagram.
+    
+    Args:
+        content: View over the generated content
+        target: Publishing target configuration
+        
+    Returns:
+        Publishing request body
+    """
+    return {
+        'platform': 'instagram',
+        'instagram_data': {
+            'caption': _create_instagram_caption(content),
+            'image_url': content.featured_image_url or '',
+            'hashtags': target.get('hashtags', []),
+            'location_id': target.get('location_id')
+        }
+    }
+
+
+# Registry of payload builders, keyed by platform name.
+# To support a new platform, add its builder here.
+_PAYLOAD_BUILDERS: Dict[str, Callable[[ContentView, Dict[str, Any]], Dict[str, Any]]] = {
+    'wordpress': _build_wordpress_payload,
+    'instagram': _build_instagram_payload,
+}
+
+
+def _convert_to_html(content: ContentView) -> str:
     """
     Convert structured content to HTML for WordPress.
     
     Args:
-        content: Generated content structure
+        content: View over the generated content
         
     Returns:
         HTML string
@@ -257,11 +515,11 @@ def _convert_to_html(content: Dict[str, Any]) -> str:
     html_parts = []
     
     # Introduction
-    if content.get('introduction'):
-        html_parts.append(f"<p>{content['introduction']}</p>")
+    if content.introduction:
+        html_parts.append(f"<p>{content.introduction}</p>")
     
     # Sections
-    for section in content.get('sections', []):
+    for section in content.sections:
         heading_level = section.get('heading_level', 2)
         html_parts.append(f"<h{heading_level}>{section['heading']}</h{heading_level}>")
         
@@ -272,34 +530,31 @@ def _convert_to_html(content: Dict[str, Any]) -> str:
                 html_parts.append(f"<p>{para.strip()}</p>")
     
     # FAQ
-    if content.get('faq'):
+    if content.faq:
         html_parts.append("<h2>الأسئلة الشائعة</h2>")
-        for faq_item in content['faq']:
+        for faq_item in content.faq:
             html_parts.append(f"<h3>{faq_item['question']}</h3>")
             html_parts.append(f"<p>{faq_item['answer']}</p>")
     
     # Conclusion
-    if content.get('conclusion'):
-        html_parts.append(f"<p>{content['conclusion']}</p>")
+    if content.conclusion:
+        html_parts.append(f"<p>{content.conclusion}</p>")
     
     return '\n'.join(html_parts)
 
 
-def _create_instagram_caption(content: Dict[str, Any]) -> str:
+def _create_instagram_caption(content: ContentView) -> str:
     """
     Create an Instagram caption from content.
     
     Args:
-        content: Generated content
+        content: View over the generated content
         
     Returns:
         Instagram caption (max 2200 chars)
     """
-    title = content.get('title', '')
-    intro = content.get('introduction', '')
-    
     # Create a concise caption
-    caption = f"{title}\n\n{intro}"
+    caption = f"{content.title}\n\n{content.introduction}"
     
     # Truncate if too long (leaving room for hashtags)
     if len(caption) > 1800:
@@ -4,8 +4,11 @@ Publishing API Endpoints
 This module defines all REST API endpoints for publishing content.
 """
 
-from fastapi import APIRouter, HTTPException, status
-from typing import List
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+from typing import Any, Dict, List, Tuple
+import asyncio
 import logging
 
 from app.models.publication import (
@@ -14,10 +17,11 @@ from app.models.publication import (
     BulkPublicationRequest,
     BulkPublicationResponse,
     PlatformStatus,
-    PlatformType
+    PlatformType,
+    PublicationStatus
 )
-from app.publishers import PublisherFactory
-from app.core.config import settings
+from app.publishers import BasePublisher, create_publisher_by_str, get_supported_platforms
+from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +36,7 @@ router = APIRouter()
     summary="Publish Content",
     description="Publish content to a single platform"
 )
-async def publish_content(request: PublicationRequest):
+async def publish_content(request: PublicationRequest, http_request: Request):
     """
     Publish content to a specified platform.
     
@@ -51,8 +55,8 @@ async def publish_content(request: PublicationRequest):
                 detail=f"Platform {request.platform} is not configured"
             )
         
-        # Create publisher
-        publisher = PublisherFactory.create_publisher(request.platform, config)
+        # Get the (normally preloaded) publisher
+        publisher = _get_publisher(http_request, request.platform, config)
         
         if not publisher:
             raise HTTPException(
@@ -61,6 +65,7 @@ async def publish_content(request: PublicationRequest):
             )
         
         # Publish with retry logic
+        settings = get_settings()
         response = await publisher.retry_publish(
             request,
             max_attempts=settings.MAX_RETRY_ATTEMPTS,
@@ -79,63 +84,53 @@ async def publish_content(request: PublicationRequest):
         )
 
 
+# Bulk requests are validated straight from the raw JSON body with one
+# adapter built at import time, instead of FastAPI decoding the body to
+# Python objects first and validating the nested publications afterwards.
+_BULK_ADAPTER = TypeAdapter(BulkPublicationRequest)
+
+# Request body schema for the docs. Nested models resolve to the components
+# already registered by the single /publish endpoint.
+_BULK_REQUEST_SCHEMA = BulkPublicationRequest.model_json_schema(
+    ref_template="#/components/schemas/{model}"
+)
+_BULK_REQUEST_SCHEMA.pop("$defs", None)
+
+
 @router.post(
     "/publish/bulk",
     response_model=BulkPublicationResponse,
     status_code=status.HTTP_200_OK,
     summary="Bulk Publish",
-    description="Publish content to multiple platforms at once"
+    description="Publish content to multiple platforms at once",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _BULK_REQUEST_SCHEMA}}
+        }
+    }
 )
-async def bulk_publish(request: BulkPublicationRequest):
+async def bulk_publish(http_request: Request):
     """
     Publish content to multiple platforms simultaneously.
     
     This is useful when you want to publish the same content
     (or different content) to multiple platforms at once.
     """
+    try:
+        request = _BULK_ADAPTER.validate_json(await http_request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        )
+    
     try:
         logger.info(f"Bulk publishing to {len(request.publications)} platforms")
         
-        results: List[PublicationResponse] = []
-        successful = 0
-        failed = 0
-        
-        for pub_request in request.publications:
-            try:
-                # Get platform configuration
-                config = _get_platform_config(pub_request.platform)
-                
-                if not config:
-                    logger.warning(f"Platform {pub_request.platform} not configured, skipping")
-                    continue
-                
-                # Create publisher
-                publisher = PublisherFactory.create_publisher(pub_request.platform, config)
-                
-                if not publisher:
-                    logger.warning(f"Failed to create publisher for {pub_request.platform}, skipping")
-                    continue
-                
-                # Publish
-                response = await publisher.retry_publish(pub_request)
-                results.append(response)
-                
-                if response.status.value == "published":
-                    successful += 1
-                else:
-                    failed += 1
-                    
-                    # Stop on first error if requested
-                    if request.stop_on_first_error:
-                        logger.info("Stopping bulk publish due to error")
-                        break
-                
-            except Exception as e:
-                logger.error(f"Error in bulk publish: {e}")
-                failed += 1
-                
-                if request.stop_on_first_error:
-                    break
+        if request.stop_on_first_error:
+            results, successful, failed = await _bulk_publish_sequential(http_request, request.publications)
+        else:
+            results, successful, failed = await _bulk_publish_concurrent(http_request, request.publications)
         
         return BulkPublicationResponse(
             total=len(request.publications),
@@ -158,7 +153,7 @@ async def bulk_publish(request: BulkPublicationRequest):
     summary="Get Platform Status",
     description="Get the status of all configured platforms"
 )
-async def get_platform_status():
+async def get_platform_status(http_request: Request):
     """
     Get the status of all publishing platforms.
     
@@ -166,7 +161,7 @@ async def get_platform_status():
     """
     statuses = []
     
-    for platform in PublisherFactory.get_supported_platforms():
+    for platform in get_supported_platforms():
         config = _get_platform_config(platform)
         configured = config is not None
         available = False
@@ -174,7 +169,7 @@ async def get_platform_status():
         
         if configured:
             try:
-                publisher = PublisherFactory.create_publisher(platform, config)
+                publisher = _get_publisher(http_request, platform, config)
                 if publisher:
                     available = await publisher.validate_credentials()
                     if not available:
@@ -200,7 +195,7 @@ async def get_platform_status():
     summary="Delete Post",
     description="Delete a post from a platform"
 )
-async def delete_post(platform: PlatformType, post_id: str):
+async def delete_post(platform: PlatformType, post_id: str, http_request: Request):
     """
     Delete a post from a specified platform.
     
@@ -217,7 +212,7 @@ async def delete_post(platform: PlatformType, post_id: str):
                 detail=f"Platform {platform} is not configured"
             )
         
-        publisher = PublisherFactory.create_publisher(platform, config)
+        publisher = _get_publisher(http_request, platform, config)
         
         if not publisher:
             raise HTTPException(
@@ -245,6 +240,183 @@ async def delete_post(platform: PlatformType, post_id: str):
         )
 
 
+async def _bulk_publish_sequential(
+    http_request: Request,
+    publications: List[PublicationRequest]
+) -> Tuple[List[PublicationResponse], int, int]:
+    """
+    Publish requests one at a time, stopping at the first failure.
+    
+    Args:
+        http_request: Incoming request (for the preloaded publishers)
+        publications: Publication requests in submission order
+        
+    Returns:
+        Tuple of (results, successful count, failed count)
+    """
+    results: List[PublicationResponse] = []
+    successful = 0
+    failed = 0
+    
+    for pub_request in publications:
+        try:
+            publisher = _get_bulk_publisher(http_request, pub_request.platform)
+            
+            if not publisher:
+                continue
+            
+            # Publish
+            response = await publisher.retry_publish(pub_request)
+            results.append(response)
+            
+            if response.status is PublicationStatus.PUBLISHED:
+                successful += 1
+            else:
+                failed += 1
+                logger.info("Stopping bulk publish due to error")
+                break
+            
+        except Exception as e:
+            logger.error(f"Error in bulk publish: {e}")
+            failed += 1
+            break
+    
+    return results, successful, failed
+
+
+async def _bulk_publish_concurrent(
+    http_request: Request,
+    publications: List[PublicationRequest]
+) -> Tuple[List[PublicationResponse], int, int]:
+    """
+    Publish requests grouped by platform, all platforms concurrently.
+    
+    Each platform's publisher receives its requests through publish_many,
+    so the total latency is bounded by the slowest request rather than
+    the sum of all of them.
+    
+    Args:
+        http_request: Incoming request (for the preloaded publishers)
+        publications: Publication requests in submission order
+        
+    Returns:
+        Tuple of (results in submission order, successful count, failed count)
+    """
+    # Group request indexes by platform
+    groups: Dict[PlatformType, List[int]] = {}
+    for index, pub_request in enumerate(publications):
+        groups.setdefault(pub_request.platform, []).append(index)
+    
+    batch_indexes = []
+    batches = []
+    for platform, indexes in groups.items():
+        try:
+            publisher = _get_bulk_publisher(http_request, platform)
+        except Exception as e:
+            logger.error(f"Error in bulk publish: {e}")
+            publisher = None
+        
+        if publisher:
+            batch_indexes.append(indexes)
+            batches.append(publisher.publish_many([publications[i] for i in indexes]))
+    
+    outcomes: Dict[int, Any] = {}
+    for indexes, responses in zip(batch_indexes, await asyncio.gather(*batches)):
+        outcomes.update(zip(indexes, responses))
+    
+    results: List[PublicationResponse] = []
+    successful = 0
+    failed = 0
+    
+    for index in sorted(outcomes):
+        outcome = outcomes[index]
+        
+        if isinstance(outcome, BaseException):
+            logger.error(f"Error in bulk publish: {outcome}")
+            failed += 1
+            continue
+        
+        results.append(outcome)
+        if outcome.status is PublicationStatus.PUBLISHED:
+            successful += 1
+        else:
+            failed += 1
+    
+    return results, successful, failed
+
+
+def _get_bulk_publisher(http_request: Request, platform: PlatformType) -> BasePublisher | None:
+    """
+    Get a configured publisher for a bulk publication.
+    
+    Args:
+        http_request: Incoming request (for the preloaded publishers)
+        platform: The platform type
+        
+    Returns:
+        Publisher instance, or None if the platform is skipped
+    """
+    # Get platform configuration
+    config = _get_platform_config(platform)
+    
+    if not config:
+        logger.warning(f"Platform {platform} not configured, skipping")
+        return None
+    
+    publisher = _get_publisher(http_request, platform, config)
+    
+    if not publisher:
+        logger.warning(f"Failed to create publisher for {platform}, skipping")
+    
+    return publisher
+
+
+def load_publishers() -> Dict[PlatformType, BasePublisher]:
+    """
+    Create a publisher for every supported platform that is configured.
+    
+    Called once from the application lifespan; the result is stored on
+    app.state.publishers so request handlers never construct publishers.
+    
+    Returns:
+        Dictionary of platform type -> publisher instance
+    """
+    publishers: Dict[PlatformType, BasePublisher] = {}
+    
+    for platform in get_supported_platforms():
+        config = _get_platform_config(platform)
+        if config:
+            publisher = create_publisher_by_str(platform.value, config)
+            if publisher:
+                publishers[platform] = publisher
+    
+    return publishers
+
+
+def _get_publisher(
+    http_request: Request,
+    platform: PlatformType,
+    config: dict
+) -> BasePublisher | None:
+    """
+    Get the publisher preloaded at startup, or create it on demand.
+    
+    Args:
+        http_request: Incoming request
+        platform: The platform type
+        config: Platform configuration (used if nothing was preloaded)
+        
+    Returns:
+        Publisher instance, or None if it could not be created
+    """
+    publisher = getattr(http_request.app.state, "publishers", {}).get(platform)
+    
+    if publisher is None:
+        publisher = create_publisher_by_str(platform.value, config)
+    
+    return publisher
+
+
 def _get_platform_config(platform: PlatformType) -> dict | None:
     """
     Get configuration for a specific platform.
@@ -255,7 +427,9 @@ def _get_platform_config(platform: PlatformType) -> dict | None:
     Returns:
         Configuration dictionary or None if not configured
     """
-    if platform == PlatformType.WORDPRESS:
+    settings = get_settings()
+    
+    if platform is PlatformType.WORDPRESS:
         if settings.wordpress_configured:
             return {
                 'url': settings.WORDPRESS_URL,
@@ -263,14 +437,14 @@ def _get_platform_config(platform: PlatformType) -> dict | None:
                 'app_password': settings.WORDPRESS_APP_PASSWORD
             }
     
-    elif platform == PlatformType.INSTAGRAM:
+    elif platform is PlatformType.INSTAGRAM:
         if settings.instagram_configured:
             return {
                 'access_token': settings.INSTAGRAM_ACCESS_TOKEN,
                 'business_account_id': settings.INSTAGRAM_BUSINESS_ACCOUNT_ID
             }
     
-    elif platform == PlatformType.FACEBOOK:
+    elif platform is PlatformType.FACEBOOK:
         if settings.facebook_configured:
             return {
                 'page_id': settings.FACEBOOK_PAGE_ID,
@@ -294,7 +468,7 @@ async def health_check():
     return {
         "status": "healthy",
         "service": "publishing-api",
-        "supported_platforms": [p.value for p in PublisherFactory.get_supported_platforms()],
+        "supported_platforms": [p.value for p in get_supported_platforms()],
         "endpoints": {
             "publish": "/api/v1/publish/publish",
             "bulk_publish": "/api/v1/publish/publish/bulk",
@@ -2,7 +2,7 @@
 Core module for publishing service.
 """
 
-from app.core.config import settings
+from app.core.config import get_settings
 
-__all__ = ["settings"]
+__all__ = ["get_settings"]
 
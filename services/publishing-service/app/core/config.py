@@ -4,8 +4,10 @@ Configuration Management for Publishing Service
 Handles all configuration settings for various publishing platforms.
 """
 
+from functools import cached_property, lru_cache
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Optional
+from typing import Optional, Tuple
 
 
 class Settings(BaseSettings):
@@ -28,14 +30,14 @@ class Settings(BaseSettings):
     WORDPRESS_USERNAME: Optional[str] = None
     WORDPRESS_APP_PASSWORD: Optional[str] = None
     
-    @property
+    @cached_property
     def wordpress_configured(self) -> bool:
         """Check if WordPress is properly configured."""
-        return all([
-            self.WORDPRESS_URL,
-            self.WORDPRESS_USERNAME,
-            self.WORDPRESS_APP_PASSWORD
-        ])
+        return bool(
+            self.WORDPRESS_URL
+            and self.WORDPRESS_USERNAME
+            and self.WORDPRESS_APP_PASSWORD
+        )
     
     # ==============================================
     # Instagram Configuration
@@ -43,13 +45,13 @@ class Settings(BaseSettings):
     INSTAGRAM_ACCESS_TOKEN: Optional[str] = None
     INSTAGRAM_BUSINESS_ACCOUNT_ID: Optional[str] = None
     
-    @property
+    @cached_property
     def instagram_configured(self) -> bool:
         """Check if Instagram is properly configured."""
-        return all([
-            self.INSTAGRAM_ACCESS_TOKEN,
-            self.INSTAGRAM_BUSINESS_ACCOUNT_ID
-        ])
+        return bool(
+            self.INSTAGRAM_ACCESS_TOKEN
+            and self.INSTAGRAM_BUSINESS_ACCOUNT_ID
+        )
     
     # ==============================================
     # Facebook Configuration (for future use)
@@ -57,13 +59,13 @@ class Settings(BaseSettings):
     FACEBOOK_PAGE_ID: Optional[str] = None
     FACEBOOK_ACCESS_TOKEN: Optional[str] = None
     
-    @property
+    @cached_property
     def facebook_configured(self) -> bool:
         """Check if Facebook is properly configured."""
-        return all([
-            self.FACEBOOK_PAGE_ID,
-            self.FACEBOOK_ACCESS_TOKEN
-        ])
+        return bool(
+            self.FACEBOOK_PAGE_ID
+            and self.FACEBOOK_ACCESS_TOKEN
+        )
     
     # ==============================================
     # X (Twitter) Configuration (for future use)
@@ -73,15 +75,15 @@ class Settings(BaseSettings):
     X_ACCESS_TOKEN: Optional[str] = None
     X_ACCESS_TOKEN_SECRET: Optional[str] = None
     
-    @property
+    @cached_property
     def x_configured(self) -> bool:
         """Check if X (Twitter) is properly configured."""
-        return all([
-            self.X_API_KEY,
-            self.X_API_SECRET,
-            self.X_ACCESS_TOKEN,
-            self.X_ACCESS_TOKEN_SECRET
-        ])
+        return bool(
+            self.X_API_KEY
+            and self.X_API_SECRET
+            and self.X_ACCESS_TOKEN
+            and self.X_ACCESS_TOKEN_SECRET
+        )
     
     # ==============================================
     # Database Configuration
@@ -92,7 +94,7 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str = "postgres"
     POSTGRES_PORT: int = 5432
     
-    @property
+    @cached_property
     def DATABASE_URL(self) -> str:
         """Construct database URL."""
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
@@ -104,11 +106,37 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_URL: Optional[str] = None
     
-    @property
+    @cached_property
     def REDIS_CONNECTION_URL(self) -> str:
         """Get Redis connection URL."""
         return self.REDIS_URL or f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/0"
     
+    # ==============================================
+    # CORS
+    # ==============================================
+    CORS_ORIGINS: Tuple[str, ...] = (
+        "http://localhost:3000",
+        "http://localhost:5173",  # Vite dev server
+        "http://localhost:8080",
+        "http://127.0.0.1:3000",
+        "http://127.0.0.1:5173",
+        "http://127.0.0.1:8080",
+    )
+    # Same defaults as before these became settings: credentials allowed,
+    # any method and header; narrow them per deployment if needed
+    CORS_ALLOW_CREDENTIALS: bool = True
+    CORS_ALLOW_METHODS: Tuple[str, ...] = ("*",)
+    CORS_ALLOW_HEADERS: Tuple[str, ...] = ("*",)
+    
+    @field_validator("CORS_ORIGINS")
+    @classmethod
+    def validate_cors_origins(cls, v: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Reject wildcard or malformed origins at startup."""
+        for origin in v:
+            if not origin.startswith(("http://", "https://")):
+                raise ValueError(f"Invalid CORS origin: {origin!r}")
+        return v
+    
     # ==============================================
     # Publishing Settings
     # ==============================================
@@ -126,6 +154,15 @@ class Settings(BaseSettings):
     )
 
 
-# Create global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get cached settings instance.
+    
+    Settings are built on first use rather than at import time.
+    
+    Returns:
+        Settings instance
+    """
+    return Settings()
 
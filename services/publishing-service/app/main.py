@@ -17,26 +17,64 @@ try:
     has_middleware = True
 except ImportError:
     has_middleware = False
-from fastapi.responses import JSONResponse
+
+try:
+    from health.checks import close_health_session
+except ImportError:
+    close_health_session = None
+
+from fastapi.responses import ORJSONResponse
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
-from app.core.config import settings
-from app.api import publish
+from app.core.config import get_settings
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.LOG_LEVEL),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Production logs are collected with their own timestamps, so skip asctime there
+_DEBUG_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_LOG_FORMAT = '%(name)s - %(levelname)s - %(message)s'
+
+# Startup credential warm-up: one attempt per platform, bounded in time
+_WARMUP_TIMEOUT = 5.0  # seconds
+
+
+async def _warm_credentials(publishers) -> None:
+    """
+    Validate each preloaded publisher's credentials once, in the background.
+    
+    Only warms connections and the credential cache; a slow or failing
+    platform is logged and never holds up startup or readiness.
+    
+    Args:
+        publishers: Platform -> publisher mapping
+    """
+    results = await asyncio.gather(
+        *(
+            asyncio.wait_for(publisher.validate_credentials(max_retries=0), _WARMUP_TIMEOUT)
+            for publisher in publishers.values()
+        ),
+        return_exceptions=True
+    )
+    for platform, result in zip(publishers, results):
+        if result is not True:
+            logger.warning(f"Credential check failed for {platform.value}: {result!r}")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Lifespan context manager for startup and shutdown events.
     """
+    settings = get_settings()
+    
+    # Configure logging once per worker process, after fork
+    logging.basicConfig(
+        level=getattr(logging, settings.LOG_LEVEL),
+        format=_DEBUG_LOG_FORMAT if settings.DEBUG else _LOG_FORMAT
+    )
+    
     # Startup
     logger.info("🚀 Publishing Service is starting up...")
     logger.info(f"Environment: {settings.APP_ENV}")
@@ -58,46 +96,33 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning("⚠️  No platforms configured yet!")
     
+    # Preload publishers so the first request to each platform doesn't pay
+    # for construction; their connections and auth are warmed in the
+    # background, without holding up startup
+    from app.api.publish import load_publishers
+    
+    app.state.publishers = load_publishers()
+    warmup = asyncio.create_task(_warm_credentials(app.state.publishers))
+    
     yield
     
     # Shutdown
     logger.info("🛑 Publishing Service is shutting down...")
-
-
-# Initialize FastAPI application
-app = FastAPI(
-    title="AutoPublisherAI - Publishing Service",
-    description="Multi-platform content publishing service with plugin architecture",
-    version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    lifespan=lifespan
-)
-
-# CORS middleware configuration
-# Add Request ID Middleware
-if has_middleware:
-    app.add_middleware(RequestIDMiddleware)
-
-app.add_middleware(
-    CORSMiddleware,
-        allow_origins=[
-        "http://localhost:3000",
-        "http://localhost:5173",
-        "http://localhost:8080",
-        "http://127.0.0.1:3000",
-        "http://127.0.0.1:5173",
-        "http://127.0.0.1:8080",
-    ],,  # In production, replace with specific origins
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-    expose_headers=["X-Request-ID"],
-)
+    
+    warmup.cancel()
+    await asyncio.gather(warmup, return_exceptions=True)
+    
+    from app.publishers import clear_publisher_cache
+    
+    await asyncio.gather(*(publisher.aclose() for publisher in app.state.publishers.values()))
+    clear_publisher_cache()
+    
+    # Close the shared health-check HTTP session, if one was opened
+    if close_health_session:
+        await close_health_session()
 
 
 # Health check endpoint
-@app.get("/health", tags=["Health"])
 async def health_check():
     """
     Health check endpoint to verify service is running.
@@ -106,12 +131,11 @@ async def health_check():
         "status": "healthy",
         "service": "publishing-service",
         "version": "1.0.0",
-        "environment": settings.APP_ENV
+        "environment": get_settings().APP_ENV
     }
 
 
 # Root endpoint
-@app.get("/", tags=["Root"])
 async def root():
     """
     Root endpoint with service information.
@@ -125,32 +149,85 @@ async def root():
     }
 
 
-# Include routers
-app.include_router(publish.router, prefix="/api/v1/publish", tags=["Publishing"])
-
-
 # Global exception handler
-@app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """
     Global exception handler for unhandled errors.
     """
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    debug = get_settings().DEBUG
+    
+    # Only pay for traceback formatting when debugging
+    if debug:
+        logger.error("Unhandled exception: %s", exc, exc_info=True)
+    else:
+        logger.error("Unhandled exception: %r", exc)
+    
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
-            "message": str(exc) if settings.DEBUG else "An unexpected error occurred"
+            "message": str(exc) if debug else "An unexpected error occurred"
         }
     )
 
 
+def create_app() -> FastAPI:
+    """
+    Build the FastAPI application.
+    
+    The publishing router (and with it every publisher and its HTTP stack)
+    is imported here rather than at module import, so importing app.main
+    stays cheap. Run with `uvicorn app.main:create_app --factory`.
+    
+    Returns:
+        Configured FastAPI application
+    """
+    from app.api import publish
+    
+    # Initialize FastAPI application
+    app = FastAPI(
+        title="AutoPublisherAI - Publishing Service",
+        description="Multi-platform content publishing service with plugin architecture",
+        version="1.0.0",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan
+    )
+    
+    # Add Request ID Middleware
+    if has_middleware:
+        app.add_middleware(RequestIDMiddleware)
+    
+    # CORS middleware configuration
+    settings = get_settings()
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
+        allow_methods=settings.CORS_ALLOW_METHODS,
+        allow_headers=settings.CORS_ALLOW_HEADERS,
+        expose_headers=("X-Request-ID",),
+    )
+    
+    app.add_api_route("/health", health_check, methods=["GET"], tags=["Health"])
+    app.add_api_route("/", root, methods=["GET"], tags=["Root"])
+    
+    # Include routers
+    app.include_router(publish.router, prefix="/api/v1/publish", tags=["Publishing"])
+    
+    app.add_exception_handler(Exception, global_exception_handler)
+    
+    return app
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
-        "app.main:app",
+        "app.main:create_app",
+        factory=True,
         host="0.0.0.0",
         port=8000,
-        reload=settings.DEBUG
+        reload=get_settings().DEBUG
     )
 
@@ -4,10 +4,58 @@ Publication Data Models
 Pydantic models for publishing requests and responses.
 """
 
-from pydantic import BaseModel, Field, HttpUrl
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, field_validator
+from typing import Callable, Optional, List, Dict, Any, Tuple
+from datetime import datetime, timezone
 from enum import Enum
+import re
+import time
+
+
+# Compiled once and shared by every URL field below; much lighter than HttpUrl
+_URL_RE = re.compile(r'^https?://\S+$')
+
+
+def _check_url(value: Optional[str]) -> Optional[str]:
+    """Ensure an optional value looks like an http(s) URL."""
+    if value is not None and not _URL_RE.match(value):
+        raise ValueError("must be an http(s) URL")
+    return value
+
+
+def _describe(
+    descriptions: Dict[str, str],
+    example: Optional[Dict[str, Any]] = None
+) -> Callable[[Dict[str, Any]], None]:
+    """
+    Build a json_schema_extra hook that documents fields after the fact.
+    
+    Hot request/response models declare bare annotations so Pydantic has
+    no per-field metadata to walk; their descriptions are only merged in
+    when an OpenAPI schema is actually generated.
+    
+    Args:
+        descriptions: Field name -> description
+        example: Optional model example
+        
+    Returns:
+        Callable suitable for model_config["json_schema_extra"]
+    """
+    def extra(schema: Dict[str, Any]) -> None:
+        properties = schema.get("properties", {})
+        for name, description in descriptions.items():
+            if name in properties:
+                properties[name]["description"] = description
+        if example is not None:
+            schema["example"] = example
+    
+    return extra
+
+
+def _utcnow() -> datetime:
+    """Current time as an aware UTC datetime."""
+    return datetime.fromtimestamp(time.time(), tz=timezone.utc)
 
 
 class PlatformType(str, Enum):
@@ -34,11 +82,13 @@ class WordPressPostData(BaseModel):
     content: str = Field(..., description="Post content (HTML)")
     excerpt: Optional[str] = Field(None, description="Post excerpt")
     status: str = Field(default="publish", description="Post status (draft, publish, etc.)")
-    categories: List[str] = Field(default_factory=list, description="Post categories")
-    tags: List[str] = Field(default_factory=list, description="Post tags")
+    categories: Tuple[str, ...] = Field(default=(), description="Post categories")
+    tags: Tuple[str, ...] = Field(default=(), description="Post tags")
     featured_image_url: Optional[str] = Field(None, description="Featured image URL")
     slug: Optional[str] = Field(None, description="Post slug")
     meta_description: Optional[str] = Field(None, description="SEO meta description")
+    
+    _check_featured_image_url = field_validator('featured_image_url')(_check_url)
 
 
 class InstagramPostData(BaseModel):
@@ -46,16 +96,17 @@ class InstagramPostData(BaseModel):
     caption: str = Field(..., max_length=2200, description="Post caption")
     image_url: str = Field(..., description="Image URL to publish")
     location_id: Optional[str] = Field(None, description="Location ID")
-    hashtags: List[str] = Field(default_factory=list, max_length=30, description="Hashtags")
+    hashtags: Tuple[str, ...] = Field(default=(), max_length=30, description="Hashtags")
+    
+    _check_image_url = field_validator('image_url')(_check_url)
     
-    @property
+    @cached_property
     def full_caption(self) -> str:
-        """Get caption with hashtags."""
-        caption = self.caption
-        if self.hashtags:
-            hashtag_str = ' '.join([f"#{tag}" for tag in self.hashtags])
-            caption = f"{caption}\n\n{hashtag_str}"
-        return caption[:2200]  # Instagram limit
+        """Get caption with hashtags (computed once per instance)."""
+        if not self.hashtags:
+            return self.caption[:2200]  # Instagram limit
+        hashtag_str = ' '.join(f"#{tag}" for tag in self.hashtags)
+        return ''.join((self.caption, '\n\n', hashtag_str))[:2200]  # Instagram limit
 
 
 class FacebookPostData(BaseModel):
@@ -64,20 +115,29 @@ class FacebookPostData(BaseModel):
     link: Optional[str] = Field(None, description="Link to share")
     image_url: Optional[str] = Field(None, description="Image URL")
     scheduled_publish_time: Optional[datetime] = Field(None, description="Scheduled time")
+    
+    _check_urls = field_validator('link', 'image_url')(_check_url)
 
 
 class XPostData(BaseModel):
     """Data specific to X (Twitter) posts."""
     text: str = Field(..., max_length=280, description="Tweet text")
-    media_urls: List[str] = Field(default_factory=list, max_length=4, description="Media URLs")
+    media_urls: Tuple[str, ...] = Field(default=(), max_length=4, description="Media URLs")
     reply_to: Optional[str] = Field(None, description="Tweet ID to reply to")
+    
+    @field_validator('media_urls')
+    @classmethod
+    def _check_media_urls(cls, v: Tuple[str, ...]) -> Tuple[str, ...]:
+        for url in v:
+            _check_url(url)
+        return v
 
 
 class PublicationRequest(BaseModel):
     """
     Request to publish content to a platform.
     """
-    platform: PlatformType = Field(..., description="Target platform")
+    platform: PlatformType
     
     # Platform-specific data (only one should be provided)
     wordpress_data: Optional[WordPressPostData] = None
@@ -86,14 +146,20 @@ class PublicationRequest(BaseModel):
     x_data: Optional[XPostData] = None
     
     # Scheduling
-    schedule_time: Optional[datetime] = Field(None, description="When to publish (None = immediate)")
+    schedule_time: Optional[datetime] = None
     
-    # Metadata
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
+    # Metadata (None means no metadata). Opaque to this service; JSON object
+    # keys are always strings, so only the container type is checked.
+    metadata: Optional[dict] = None
     
-    class Config:
-        json_schema_extra = {
-            "example": {
+    model_config = ConfigDict(
+        json_schema_extra=_describe(
+            {
+                "platform": "Target platform",
+                "schedule_time": "When to publish (None = immediate)",
+                "metadata": "Additional metadata",
+            },
+            example={
                 "platform": "wordpress",
                 "wordpress_data": {
                     "title": "مقال رائع عن الذكاء الاصطناعي",
@@ -103,49 +169,68 @@ class PublicationRequest(BaseModel):
                     "tags": ["AI", "تكنولوجيا"]
                 }
             }
-        }
+        )
+    )
 
 
 class PublicationResponse(BaseModel):
     """
     Response after publishing content.
     """
-    publication_id: str = Field(..., description="Unique publication ID")
-    platform: PlatformType = Field(..., description="Platform published to")
-    status: PublicationStatus = Field(..., description="Publication status")
+    publication_id: str
+    platform: PlatformType
+    status: PublicationStatus
     
     # Platform-specific response data
-    platform_post_id: Optional[str] = Field(None, description="ID on the platform")
-    platform_url: Optional[str] = Field(None, description="URL of published content")
+    platform_post_id: Optional[str] = None
+    platform_url: Optional[str] = None
     
     # Timing
-    published_at: Optional[datetime] = Field(None, description="When it was published")
-    scheduled_for: Optional[datetime] = Field(None, description="When it's scheduled for")
+    published_at: Optional[datetime] = None
+    scheduled_for: Optional[datetime] = None
     
     # Error handling
-    error_message: Optional[str] = Field(None, description="Error message if failed")
-    retry_count: int = Field(default=0, description="Number of retry attempts")
+    error_message: Optional[str] = None
+    retry_count: int = 0
+    
+    # Metadata (None means no metadata). Built by the publishers themselves,
+    # so it is stored as-is without walking its contents.
+    metadata: SkipValidation[Optional[Dict[str, Any]]] = None
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: Optional[datetime] = None
     
-    # Metadata
-    metadata: Dict[str, Any] = Field(default_factory=dict)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    model_config = ConfigDict(
+        json_schema_extra=_describe({
+            "publication_id": "Unique publication ID",
+            "platform": "Platform published to",
+            "status": "Publication status",
+            "platform_post_id": "ID on the platform",
+            "platform_url": "URL of published content",
+            "published_at": "When it was published",
+            "scheduled_for": "When it's scheduled for",
+            "error_message": "Error message if failed",
+            "retry_count": "Number of retry attempts",
+        })
+    )
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Stamp updated_at from the same clock read as created_at."""
+        if self.updated_at is None:
+            self.updated_at = self.created_at
 
 
 class BulkPublicationRequest(BaseModel):
     """
     Request to publish to multiple platforms at once.
     """
-    publications: List[PublicationRequest] = Field(
-        ...,
-        min_length=1,
-        max_length=10,
-        description="List of publication requests"
-    )
+    publications: List[PublicationRequest] = Field(..., min_length=1, max_length=10)
+    stop_on_first_error: bool = False
     
-    stop_on_first_error: bool = Field(
-        default=False,
-        description="Whether to stop if one publication fails"
+    model_config = ConfigDict(
+        json_schema_extra=_describe({
+            "publications": "List of publication requests",
+            "stop_on_first_error": "Whether to stop if one publication fails",
+        })
     )
 
 
@@ -166,6 +251,6 @@ class PlatformStatus(BaseModel):
     platform: PlatformType
     configured: bool = Field(..., description="Whether platform is configured")
     available: bool = Field(..., description="Whether platform is currently available")
-    last_check: datetime = Field(default_factory=datetime.utcnow)
+    last_check: datetime = Field(default_factory=_utcnow)
     error_message: Optional[str] = None
 
@@ -5,7 +5,8 @@ This module implements the Factory Pattern to create publisher instances.
 This is a CRITICAL design pattern that makes adding new platforms trivial.
 """
 
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple, Type
 import logging
 
 from app.publishers.base import BasePublisher
@@ -16,87 +17,151 @@ from app.models.publication import PlatformType
 logger = logging.getLogger(__name__)
 
 
-class PublisherFactory:
+# Registry of available publishers.
+#
+# To add a new platform:
+# 1. Create a new publisher class (e.g., FacebookPublisher)
+# 2. Add it to this dictionary
+# 3. That's it! No other code changes needed.
+_PUBLISHERS: Dict[PlatformType, Type[BasePublisher]] = {
+    PlatformType.WORDPRESS: WordPressPublisher,
+    PlatformType.INSTAGRAM: InstagramPublisher,
+    # Future platforms go here:
+    # PlatformType.FACEBOOK: FacebookPublisher,
+    # PlatformType.X: XPublisher,
+    # PlatformType.LINKEDIN: LinkedInPublisher,
+}
+
+# Same registry keyed on the raw platform string, so dispatch is a single
+# string-hash lookup without going through Enum value coercion.
+_STRING_PUBLISHERS: Dict[str, Type[BasePublisher]] = {
+    platform.value: publisher_class
+    for platform, publisher_class in _PUBLISHERS.items()
+}
+
+
+@lru_cache(maxsize=32)
+def _build_publisher(platform: str, config_key: Tuple[Tuple[str, Any], ...]) -> BasePublisher:
     """
-    Factory class for creating publisher instances.
-    
-    This implements the Factory Pattern, which is one of the most
-    important design patterns in software engineering.
+    Construct a publisher, memoized per platform and configuration.
     
-    To add a new platform:
-    1. Create a new publisher class (e.g., FacebookPublisher)
-    2. Add it to the _publishers dictionary below
-    3. That's it! No other code changes needed.
+    Args:
+        platform: The platform string value (e.g. "wordpress")
+        config_key: Sorted (key, value) pairs of the platform configuration
+        
+    Returns:
+        Publisher instance
     """
+    publisher = _STRING_PUBLISHERS[platform](dict(config_key))
+    logger.info(f"Created publisher for platform: {platform}")
+    return publisher
+
+
+def create_publisher_by_str(
+    platform: str,
+    config: Dict[str, Any]
+) -> Optional[BasePublisher]:
+    """
+    Get a publisher instance for a raw platform string.
     
-    # Registry of available publishers
-    _publishers = {
-        PlatformType.WORDPRESS: WordPressPublisher,
-        PlatformType.INSTAGRAM: InstagramPublisher,
-        # Future platforms go here:
-        # PlatformType.FACEBOOK: FacebookPublisher,
-        # PlatformType.X: XPublisher,
-        # PlatformType.LINKEDIN: LinkedInPublisher,
-    }
+    Instances are cached per (platform, configuration), so repeated
+    requests reuse the same publisher instead of constructing a new one.
     
-    @classmethod
-    def create_publisher(
-        cls,
-        platform: PlatformType,
-        config: Dict[str, Any]
-    ) -> Optional[BasePublisher]:
-        """
-        Create a publisher instance for the specified platform.
-        
-        Args:
-            platform: The platform type
-            config: Platform-specific configuration
-            
-        Returns:
-            Publisher instance, or None if platform not supported
-            
-        Raises:
-            ValueError: If configuration is invalid
-        """
-        publisher_class = cls._publishers.get(platform)
+    Args:
+        platform: The platform string value (e.g. "wordpress")
+        config: Platform-specific configuration
         
-        if not publisher_class:
-            logger.error(f"Publisher not found for platform: {platform}")
-            return None
+    Returns:
+        Publisher instance, or None if platform not supported
         
-        try:
-            publisher = publisher_class(config)
-            logger.info(f"Created publisher for platform: {platform}")
-            return publisher
-        except Exception as e:
-            logger.error(f"Failed to create publisher for {platform}: {e}")
-            raise
+    Raises:
+        ValueError: If configuration is invalid
+    """
+    if platform not in _STRING_PUBLISHERS:
+        logger.error(f"Publisher not found for platform: {platform}")
+        return None
+    
+    try:
+        return _build_publisher(platform, tuple(sorted(config.items())))
+    except Exception as e:
+        logger.error(f"Failed to create publisher for {platform}: {e}")
+        raise
+
+
+def create_publisher(
+    platform: PlatformType,
+    config: Dict[str, Any]
+) -> Optional[BasePublisher]:
+    """
+    Get a publisher instance for the specified platform.
     
-    @classmethod
-    def get_supported_platforms(cls) -> list[PlatformType]:
-        """
-        Get list of supported platforms.
+    Args:
+        platform: The platform type
+        config: Platform-specific configuration
         
-        Returns:
-            List of supported platform types
-        """
-        return list(cls._publishers.keys())
+    Returns:
+        Publisher instance, or None if platform not supported
+        
+    Raises:
+        ValueError: If configuration is invalid
+    """
+    return create_publisher_by_str(platform.value, config)
+
+
+def clear_publisher_cache() -> None:
+    """
+    Forget all cached publisher instances.
+    
+    Call after closing the publishers, so a later request builds new ones
+    instead of reusing a closed HTTP client.
+    """
+    _build_publisher.cache_clear()
+
+
+def get_supported_platforms() -> list[PlatformType]:
+    """
+    Get list of supported platforms.
     
-    @classmethod
-    def is_platform_supported(cls, platform: PlatformType) -> bool:
-        """
-        Check if a platform is supported.
+    Returns:
+        List of supported platform types
+    """
+    return list(_PUBLISHERS)
+
+
+def is_platform_supported(platform: PlatformType) -> bool:
+    """
+    Check if a platform is supported.
+    
+    Args:
+        platform: Platform type to check
         
-        Args:
-            platform: Platform type to check
-            
-        Returns:
-            True if platform is supported
-        """
-        return platform in cls._publishers
+    Returns:
+        True if platform is supported
+    """
+    return platform in _PUBLISHERS
+
+
+class PublisherFactory:
+    """
+    Factory for creating publisher instances.
+    
+    This implements the Factory Pattern on top of the module-level
+    registry. The module functions can be called directly; this class
+    keeps the original PublisherFactory.* entry points available.
+    """
+    
+    create_publisher = staticmethod(create_publisher)
+    create_publisher_by_str = staticmethod(create_publisher_by_str)
+    get_supported_platforms = staticmethod(get_supported_platforms)
+    is_platform_supported = staticmethod(is_platform_supported)
 
 
 __all__ = [
+    "create_publisher",
+    "create_publisher_by_str",
+    "clear_publisher_cache",
+    "get_supported_platforms",
+    "is_platform_supported",
     "PublisherFactory",
     "BasePublisher",
     "WordPressPublisher",
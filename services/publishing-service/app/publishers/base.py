@@ -5,8 +5,13 @@ This defines the contract that all platform publishers must follow.
 This is a CRITICAL design pattern that makes the system extensible.
 """
 
-from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+import asyncio
+import httpx
+import random
+import time
+from contextlib import nullcontext
+from email.utils import parsedate_to_datetime
+from typing import ClassVar, List, Optional, Dict, Any, Union
 import logging
 
 from app.models.publication import (
@@ -18,22 +23,80 @@ from app.models.publication import (
 
 logger = logging.getLogger(__name__)
 
+# Default retries for idempotent HTTP requests
+_MAX_RETRIES = 5
 
-class BasePublisher(ABC):
+# Upper bound for a single wait between retried HTTP requests (seconds)
+_MAX_RETRY_DELAY = 30.0
+
+# How long a successful credential check is trusted (seconds)
+_CREDENTIALS_TTL = 300.0
+
+# Methods that can be re-sent after a server error without side effects
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Failures raised before the request reached the server, so any method
+# can safely be re-sent
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class UncertainWriteError(Exception):
+    """
+    A non-idempotent request reached the platform but its outcome is unknown.
+    
+    Raised on a 5xx response or a transport failure after the request was
+    sent: the platform may already have applied the write, so re-sending it
+    (or re-running the publish) could create a duplicate.
+    """
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
     """
-    Abstract base class for all platform publishers.
+    Parse a Retry-After header (delta-seconds or HTTP-date).
+    
+    Args:
+        response: Throttled response
+        
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class BasePublisher:
+    """
+    Base class for all platform publishers.
     
     This implements the Strategy Pattern, allowing us to swap
     publishing strategies at runtime.
     
     To add a new platform:
     1. Create a new class that inherits from BasePublisher
-    2. Implement the required methods
+    2. Set platform_type and implement the required methods
     3. Register it in the PublisherFactory
     
     That's it! No changes to existing code needed.
     """
     
+    # _client is the pooled httpx.AsyncClient each publisher creates;
+    # _sem optionally bounds its in-flight requests
+    __slots__ = ('config', 'logger', '_client', '_sem', '_creds_valid_until')
+    
+    # The platform type this publisher handles (set by each publisher)
+    platform_type: ClassVar[PlatformType]
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize the publisher with configuration.
@@ -43,18 +106,118 @@ class BasePublisher(ABC):
         """
         self.config = config
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._client: Optional[httpx.AsyncClient] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._creds_valid_until = 0.0
     
-    @property
-    @abstractmethod
-    def platform_type(self) -> PlatformType:
+    async def aclose(self) -> None:
+        """
+        Close the publisher's pooled HTTP client.
         """
-        Return the platform type this publisher handles.
+        if self._client is not None:
+            await self._client.aclose()
+    
+    def _credentials_cached(self) -> bool:
+        """
+        Check whether a recent credential validation is still trusted.
         
-        This must be implemented by each publisher.
+        Returns:
+            True if credentials were validated within the TTL
         """
-        pass
+        return time.monotonic() < self._creds_valid_until
+    
+    def _mark_credentials_valid(self) -> None:
+        """
+        Trust the credentials for the next _CREDENTIALS_TTL seconds.
+        """
+        self._creds_valid_until = time.monotonic() + _CREDENTIALS_TTL
+    
+    async def _request_with_retry(
+        self,
+        method: str,
+        url: str,
+        *,
+        max_retries: Optional[int] = None,
+        **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Send a request on the pooled client, backing off when throttled.
+        
+        Idempotent requests are retried on rate limiting (429), server
+        errors (5xx) and connection failures. Writes such as POST are sent
+        once by default: publishes already run under retry_publish, so
+        retrying here as well would multiply the requests sent per publish.
+        When a write does get retries, only 429s and connection failures
+        (the request never reached the server) are retried. A 5xx or a
+        failure after sending raises UncertainWriteError, since the
+        platform may already have applied the request. Other responses,
+        including 4xx client errors, are returned as-is. The wait honours
+        Retry-After when present, otherwise it is capped exponential
+        backoff with jitter.
+        
+        Args:
+            method: HTTP method
+            url: URL (relative to the client's base_url, or absolute)
+            max_retries: Maximum number of retries (default: 5 for
+                idempotent methods, 0 for writes)
+            **kwargs: Passed through to httpx.AsyncClient.request
+            
+        Returns:
+            The last response received
+            
+        Raises:
+            UncertainWriteError: If a non-idempotent request failed after
+                reaching the server
+        """
+        idempotent = method.upper() in _IDEMPOTENT_METHODS
+        if max_retries is None:
+            max_retries = _MAX_RETRIES if idempotent else 0
+        
+        for attempt in range(max_retries + 1):
+            try:
+                # Only the request itself holds a concurrency slot, not the backoff
+                async with self._sem or nullcontext():
+                    response = await self._client.request(method, url, **kwargs)
+            except _NOT_SENT_ERRORS as e:
+                if attempt == max_retries:
+                    raise
+                status_code, response = type(e).__name__, None
+            except httpx.TransportError as e:
+                if idempotent:
+                    raise
+                raise UncertainWriteError(f"{method} {url} failed after sending: {e!r}") from e
+            else:
+                status_code = response.status_code
+                if status_code == 401:
+                    # Credentials were rejected: revalidate on the next check
+                    self._creds_valid_until = 0.0
+                
+                if status_code >= 500 and not idempotent:
+                    raise UncertainWriteError(f"{method} {url} returned {status_code}")
+                
+                if attempt == max_retries or (status_code != 429 and status_code < 500):
+                    return response
+            
+            delay = _retry_after(response) if response is not None else None
+            if delay is None:
+                delay = min(2 ** attempt, _MAX_RETRY_DELAY) + random.uniform(0, 0.5)
+            delay = min(delay, _MAX_RETRY_DELAY)
+            
+            if self.logger.isEnabledFor(logging.WARNING):
+                self.logger.warning(
+                    f"{method} {url} returned {status_code}. "
+                    f"Retrying in {delay:.1f} seconds..."
+                )
+            await asyncio.sleep(delay)
+        
+        return response
+    
+    async def __aenter__(self) -> "BasePublisher":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
     
-    @abstractmethod
     async def publish(self, request: PublicationRequest) -> PublicationResponse:
         """
         Publish content to the platform.
@@ -70,21 +233,22 @@ class BasePublisher(ABC):
         Raises:
             Exception: If publication fails
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
-    async def validate_credentials(self) -> bool:
+    async def validate_credentials(self, max_retries: int = 5) -> bool:
         """
         Validate that the platform credentials are correct.
         
         This should make a simple API call to verify authentication.
         
+        Args:
+            max_retries: Retries for the check request (0 = single attempt)
+            
         Returns:
             True if credentials are valid, False otherwise
         """
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     async def delete_post(self, post_id: str) -> bool:
         """
         Delete a post from the platform.
@@ -95,7 +259,7 @@ class BasePublisher(ABC):
         Returns:
             True if deletion was successful
         """
-        pass
+        raise NotImplementedError
     
     async def is_available(self) -> bool:
         """
@@ -151,7 +315,9 @@ class BasePublisher(ABC):
         """
         Publish with automatic retry logic.
         
-        This implements exponential backoff for failed requests.
+        This implements linear backoff (delay * attempt) for failed requests.
+        A publish that raises UncertainWriteError is not retried: the post
+        may already exist, and publishing again could duplicate it.
         
         Args:
             request: Publication request
@@ -161,27 +327,42 @@ class BasePublisher(ABC):
         Returns:
             PublicationResponse
         """
-        import asyncio
-        
         last_error = None
         
-        for attempt in range(1, max_attempts + 1):
+        # Backoff schedule: wait delay * attempt after each failed attempt,
+        # and nothing after the last one
+        sleeps = [delay * attempt for attempt in range(1, max_attempts)] + [0]
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        log_warning = self.logger.isEnabledFor(logging.WARNING)
+        
+        for attempt, sleep_for in enumerate(sleeps, 1):
             try:
-                self.logger.info(f"Publishing attempt {attempt}/{max_attempts}")
+                if log_info:
+                    self.logger.info(f"Publishing attempt {attempt}/{max_attempts}")
                 response = await self.publish(request)
                 
-                if response.status == PublicationStatus.PUBLISHED:
+                if response.status is PublicationStatus.PUBLISHED:
                     return response
                 
+                last_error = response.error_message
+                
+            except UncertainWriteError as e:
+                self.logger.error(f"Publish outcome unknown, not retrying: {e}")
+                return self._create_response(
+                    publication_id=f"failed_{request.platform.value}",
+                    status=PublicationStatus.FAILED,
+                    error_message=f"Publish outcome unknown (not retried): {e}"
+                )
             except Exception as e:
                 last_error = str(e)
-                self.logger.warning(
-                    f"Attempt {attempt} failed: {e}. "
-                    f"Retrying in {delay * attempt} seconds..."
-                )
-                
-                if attempt < max_attempts:
-                    await asyncio.sleep(delay * attempt)  # Exponential backoff
+            
+            if sleep_for:
+                if log_warning:
+                    self.logger.warning(
+                        f"Attempt {attempt} failed: {last_error}. "
+                        f"Retrying in {sleep_for} seconds..."
+                    )
+                await asyncio.sleep(sleep_for)  # Linear backoff
         
         # All attempts failed
         return self._create_response(
@@ -189,4 +370,28 @@ class BasePublisher(ABC):
             status=PublicationStatus.FAILED,
             error_message=f"Failed after {max_attempts} attempts. Last error: {last_error}"
         )
-
+    
+    async def publish_many(
+        self,
+        requests: List[PublicationRequest],
+        max_attempts: int = 3,
+        delay: int = 5
+    ) -> List[Union[PublicationResponse, BaseException]]:
+        """
+        Publish several requests to this platform concurrently.
+        
+        Each request goes through retry_publish; exceptions are returned
+        in place of the response instead of being raised.
+        
+        Args:
+            requests: Publication requests for this platform
+            max_attempts: Maximum retry attempts per request
+            delay: Initial delay between retries (seconds)
+            
+        Returns:
+            Responses (or exceptions) in the same order as the requests
+        """
+        return await asyncio.gather(
+            *(self.retry_publish(r, max_attempts, delay) for r in requests),
+            return_exceptions=True
+        )
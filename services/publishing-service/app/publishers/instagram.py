@@ -8,10 +8,13 @@ This requires an Instagram Business Account connected to a Facebook Page.
 
 import httpx
 import asyncio
-from typing import Optional, Dict, Any
+import json
+import orjson
+from typing import List, Optional, Dict, Any, Tuple, TypedDict, Union
+from urllib.parse import urlencode
 import uuid
 
-from app.publishers.base import BasePublisher
+from app.publishers.base import BasePublisher, UncertainWriteError
 from app.models.publication import (
     PublicationRequest,
     PublicationResponse,
@@ -21,6 +24,65 @@ from app.models.publication import (
 )
 
 
+class InsightsDict(TypedDict, total=False):
+    """Latest daily value of each account insight metric."""
+    impressions: int
+    reach: int
+    profile_views: int
+
+
+def _container_params(ig_data: InstagramPostData) -> Dict[str, str]:
+    """
+    Build the media container parameters for a post (without the token).
+    
+    Args:
+        ig_data: Instagram post data
+        
+    Returns:
+        Parameters for POST /{business_account_id}/media
+    """
+    params = {
+        "image_url": ig_data.image_url,
+        "caption": ig_data.full_caption
+    }
+    
+    # Add location if provided
+    if ig_data.location_id:
+        params["location_id"] = ig_data.location_id
+    
+    return params
+
+
+def _post_url(result: Dict[str, Any]) -> Optional[str]:
+    """
+    Get the post URL from a media lookup result.
+    
+    Media IDs are not shortcodes, so they are never used to build a URL.
+    
+    Args:
+        result: Parsed media response (shortcode, permalink)
+        
+    Returns:
+        Permalink, a URL built from the shortcode, or None if neither is set
+    """
+    if result.get('permalink'):
+        return result['permalink']
+    if result.get('shortcode'):
+        return f"https://www.instagram.com/p/{result['shortcode']}"
+    return None
+
+
+# media_publish returns only the media ID, so the URL needs a lookup
+_MEDIA_URL_FIELDS = "shortcode,permalink"
+
+
+# The Graph API accepts at most 50 sub-requests per batch call
+_GRAPH_BATCH_SIZE = 50
+
+# In-flight Graph requests per publisher (the API rate-limits per token)
+_GRAPH_MAX_CONCURRENCY = 8
+
+
 class InstagramPublisher(BasePublisher):
     """
     Instagram publisher using Graph API.
@@ -32,10 +94,9 @@ class InstagramPublisher(BasePublisher):
     This is the OFFICIAL and SAFE way to post to Instagram programmatically.
     """
     
-    @property
-    def platform_type(self) -> PlatformType:
-        """Return Instagram platform type."""
-        return PlatformType.INSTAGRAM
+    __slots__ = ('access_token', 'business_account_id', 'graph_api_base')
+    
+    platform_type = PlatformType.INSTAGRAM
     
     def __init__(self, config: Dict[str, Any]):
         """
@@ -54,6 +115,20 @@ class InstagramPublisher(BasePublisher):
             raise ValueError("Instagram configuration incomplete. Need: access_token, business_account_id")
         
         self.graph_api_base = "https://graph.facebook.com/v18.0"
+        
+        # One pooled client per publisher: connections (and their TLS
+        # sessions) to the Graph API are reused across every call, and
+        # HTTP/2 multiplexes concurrent calls over a single connection
+        self._client = httpx.AsyncClient(
+            base_url=self.graph_api_base,
+            http2=True,
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=10)
+        )
+        
+        # Keep concurrency at what one token can sustain, so bulk publishes
+        # don't trigger 429s that then serialize through retries
+        self._sem = asyncio.Semaphore(_GRAPH_MAX_CONCURRENCY)
     
     async def publish(self, request: PublicationRequest) -> PublicationResponse:
         """
@@ -86,16 +161,15 @@ class InstagramPublisher(BasePublisher):
             
             # Step 2: Wait for container to be ready (Instagram processes the image)
             self.logger.info(f"Waiting for container {container_id} to be ready...")
-            await asyncio.sleep(3)  # Give Instagram time to process
+            await self._wait_container_ready(container_id)
             
             # Step 3: Publish the container
-            media_id = await self._publish_container(container_id)
+            published = await self._publish_container(container_id)
             
-            if not media_id:
+            if not published:
                 raise Exception("Failed to publish media container")
             
-            # Step 4: Get the post URL
-            post_url = f"https://www.instagram.com/p/{await self._get_media_code(media_id)}"
+            media_id, post_url = published
             
             self.logger.info(f"Successfully published to Instagram. Media ID: {media_id}")
             
@@ -106,6 +180,9 @@ class InstagramPublisher(BasePublisher):
                 platform_url=post_url
             )
             
+        except UncertainWriteError:
+            # The media may be live already; retry_publish must not re-send it
+            raise
         except Exception as e:
             error_msg = f"Instagram publishing error: {str(e)}"
             self.logger.error(error_msg, exc_info=True)
@@ -115,6 +192,216 @@ class InstagramPublisher(BasePublisher):
                 error_message=error_msg
             )
     
+    async def publish_many(
+        self,
+        requests: List[PublicationRequest],
+        max_attempts: int = 3,
+        delay: int = 5
+    ) -> List[Union[PublicationResponse, BaseException]]:
+        """
+        Publish several posts using Graph API batch requests.
+        
+        Containers for up to 50 posts are created in one batch call and,
+        once ready, published in a second one. Posts that fail before
+        publishing (container not created or never ready) fall back to the
+        regular retry_publish path; posts whose publish step fails are
+        never re-created (see _publish_batch).
+        
+        Args:
+            requests: Publication requests with Instagram data
+            max_attempts: Maximum retry attempts for fallback publishes
+            delay: Initial delay between fallback retries (seconds)
+            
+        Returns:
+            Responses (or exceptions) in the same order as the requests
+        """
+        results: List[Union[PublicationResponse, BaseException, None]] = [None] * len(requests)
+        
+        batchable = []
+        for index, request in enumerate(requests):
+            if request.instagram_data:
+                batchable.append(index)
+            else:
+                results[index] = ValueError("Instagram data is required for Instagram publishing")
+        
+        for start in range(0, len(batchable), _GRAPH_BATCH_SIZE):
+            chunk = batchable[start:start + _GRAPH_BATCH_SIZE]
+            published = await self._publish_batch([requests[i].instagram_data for i in chunk])
+            for index, response in zip(chunk, published):
+                results[index] = response
+        
+        # Posts that never reached the publish step go through the normal path
+        retry = [i for i, result in enumerate(results) if result is None]
+        if retry:
+            retried = await super().publish_many([requests[i] for i in retry], max_attempts, delay)
+            for index, response in zip(retry, retried):
+                results[index] = response
+        
+        return results
+    
+    async def _publish_batch(
+        self,
+        posts: List[InstagramPostData]
+    ) -> List[Optional[PublicationResponse]]:
+        """
+        Create, await and publish up to 50 media containers in two batch calls.
+        
+        A third batch call looks up the post URLs, since media_publish
+        returns only the media ID.
+        
+        A media_publish that fails or whose result is unknown (e.g. the
+        batch call timed out after Graph ran it) is retried once on its own
+        with the same creation_id, which cannot produce a second post; if
+        that also fails, the post is reported as failed. Containers are
+        never re-created once publishing was attempted.
+        
+        Args:
+            posts: Instagram post data
+            
+        Returns:
+            PublicationResponse per post, or None where the post failed
+            before publishing (safe to publish again from scratch)
+        """
+        # Step 1: Create all media containers in one call
+        created = await self._graph_batch([
+            {
+                "method": "POST",
+                "relative_url": f"{self.business_account_id}/media",
+                "body": urlencode(_container_params(ig_data))
+            }
+            for ig_data in posts
+        ])
+        container_ids = [result.get('id') if result else None for result in created]
+        
+        # Step 2: Wait for every container to finish processing
+        ready = await asyncio.gather(
+            *(self._wait_container_ready(cid) for cid in container_ids if cid),
+            return_exceptions=True
+        )
+        failed = {
+            cid for cid, outcome in zip([c for c in container_ids if c], ready)
+            if isinstance(outcome, BaseException)
+        }
+        container_ids = [cid if cid not in failed else None for cid in container_ids]
+        
+        # Step 3: Publish the ready containers in one call
+        to_publish = [cid for cid in container_ids if cid]
+        published = iter(await self._graph_batch([
+            {
+                "method": "POST",
+                "relative_url": f"{self.business_account_id}/media_publish",
+                "body": urlencode({"creation_id": cid})
+            }
+            for cid in to_publish
+        ]) if to_publish else [])
+        
+        media_ids: Dict[str, str] = {}
+        for cid in to_publish:
+            result = next(published)
+            if result and result.get('id'):
+                media_ids[cid] = result['id']
+        
+        # Look up the post URLs of the published media in one more call
+        lookups = await self._graph_batch([
+            {
+                "method": "GET",
+                "relative_url": f"{media_id}?fields={_MEDIA_URL_FIELDS}"
+            }
+            for media_id in media_ids.values()
+        ]) if media_ids else []
+        
+        outcomes: Dict[str, Optional[Tuple[str, Optional[str]]]] = {cid: None for cid in to_publish}
+        for (cid, media_id), lookup in zip(media_ids.items(), lookups):
+            outcomes[cid] = (media_id, _post_url(lookup) if lookup else None)
+        
+        # Step 4: Retry unconfirmed publishes individually, same containers
+        unconfirmed = [cid for cid, outcome in outcomes.items() if outcome is None]
+        retried = await asyncio.gather(
+            *(self._publish_container(cid) for cid in unconfirmed),
+            return_exceptions=True
+        )
+        for cid, outcome in zip(unconfirmed, retried):
+            if isinstance(outcome, BaseException):
+                self.logger.error(f"Publishing container {cid} failed: {outcome}")
+                outcome = None
+            outcomes[cid] = outcome
+        
+        responses: List[Optional[PublicationResponse]] = []
+        for cid in container_ids:
+            if not cid:
+                responses.append(None)
+                continue
+            
+            outcome = outcomes[cid]
+            if outcome is None:
+                responses.append(self._create_response(
+                    publication_id=str(uuid.uuid4()),
+                    status=PublicationStatus.FAILED,
+                    error_message=f"Publishing media container {cid} failed or its outcome is unknown"
+                ))
+                continue
+            
+            media_id, post_url = outcome
+            responses.append(self._create_response(
+                publication_id=str(uuid.uuid4()),
+                status=PublicationStatus.PUBLISHED,
+                platform_post_id=media_id,
+                platform_url=post_url
+            ))
+        
+        self.logger.info(
+            f"Batch published "
+            f"{sum(r is not None and r.status is PublicationStatus.PUBLISHED for r in responses)}"
+            f"/{len(posts)} Instagram posts"
+        )
+        return responses
+    
+    async def _graph_batch(self, batch: List[Dict[str, str]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Execute sub-requests through a single Graph API batch call.
+        
+        Args:
+            batch: Sub-requests (method, relative_url, body)
+            
+        Returns:
+            Parsed body per sub-request, or None where it failed or its
+            outcome is unknown (the whole call failing gives all None)
+        """
+        try:
+            response = await self._request_with_retry(
+                "POST",
+                "/",
+                data={
+                    "access_token": self.access_token,
+                    "batch": json.dumps(batch)
+                },
+                timeout=60.0
+            )
+            
+            response.raise_for_status()
+            entries = response.json()
+            
+        except httpx.HTTPStatusError as e:
+            self.logger.error(f"Graph batch request failed: {e.response.text}")
+            return [None] * len(batch)
+        except Exception as e:
+            self.logger.error(f"Unexpected error in Graph batch request: {e}")
+            return [None] * len(batch)
+        
+        results: List[Optional[Dict[str, Any]]] = []
+        for entry in entries:
+            if entry and entry.get('code') == 200:
+                try:
+                    results.append(json.loads(entry['body']))
+                    continue
+                except (KeyError, ValueError):
+                    pass
+            results.append(None)
+        
+        # Pad in case the API returned fewer entries than requested
+        results.extend([None] * (len(batch) - len(results)))
+        return results
+    
     async def _create_media_container(self, ig_data: InstagramPostData) -> Optional[str]:
         """
         Create an Instagram media container.
@@ -128,31 +415,26 @@ class InstagramPublisher(BasePublisher):
             Container ID if successful, None otherwise
         """
         try:
-            endpoint = f"{self.graph_api_base}/{self.business_account_id}/media"
+            endpoint = f"/{self.business_account_id}/media"
             
-            params = {
-                "image_url": ig_data.image_url,
-                "caption": ig_data.full_caption,
-                "access_token": self.access_token
-            }
+            params = _container_params(ig_data)
+            params["access_token"] = self.access_token
             
-            # Add location if provided
-            if ig_data.location_id:
-                params["location_id"] = ig_data.location_id
+            # Form-encoded body rather than query string: captions can be
+            # up to 2,200 characters
+            response = await self._request_with_retry(
+                "POST",
+                endpoint,
+                data=params,
+                timeout=30.0
+            )
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    endpoint,
-                    params=params,
-                    timeout=30.0
-                )
-                
-                response.raise_for_status()
-                result = response.json()
-                
-                container_id = result.get('id')
-                self.logger.info(f"Media container created: {container_id}")
-                return container_id
+            response.raise_for_status()
+            result = response.json()
+            
+            container_id = result.get('id')
+            self.logger.info(f"Media container created: {container_id}")
+            return container_id
                 
         except httpx.HTTPStatusError as e:
             self.logger.error(f"Failed to create container: {e.response.text}")
@@ -161,7 +443,50 @@ class InstagramPublisher(BasePublisher):
             self.logger.error(f"Unexpected error creating container: {e}")
             return None
     
-    async def _publish_container(self, container_id: str) -> Optional[str]:
+    async def _wait_container_ready(self, container_id: str, max_wait: float = 30.0) -> None:
+        """
+        Poll a media container until Instagram has finished processing it.
+        
+        Polls start at 0.5s and back off by 1.5x up to 4s between checks.
+        
+        Args:
+            container_id: The container ID from step 1
+            max_wait: Maximum time to wait (seconds)
+            
+        Raises:
+            Exception: If processing failed, expired, or took too long
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max_wait
+        delay = 0.5
+        
+        while True:
+            response = await self._request_with_retry(
+                "GET",
+                f"/{container_id}",
+                params={
+                    "fields": "status_code",
+                    "access_token": self.access_token
+                },
+                timeout=10.0
+            )
+            response.raise_for_status()
+            status_code = response.json().get('status_code')
+            
+            if status_code == "FINISHED":
+                return
+            
+            if status_code in ("ERROR", "EXPIRED"):
+                raise Exception(f"Media container {container_id} status: {status_code}")
+            
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise Exception(f"Media container {container_id} not ready after {max_wait}s")
+            
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 1.5, 4.0)
+    
+    async def _publish_container(self, container_id: str) -> Optional[Tuple[str, Optional[str]]]:
         """
         Publish an Instagram media container.
         
@@ -171,102 +496,112 @@ class InstagramPublisher(BasePublisher):
             container_id: The container ID from step 1
             
         Returns:
-            Media ID if successful, None otherwise
+            (media ID, post URL or None) if successful, None otherwise
         """
         try:
-            endpoint = f"{self.graph_api_base}/{self.business_account_id}/media_publish"
+            endpoint = f"/{self.business_account_id}/media_publish"
             
             params = {
                 "creation_id": container_id,
                 "access_token": self.access_token
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    endpoint,
-                    params=params,
-                    timeout=30.0
-                )
-                
-                response.raise_for_status()
-                result = response.json()
-                
-                media_id = result.get('id')
-                self.logger.info(f"Media published: {media_id}")
-                return media_id
+            # Form-encoded body rather than query string, so the access
+            # token stays out of request URLs (and proxy/access logs)
+            response = await self._request_with_retry(
+                "POST",
+                endpoint,
+                data=params,
+                timeout=30.0
+            )
+            
+            response.raise_for_status()
+            result = response.json()
+            
+            media_id = result.get('id')
+            if not media_id:
+                return None
+            
+            self.logger.info(f"Media published: {media_id}")
                 
+        except UncertainWriteError:
+            raise
         except httpx.HTTPStatusError as e:
             self.logger.error(f"Failed to publish container: {e.response.text}")
             return None
         except Exception as e:
             self.logger.error(f"Unexpected error publishing container: {e}")
             return None
+        
+        return media_id, await self._get_post_url(media_id)
     
-    async def _get_media_code(self, media_id: str) -> str:
+    async def _get_post_url(self, media_id: str) -> Optional[str]:
         """
-        Get the Instagram media code (shortcode) for a media ID.
-        
-        This is used to construct the Instagram post URL.
+        Get the post URL of published media.
         
         Args:
             media_id: Instagram media ID
             
         Returns:
-            Media code/shortcode
+            Post URL, or None if it could not be looked up
         """
         try:
-            endpoint = f"{self.graph_api_base}/{media_id}"
-            
-            params = {
-                "fields": "shortcode",
-                "access_token": self.access_token
-            }
+            response = await self._request_with_retry(
+                "GET",
+                f"/{media_id}",
+                params={
+                    "fields": _MEDIA_URL_FIELDS,
+                    "access_token": self.access_token
+                },
+                timeout=10.0
+            )
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    endpoint,
-                    params=params,
-                    timeout=10.0
-                )
-                
-                response.raise_for_status()
-                result = response.json()
-                
-                return result.get('shortcode', media_id)
+            response.raise_for_status()
+            return _post_url(response.json())
                 
         except Exception as e:
-            self.logger.error(f"Failed to get media code: {e}")
-            return media_id  # Fallback to media ID
+            self.logger.error(f"Failed to get post URL for media {media_id}: {e}")
+            return None
     
-    async def validate_credentials(self) -> bool:
+    async def validate_credentials(self, max_retries: int = 5) -> bool:
         """
         Validate Instagram credentials.
         
+        A successful check is cached for a few minutes.
+        
+        Args:
+            max_retries: Retries for the check request (0 = single attempt)
+            
         Returns:
             True if credentials are valid
         """
+        if self._credentials_cached():
+            return True
+        
         try:
-            endpoint = f"{self.graph_api_base}/{self.business_account_id}"
+            endpoint = f"/{self.business_account_id}"
             
             params = {
                 "fields": "id,username",
                 "access_token": self.access_token
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    endpoint,
-                    params=params,
-                    timeout=10.0
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    username = result.get('username', 'Unknown')
-                    self.logger.info(f"Instagram credentials valid. Account: @{username}")
-                    return True
-                
-                return False
+            response = await self._request_with_retry(
+                "GET",
+                endpoint,
+                params=params,
+                max_retries=max_retries,
+                timeout=10.0
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
+                username = result.get('username', 'Unknown')
+                self.logger.info(f"Instagram credentials valid. Account: @{username}")
+                self._mark_credentials_valid()
+                return True
+            
+            return False
                 
         except Exception as e:
             self.logger.error(f"Credential validation failed: {e}")
@@ -286,36 +621,36 @@ class InstagramPublisher(BasePublisher):
             True if deletion was successful
         """
         try:
-            endpoint = f"{self.graph_api_base}/{post_id}"
+            endpoint = f"/{post_id}"
             
             params = {
                 "access_token": self.access_token
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.delete(
-                    endpoint,
-                    params=params,
-                    timeout=10.0
-                )
-                
-                return response.status_code == 200
+            response = await self._request_with_retry(
+                "DELETE",
+                endpoint,
+                params=params,
+                timeout=10.0
+            )
+            
+            return response.status_code == 200
                 
         except Exception as e:
             self.logger.error(f"Failed to delete post {post_id}: {e}")
             return False
     
-    async def get_account_insights(self) -> Dict[str, Any]:
+    async def get_account_insights(self) -> InsightsDict:
         """
         Get Instagram account insights (analytics).
         
         This is a BONUS feature for monitoring performance.
         
         Returns:
-            Dictionary with account insights
+            Latest daily value per metric (empty if unavailable)
         """
         try:
-            endpoint = f"{self.graph_api_base}/{self.business_account_id}/insights"
+            endpoint = f"/{self.business_account_id}/insights"
             
             params = {
                 "metric": "impressions,reach,profile_views",
@@ -323,19 +658,25 @@ class InstagramPublisher(BasePublisher):
                 "access_token": self.access_token
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    endpoint,
-                    params=params,
-                    timeout=10.0
-                )
-                
-                if response.status_code == 200:
-                    return response.json()
-                
+            response = await self._request_with_retry(
+                "GET",
+                endpoint,
+                params=params,
+                timeout=10.0
+            )
+            
+            if response.status_code != 200:
                 return {}
+            
+            # Graph returns {"data": [{"name": ..., "values": [{"value": ...}, ...]}, ...]}
+            insights: InsightsDict = {}
+            for metric in orjson.loads(response.content).get('data', ()):
+                values = metric.get('values')
+                if values:
+                    insights[metric['name']] = values[-1].get('value', 0)
+            
+            return insights
                 
         except Exception as e:
             self.logger.error(f"Failed to get insights: {e}")
             return {}
-
@@ -6,13 +6,20 @@ Handles publishing content to WordPress sites via REST API.
 This uses WordPress Application Passwords for secure authentication.
 """
 
+import asyncio
 import httpx
 import base64
-from typing import Optional, Dict, Any
+import html
+import mimetypes
+import time
+from collections import OrderedDict
+from pathlib import PurePosixPath
+from typing import Optional, Dict, Any, Tuple
+from urllib.parse import urlsplit
 import uuid
 from datetime import datetime
 
-from app.publishers.base import BasePublisher
+from app.publishers.base import BasePublisher, UncertainWriteError
 from app.models.publication import (
     PublicationRequest,
     PublicationResponse,
@@ -22,6 +29,54 @@ from app.models.publication import (
 )
 
 
+# Resolved category/tag IDs kept per publisher
+_TERM_CACHE_SIZE = 1024
+_TERM_CACHE_TTL = 3600  # seconds
+
+
+def _image_filename(image_url: str, content_type: str) -> str:
+    """
+    Derive an upload filename from the image URL and content type.
+    
+    Keeping the real extension stops WordPress from re-encoding the file.
+    
+    Args:
+        image_url: URL the image was downloaded from
+        content_type: Content-Type reported by the image host
+        
+    Returns:
+        Filename such as "photo.png"
+    """
+    name = PurePosixPath(urlsplit(image_url).path).name
+    stem, suffix = PurePosixPath(name).stem, PurePosixPath(name).suffix
+    
+    if not suffix:
+        suffix = mimetypes.guess_extension(content_type.split(';', 1)[0].strip()) or '.jpg'
+    
+    return f"{stem or 'featured-image'}{suffix}"
+
+
+def _basic_auth_header(username: str, password: str) -> bytes:
+    """
+    Build a Basic Authorization header value.
+    
+    Returned as bytes, which httpx sends as-is without re-encoding.
+    
+    Args:
+        username: WordPress username
+        password: Application password
+        
+    Returns:
+        Header value such as b"Basic dXNlcjpwYXNz"
+    """
+    return b"Basic " + base64.b64encode(f"{username}:{password}".encode())
+
+
+async def _none() -> None:
+    """Placeholder awaitable for steps that have nothing to do."""
+    return None
+
+
 class WordPressPublisher(BasePublisher):
     """
     WordPress publisher using REST API v2.
@@ -30,10 +85,9 @@ class WordPressPublisher(BasePublisher):
     for maximum compatibility.
     """
     
-    @property
-    def platform_type(self) -> PlatformType:
-        """Return WordPress platform type."""
-        return PlatformType.WORDPRESS
+    __slots__ = ('site_url', 'username', 'app_password', 'auth_header', 'api_base', '_term_cache')
+    
+    platform_type = PlatformType.WORDPRESS
     
     def __init__(self, config: Dict[str, Any]):
         """
@@ -53,11 +107,23 @@ class WordPressPublisher(BasePublisher):
             raise ValueError("WordPress configuration incomplete. Need: url, username, app_password")
         
         # Create authentication header
-        credentials = f"{self.username}:{self.app_password}"
-        token = base64.b64encode(credentials.encode()).decode()
-        self.auth_header = f"Basic {token}"
+        self.auth_header = _basic_auth_header(self.username, self.app_password)
         
         self.api_base = f"{self.site_url}/wp-json/wp/v2"
+        
+        # One pooled client per publisher: connections (and their TLS
+        # sessions) are reused across every call to this site. HTTP/2 is
+        # negotiated via ALPN and falls back to HTTP/1.1 if unsupported
+        self._client = httpx.AsyncClient(
+            base_url=self.api_base,
+            http2=True,
+            headers={"Authorization": self.auth_header},
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40)
+        )
+        
+        # (taxonomy, name) -> (term ID, expiry), oldest first
+        self._term_cache: OrderedDict[Tuple[str, str], Tuple[int, float]] = OrderedDict()
     
     async def publish(self, request: PublicationRequest) -> PublicationResponse:
         """
@@ -78,20 +144,13 @@ class WordPressPublisher(BasePublisher):
         try:
             self.logger.info(f"Publishing to WordPress: {wp_data.title}")
             
-            # Step 1: Upload featured image (if provided)
-            featured_media_id = None
-            if wp_data.featured_image_url:
-                featured_media_id = await self._upload_image(wp_data.featured_image_url)
-            
-            # Step 2: Get or create categories
-            category_ids = []
-            if wp_data.categories:
-                category_ids = await self._get_or_create_categories(wp_data.categories)
-            
-            # Step 3: Get or create tags
-            tag_ids = []
-            if wp_data.tags:
-                tag_ids = await self._get_or_create_tags(wp_data.tags)
+            # Steps 1-3: Upload the featured image and resolve categories and
+            # tags concurrently; they are independent of each other
+            featured_media_id, category_ids, tag_ids = await asyncio.gather(
+                self._upload_image(wp_data.featured_image_url) if wp_data.featured_image_url else _none(),
+                self._get_or_create_categories(wp_data.categories) if wp_data.categories else _none(),
+                self._get_or_create_tags(wp_data.tags) if wp_data.tags else _none()
+            )
             
             # Step 4: Create the post
             post_data = {
@@ -114,19 +173,15 @@ class WordPressPublisher(BasePublisher):
                 post_data["tags"] = tag_ids
             
             # Make API request
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.api_base}/posts",
-                    json=post_data,
-                    headers={
-                        "Authorization": self.auth_header,
-                        "Content-Type": "application/json"
-                    },
-                    timeout=30.0
-                )
-                
-                response.raise_for_status()
-                result = response.json()
+            response = await self._request_with_retry(
+                "POST",
+                "/posts",
+                json=post_data,
+                timeout=30.0
+            )
+            
+            response.raise_for_status()
+            result = response.json()
             
             # Extract response data
             post_id = str(result.get('id'))
@@ -141,6 +196,9 @@ class WordPressPublisher(BasePublisher):
                 platform_url=post_url
             )
             
+        except UncertainWriteError:
+            # The post may exist already; retry_publish must not re-send it
+            raise
         except httpx.HTTPStatusError as e:
             error_msg = f"WordPress API error: {e.response.status_code} - {e.response.text}"
             self.logger.error(error_msg)
@@ -171,33 +229,46 @@ class WordPressPublisher(BasePublisher):
         try:
             self.logger.info(f"Uploading image from: {image_url}")
             
-            # Download the image
-            async with httpx.AsyncClient() as client:
-                img_response = await client.get(image_url, timeout=30.0)
+            # Stream the image straight from its host into the upload, so
+            # download and upload overlap and it is never buffered whole.
+            # The image lives on a third-party host: don't send our credentials
+            img_request = self._client.build_request("GET", image_url)
+            del img_request.headers["Authorization"]
+            img_response = await self._client.send(img_request, stream=True)
+            
+            try:
                 img_response.raise_for_status()
-                image_data = img_response.content
                 
                 # Get content type
                 content_type = img_response.headers.get('content-type', 'image/jpeg')
+                filename = _image_filename(image_url, content_type)
+                
+                headers = {
+                    "Content-Type": content_type,
+                    "Content-Disposition": f'attachment; filename="{filename}"'
+                }
+                # The length is only known up front for unencoded bodies
+                if 'content-length' in img_response.headers and 'content-encoding' not in img_response.headers:
+                    headers["Content-Length"] = img_response.headers['content-length']
                 
                 # Upload to WordPress
-                upload_response = await client.post(
-                    f"{self.api_base}/media",
-                    content=image_data,
-                    headers={
-                        "Authorization": self.auth_header,
-                        "Content-Type": content_type,
-                        "Content-Disposition": 'attachment; filename="featured-image.jpg"'
-                    },
-                    timeout=60.0
+                upload_response = await self._request_with_retry(
+                    "POST",
+                    "/media",
+                    content=img_response.aiter_bytes(),
+                    headers=headers,
+                    timeout=60.0,
+                    max_retries=0  # A streamed body can't be replayed
                 )
-                
-                upload_response.raise_for_status()
-                result = upload_response.json()
-                
-                media_id = result.get('id')
-                self.logger.info(f"Image uploaded successfully. Media ID: {media_id}")
-                return media_id
+            finally:
+                await img_response.aclose()
+            
+            upload_response.raise_for_status()
+            result = upload_response.json()
+            
+            media_id = result.get('id')
+            self.logger.info(f"Image uploaded successfully. Media ID: {media_id}")
+            return media_id
                 
         except Exception as e:
             self.logger.error(f"Failed to upload image: {e}")
@@ -207,116 +278,226 @@ class WordPressPublisher(BasePublisher):
         """
         Get or create WordPress categories.
         
+        All names are resolved concurrently.
+        
         Args:
             category_names: List of category names
             
         Returns:
             List of category IDs
         """
-        category_ids = []
-        
-        async with httpx.AsyncClient() as client:
-            for name in category_names:
-                try:
-                    # Search for existing category
-                    search_response = await client.get(
-                        f"{self.api_base}/categories",
-                        params={"search": name},
-                        headers={"Authorization": self.auth_header},
-                        timeout=10.0
-                    )
-                    
-                    categories = search_response.json()
-                    
-                    if categories:
-                        # Use existing category
-                        category_ids.append(categories[0]['id'])
-                    else:
-                        # Create new category
-                        create_response = await client.post(
-                            f"{self.api_base}/categories",
-                            json={"name": name},
-                            headers={
-                                "Authorization": self.auth_header,
-                                "Content-Type": "application/json"
-                            },
-                            timeout=10.0
-                        )
-                        
-                        if create_response.status_code == 201:
-                            new_category = create_response.json()
-                            category_ids.append(new_category['id'])
-                            
-                except Exception as e:
-                    self.logger.warning(f"Failed to process category '{name}': {e}")
-        
-        return category_ids
+        return await self._get_or_create_terms("categories", category_names)
     
     async def _get_or_create_tags(self, tag_names: list[str]) -> list[int]:
         """
         Get or create WordPress tags.
         
+        All names are resolved concurrently.
+        
         Args:
             tag_names: List of tag names
             
         Returns:
             List of tag IDs
         """
-        tag_ids = []
-        
-        async with httpx.AsyncClient() as client:
-            for name in tag_names:
-                try:
-                    # Search for existing tag
-                    search_response = await client.get(
-                        f"{self.api_base}/tags",
-                        params={"search": name},
-                        headers={"Authorization": self.auth_header},
-                        timeout=10.0
-                    )
-                    
-                    tags = search_response.json()
-                    
-                    if tags:
-                        # Use existing tag
-                        tag_ids.append(tags[0]['id'])
-                    else:
-                        # Create new tag
-                        create_response = await client.post(
-                            f"{self.api_base}/tags",
-                            json={"name": name},
-                            headers={
-                                "Authorization": self.auth_header,
-                                "Content-Type": "application/json"
-                            },
-                            timeout=10.0
-                        )
-                        
-                        if create_response.status_code == 201:
-                            new_tag = create_response.json()
-                            tag_ids.append(new_tag['id'])
-                            
-                except Exception as e:
-                    self.logger.warning(f"Failed to process tag '{name}': {e}")
-        
-        return tag_ids
+        return await self._get_or_create_terms("tags", tag_names)
     
-    async def validate_credentials(self) -> bool:
+    async def _get_or_create_terms(self, taxonomy: str, names: list[str]) -> list[int]:
+        """
+        Resolve taxonomy term names to IDs, creating missing terms.
+        
+        Args:
+            taxonomy: REST collection ("categories" or "tags")
+            names: Term names
+            
+        Returns:
+            List of term IDs, in the order of names (failed names are skipped)
+        """
+        # Several uncached names: match them against one page of the site's
+        # terms first, so only the rest need a search (and maybe a create)
+        misses = [name for name in names if self._cached_term(taxonomy, name) is None]
+        if len(misses) > 1:
+            await self._prefetch_terms(taxonomy, misses)
+        
+        ids = await asyncio.gather(
+            *(self._resolve_term(taxonomy, name) for name in names),
+            return_exceptions=True
+        )
+        return [term_id for term_id in ids if isinstance(term_id, int)]
+    
+    async def _resolve_term(self, taxonomy: str, name: str) -> Optional[int]:
+        """
+        Find a single taxonomy term by name, or create it.
+        
+        Resolved IDs are cached (LRU, with a TTL in case terms are deleted
+        on the site), since the same terms are used post after post.
+        
+        Args:
+            taxonomy: REST collection ("categories" or "tags")
+            name: Term name
+            
+        Returns:
+            Term ID, or None if it could not be found or created
+        """
+        term_id = self._cached_term(taxonomy, name)
+        if term_id is not None:
+            return term_id
+        
+        term_id = await self._lookup_term(taxonomy, name)
+        
+        if term_id is not None:
+            self._cache_term(taxonomy, name, term_id)
+        
+        return term_id
+    
+    def _cached_term(self, taxonomy: str, name: str) -> Optional[int]:
+        """
+        Get a term ID from the cache, dropping it if expired.
+        
+        Args:
+            taxonomy: REST collection ("categories" or "tags")
+            name: Term name
+            
+        Returns:
+            Cached term ID, or None
+        """
+        key = (taxonomy, name)
+        cached = self._term_cache.get(key)
+        if cached is None:
+            return None
+        
+        if cached[1] <= time.monotonic():
+            del self._term_cache[key]
+            return None
+        
+        self._term_cache.move_to_end(key)
+        return cached[0]
+    
+    def _cache_term(self, taxonomy: str, name: str, term_id: int) -> None:
+        """
+        Store a resolved term ID, evicting the least recently used entry.
+        
+        Args:
+            taxonomy: REST collection ("categories" or "tags")
+            name: Term name
+            term_id: Term ID
+        """
+        self._term_cache[(taxonomy, name)] = (term_id, time.monotonic() + _TERM_CACHE_TTL)
+        if len(self._term_cache) > _TERM_CACHE_SIZE:
+            self._term_cache.popitem(last=False)
+    
+    async def _prefetch_terms(self, taxonomy: str, names: list[str]) -> None:
+        """
+        Cache IDs for names found in one page of the site's most used terms.
+        
+        The REST API can't search for several names at once, so this fetches
+        up to 100 terms in a single request and matches names locally
+        (case-insensitively). Names not on that page are left to
+        _lookup_term.
+        
+        Args:
+            taxonomy: REST collection ("categories" or "tags")
+            names: Uncached term names
+        """
+        try:
+            response = await self._request_with_retry(
+                "GET",
+                f"/{taxonomy}",
+                params={
+                    "per_page": 100,
+                    "orderby": "count",
+                    "order": "desc",
+                    "_fields": "id,name"
+                },
+                timeout=10.0
+            )
+            response.raise_for_status()
+            
+            # Term names come back HTML-escaped ("News &amp; Events")
+            name_to_id = {
+                html.unescape(term['name']).lower(): term['id']
+                for term in response.json()
+            }
+            
+        except Exception as e:
+            self.logger.warning(f"Failed to prefetch {taxonomy}: {e}")
+            return
+        
+        for name in names:
+            term_id = name_to_id.get(name.lower())
+            if term_id is not None:
+                self._cache_term(taxonomy, name, term_id)
+    
+    async def _lookup_term(self, taxonomy: str, name: str) -> Optional[int]:
+        """
+        Search the site for a taxonomy term by name, creating it if missing.
+        
+        Args:
+            taxonomy: REST collection ("categories" or "tags")
+            name: Term name
+            
+        Returns:
+            Term ID, or None if it could not be found or created
+        """
+        try:
+            # Search for existing term
+            search_response = await self._request_with_retry(
+                "GET",
+                f"/{taxonomy}",
+                params={"search": name},
+                timeout=10.0
+            )
+            
+            terms = search_response.json()
+            
+            if terms:
+                # Use existing term
+                return terms[0]['id']
+            
+            # Create new term
+            create_response = await self._request_with_retry(
+                "POST",
+                f"/{taxonomy}",
+                json={"name": name},
+                timeout=10.0
+            )
+            
+            if create_response.status_code == 201:
+                return create_response.json()['id']
+                
+        except Exception as e:
+            self.logger.warning(f"Failed to process {taxonomy} term '{name}': {e}")
+        
+        return None
+    
+    async def validate_credentials(self, max_retries: int = 5) -> bool:
         """
         Validate WordPress credentials.
         
+        A successful check is cached for a few minutes.
+        
+        Args:
+            max_retries: Retries for the check request (0 = single attempt)
+            
         Returns:
             True if credentials are valid
         """
+        if self._credentials_cached():
+            return True
+        
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.api_base}/users/me",
-                    headers={"Authorization": self.auth_header},
-                    timeout=10.0
-                )
-                
-                return response.status_code == 200
+            response = await self._request_with_retry(
+                "GET",
+                "/users/me",
+                max_retries=max_retries,
+                timeout=10.0
+            )
+            
+            if response.status_code == 200:
+                self._mark_credentials_valid()
+                return True
+            
+            return False
                 
         except Exception as e:
             self.logger.error(f"Credential validation failed: {e}")
@@ -333,15 +514,14 @@ class WordPressPublisher(BasePublisher):
             True if deletion was successful
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.delete(
-                    f"{self.api_base}/posts/{post_id}",
-                    headers={"Authorization": self.auth_header},
-                    params={"force": True},  # Permanently delete
-                    timeout=10.0
-                )
-                
-                return response.status_code == 200
+            response = await self._request_with_retry(
+                "DELETE",
+                f"/posts/{post_id}",
+                params={"force": True},  # Permanently delete
+                timeout=10.0
+            )
+            
+            return response.status_code == 200
                 
         except Exception as e:
             self.logger.error(f"Failed to delete post {post_id}: {e}")
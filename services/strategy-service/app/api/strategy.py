@@ -4,33 +4,157 @@ Strategy API Endpoints
 API endpoints for content strategy generation and management.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Header, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+import hashlib
 import logging
+import time
+import uuid
+
+import openai
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
 from ..models.strategy import (
     StrategyRequest,
     ContentStrategy,
-    StrategyAnalysis
+    StrategyAnalysis,
+    ArticleIdea,
+    QuickIdea,
+    StrategyJob,
+    JobStatus,
+    CachePolicy
 )
 from ..services.strategy_generator import StrategyGenerator
-from ..core.config import get_settings
 
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/strategy", tags=["Strategy"])
 
+# Quick ideas are expensive (two GPT calls) and the same few topics are
+# requested repeatedly, so results are kept in a small in-process LRU.
+_IDEAS_CACHE_SIZE = 512
+_IDEAS_CACHE_TTL = 3600  # seconds
+_ideas_cache: "OrderedDict[Tuple[str, int, str], Tuple[float, List[ArticleIdea]]]" = OrderedDict()
+
+# Generated strategies are cached in Redis, keyed by the request body
+_STRATEGY_CACHE_PREFIX = "strategy:"
+_STRATEGY_CACHE_TTL = 86400  # seconds
+
+# Background strategy jobs live in Redis, so any worker (or a restarted
+# one) can report on them. Batch-mode jobs may run for up to 24 hours.
+_JOB_KEY_PREFIX = "strategy-job:"
+_JOB_TTL = 7 * 86400  # seconds
+
 
 # Dependency to get strategy generator
-def get_strategy_generator() -> StrategyGenerator:
-    """Get strategy generator instance."""
-    settings = get_settings()
-    return StrategyGenerator(settings.OPENAI_API_KEY)
+def get_strategy_generator(http_request: Request) -> StrategyGenerator:
+    """Get the shared strategy generator instance built at startup."""
+    return http_request.app.state.strategy_generator
+
+
+# Upstream failures with a stable client-facing error code: (type, HTTP
+# status, code). Anything else maps to the caller's default code with 500.
+_UPSTREAM_ERRORS = (
+    (openai.RateLimitError, 429, "agent.rate_limited"),
+    (openai.APITimeoutError, 504, "upstream.timeout"),
+)
+
+
+def _error_code(error: Exception, default_code: str) -> Tuple[int, str]:
+    """
+    Map a generation failure to an HTTP status and a stable error code.
+    
+    Args:
+        error: The exception raised while generating
+        default_code: Error code for unexpected failures
+        
+    Returns:
+        (HTTP status, error code)
+    """
+    for error_type, status_code, code in _UPSTREAM_ERRORS:
+        if isinstance(error, error_type):
+            return status_code, code
+    
+    return 500, default_code
+
+
+def _generation_error(error: Exception, default_code: str) -> HTTPException:
+    """
+    Map a generation failure to an HTTPException with a stable error code.
+    
+    Upstream error text is logged, never returned to the client.
+    
+    Args:
+        error: The exception raised while generating
+        default_code: Error code for unexpected failures
+        
+    Returns:
+        HTTPException to raise
+    """
+    status_code, code = _error_code(error, default_code)
+    return HTTPException(status_code=status_code, detail={"code": code})
+
+
+def _strategy_cache_key(request: StrategyRequest) -> str:
+    """Cache key for a strategy request: SHA-256 of its canonical JSON."""
+    body = orjson.dumps(
+        request.model_dump(mode="json", exclude_none=True),
+        option=orjson.OPT_SORT_KEYS
+    )
+    return _STRATEGY_CACHE_PREFIX + hashlib.sha256(body).hexdigest()
 
 
-@router.post("/generate", response_model=ContentStrategy)
+async def _cache_get(http_request: Request, key: str) -> Optional[bytes]:
+    """Read a cached strategy; a Redis outage is treated as a miss."""
+    try:
+        return await http_request.app.state.redis.get(key)
+    except RedisError as e:
+        logger.warning("Strategy cache read failed: %r", e)
+        return None
+
+
+async def _cache_set(http_request: Request, key: str, value: bytes) -> None:
+    """Store a generated strategy; a Redis outage is only logged."""
+    try:
+        await http_request.app.state.redis.set(key, value, ex=_STRATEGY_CACHE_TTL)
+    except RedisError as e:
+        logger.warning("Strategy cache write failed: %r", e)
+
+
+async def _save_job(redis: Redis, job: StrategyJob) -> None:
+    """
+    Store a strategy job (replacing any previous state) with its TTL.
+    
+    Raises:
+        RedisError: If Redis is unavailable
+    """
+    await redis.set(_JOB_KEY_PREFIX + job.job_id, job.model_dump_json(), ex=_JOB_TTL)
+
+
+async def _load_job(redis: Redis, job_id: str) -> Optional[StrategyJob]:
+    """
+    Load a strategy job, or None if it is unknown or expired.
+    
+    Raises:
+        RedisError: If Redis is unavailable
+    """
+    data = await redis.get(_JOB_KEY_PREFIX + job_id)
+    return StrategyJob.model_validate_json(data) if data is not None else None
+
+
+@router.post(
+    "/generate",
+    response_model=None,
+    responses={200: {"model": ContentStrategy}}
+)
 async def generate_strategy(
     request: StrategyRequest,
+    http_request: Request,
+    x_cache_policy: CachePolicy = Header(CachePolicy.ENABLED),
     generator: StrategyGenerator = Depends(get_strategy_generator)
 ):
     """
@@ -58,30 +182,157 @@ async def generate_strategy(
     
     **Response:** Complete content strategy with all details.
     
+    **Caching:** Identical requests are served from Redis for 24 hours.
+    Control this with the `X-Cache-Policy` header: `enabled` (default),
+    `replay` (read only), `write_only` (regenerate and store) or `disabled`.
+    
     **Processing Time:** 30-60 seconds (uses GPT-4 for analysis)
     """
+    if request.batch_mode:
+        raise HTTPException(
+            status_code=400,
+            detail={"code": "strategy.batch_requires_async"}
+        )
+    
+    key = _strategy_cache_key(request)
+    
+    if x_cache_policy in (CachePolicy.ENABLED, CachePolicy.REPLAY):
+        cached = await _cache_get(http_request, key)
+        if cached is not None:
+            logger.info(f"Serving cached strategy for industry: {request.industry}")
+            return Response(cached, media_type="application/json", headers={"X-Cache": "HIT"})
+    
     try:
         logger.info(f"Generating strategy for industry: {request.industry}")
         
         strategy = await generator.generate_strategy(request)
         
-        logger.info(f"Strategy generated successfully: {strategy.strategy_id}")
-        
-        return strategy
+        logger.info(f"Strategy generated successfully: {strategy['strategy_id']}")
         
     except Exception as e:
-        logger.error(f"Error generating strategy: {e}", exc_info=True)
+        logger.error(
+            "Error generating strategy: %r", e,
+            exc_info=logger.isEnabledFor(logging.DEBUG)
+        )
+        raise _generation_error(e, "strategy.generation_failed")
+    
+    # Already a plain dict; encode it once for both the cache and the client
+    body = orjson.dumps(strategy)
+    
+    if x_cache_policy in (CachePolicy.ENABLED, CachePolicy.WRITE_ONLY):
+        await _cache_set(http_request, key, body)
+    
+    return Response(body, media_type="application/json", headers={"X-Cache": "MISS"})
+
+
+@router.post("/generate-async", response_model=StrategyJob, status_code=202)
+async def generate_strategy_async(
+    request: StrategyRequest,
+    http_request: Request,
+    background_tasks: BackgroundTasks,
+    generator: StrategyGenerator = Depends(get_strategy_generator)
+):
+    """
+    Start content strategy generation in the background.
+    
+    Returns immediately with a job ID instead of holding the connection
+    for the whole generation. Poll `status_url` until the job is
+    `completed` (the strategy is in `result`) or `failed`.
+    
+    With `batch_mode` set, article ideas go through the OpenAI Batch API:
+    half the token cost, but the job may take up to 24 hours.
+    
+    **Response:** The pending job with its status URL.
+    """
+    job_id = str(uuid.uuid4())
+    job = StrategyJob(
+        job_id=job_id,
+        status_url=f"{router.prefix}/status/{job_id}"
+    )
+    
+    redis = http_request.app.state.redis
+    
+    # A job that can't be recorded could never be polled, so don't start it
+    try:
+        await _save_job(redis, job)
+    except RedisError as e:
+        logger.error("Strategy job store write failed: %r", e)
+        raise HTTPException(status_code=503, detail={"code": "strategy.job_store_unavailable"})
+    
+    background_tasks.add_task(_run_strategy_job, job, request, generator, redis)
+    
+    logger.info(f"Queued strategy job {job_id} for industry: {request.industry}")
+    
+    return job
+
+
+@router.get("/status/{job_id}", response_model=StrategyJob)
+async def get_strategy_status(job_id: str, http_request: Request):
+    """
+    Get the status (and, once completed, the result) of a strategy job.
+    
+    Jobs are kept for 7 days after their last update.
+    """
+    try:
+        job = await _load_job(http_request.app.state.redis, job_id)
+    except RedisError as e:
+        logger.error("Strategy job store read failed: %r", e)
+        raise HTTPException(status_code=503, detail={"code": "strategy.job_store_unavailable"})
+    
+    if job is None:
         raise HTTPException(
-            status_code=500,
-            detail=f"Failed to generate strategy: {str(e)}"
+            status_code=404,
+            detail=f"Strategy job {job_id} not found"
         )
+    
+    return job
+
 
+async def _run_strategy_job(
+    job: StrategyJob,
+    request: StrategyRequest,
+    generator: StrategyGenerator,
+    redis: Redis
+) -> None:
+    """
+    Generate a strategy for a background job and record the outcome.
+    
+    Args:
+        job: The job to update
+        request: Strategy request parameters
+        generator: Strategy generator
+        redis: Job store
+    """
+    job.status = JobStatus.RUNNING
+    await _update_job(redis, job)
+    
+    try:
+        job.result = await generator.generate_strategy(request)
+        job.status = JobStatus.COMPLETED
+        logger.info(f"Strategy job {job.job_id} completed: {job.result['strategy_id']}")
+        
+    except Exception as e:
+        logger.error(f"Strategy job {job.job_id} failed: {e}", exc_info=True)
+        # Only the stable code is exposed through /status; details stay in the log
+        job.error = _error_code(e, "strategy.generation_failed")[1]
+        job.status = JobStatus.FAILED
+    
+    await _update_job(redis, job)
+
+
+async def _update_job(redis: Redis, job: StrategyJob) -> None:
+    """Record a job's progress; a Redis outage is only logged."""
+    try:
+        await _save_job(redis, job)
+    except RedisError as e:
+        logger.error(f"Strategy job {job.job_id} store write failed: {e!r}")
 
-@router.post("/quick-ideas", response_model=List[dict])
+
+@router.post("/quick-ideas", response_model=List[QuickIdea], response_class=ORJSONResponse)
 async def generate_quick_ideas(
-    topic: str,
-    count: int = 10,
-    language: str = "ar",
+    topic: str = Query(..., min_length=1, max_length=200),
+    count: int = Query(10, ge=1, le=50),
+    language: str = Query("ar", pattern=r"^[a-z]{2}(-[A-Z]{2})?$"),
     generator: StrategyGenerator = Depends(get_strategy_generator)
 ):
     """
@@ -102,65 +353,99 @@ async def generate_quick_ideas(
     **Response:** List of article ideas with titles and descriptions.
     """
     try:
-        if count < 1 or count > 50:
-            raise HTTPException(
-                status_code=400,
-                detail="Count must be between 1 and 50"
-            )
-        
-        # Create a minimal request
-        from ..models.strategy import IndustryType, PublishingFrequency
-        
-        request = StrategyRequest(
-            industry=IndustryType.OTHER,
-            target_audience="General audience",
-            main_topics=[topic],
-            publishing_frequency=PublishingFrequency.THREE_TIMES_WEEK,
-            language=language,
-            duration_days=90
-        )
-        
-        # Generate keyword clusters
-        clusters = await generator._generate_keyword_clusters(request)
-        
-        if not clusters:
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to generate keyword clusters"
-            )
-        
-        # Generate article ideas
-        articles = await generator._generate_cluster_articles(
-            request,
-            clusters[0],
-            count
-        )
-        
-        # Convert to simple dict format
-        ideas = [
-            {
-                "title": article.title,
-                "description": article.description,
-                "content_type": article.content_type.value,
-                "keywords": article.keywords,
-                "estimated_word_count": article.estimated_word_count,
-                "difficulty": article.difficulty,
-                "estimated_traffic": article.estimated_traffic,
-                "priority": article.priority
-            }
-            for article in articles
-        ]
-        
-        return ideas
+        return await _get_quick_ideas(topic, count, language, generator)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error generating quick ideas: {e}", exc_info=True)
+        logger.error(
+            "Error generating quick ideas: %r", e,
+            exc_info=logger.isEnabledFor(logging.DEBUG)
+        )
+        raise _generation_error(e, "ideas.generation_failed")
+
+
+async def _get_quick_ideas(
+    topic: str,
+    count: int,
+    language: str,
+    generator: StrategyGenerator
+) -> List[ArticleIdea]:
+    """
+    Get quick article ideas, served from the TTL cache when possible.
+    
+    Args:
+        topic: Main topic or keyword
+        count: Number of ideas
+        language: Content language
+        generator: Strategy generator
+        
+    Returns:
+        List of article ideas
+    """
+    key = (topic, count, language)
+    cached = _ideas_cache.get(key)
+    if cached is not None:
+        if cached[0] > time.monotonic():
+            _ideas_cache.move_to_end(key)
+            return cached[1]
+        del _ideas_cache[key]
+    
+    ideas = await _compute_ideas(topic, count, language, generator)
+    
+    _ideas_cache[key] = (time.monotonic() + _IDEAS_CACHE_TTL, ideas)
+    if len(_ideas_cache) > _IDEAS_CACHE_SIZE:
+        _ideas_cache.popitem(last=False)
+    
+    return ideas
+
+
+async def _compute_ideas(
+    topic: str,
+    count: int,
+    language: str,
+    generator: StrategyGenerator
+) -> List[ArticleIdea]:
+    """
+    Generate quick article ideas for a topic with the AI generator.
+    
+    Args:
+        topic: Main topic or keyword
+        count: Number of ideas
+        language: Content language
+        generator: Strategy generator
+        
+    Returns:
+        List of article ideas
+    """
+    # Create a minimal request
+    from ..models.strategy import IndustryType, PublishingFrequency
+    
+    request = StrategyRequest(
+        industry=IndustryType.OTHER,
+        target_audience="General audience",
+        main_topics=[topic],
+        publishing_frequency=PublishingFrequency.THREE_TIMES_WEEK,
+        language=language,
+        duration_days=90
+    )
+    
+    # Generate keyword clusters
+    clusters = await generator._generate_keyword_clusters(request)
+    
+    if not clusters:
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to generate ideas: {str(e)}"
+            detail="Failed to generate keyword clusters"
         )
+    
+    # Generate article ideas; response_model=List[QuickIdea] picks the
+    # fields returned to the client
+    return await generator._generate_cluster_articles(
+        request,
+        clusters[0],
+        count
+    )
 
 
 @router.get("/export/{strategy_id}")
@@ -186,13 +471,13 @@ async def export_strategy(strategy_id: str, format: str = "json"):
 
 
 @router.get("/health")
-async def health_check():
+async def health_check(http_request: Request):
     """
     Health check endpoint.
     
     Returns service status and configuration.
     """
-    settings = get_settings()
+    settings = http_request.app.state.settings
     
     return {
         "service": "strategy-service",
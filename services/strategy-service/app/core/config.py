@@ -5,7 +5,8 @@ Configuration management using Pydantic Settings.
 """
 
 import os
-from functools import lru_cache
+from functools import cached_property, lru_cache
+from pydantic import computed_field
 from pydantic_settings import BaseSettings
 
 
@@ -37,9 +38,10 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str = "postgres"
     POSTGRES_PORT: int = 5432
     
-    @property
+    @computed_field(repr=False)
+    @cached_property
     def DATABASE_URL(self) -> str:
-        """Construct database URL."""
+        """Construct database URL (computed once per instance)."""
         return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
     
     # ==============================================
@@ -48,9 +50,10 @@ class Settings(BaseSettings):
     REDIS_HOST: str = "redis"
     REDIS_PORT: int = 6379
     
-    @property
+    @computed_field
+    @cached_property
     def REDIS_URL(self) -> str:
-        """Construct Redis URL."""
+        """Construct Redis URL (computed once per instance)."""
         return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/0"
     
     # ==============================================
@@ -5,149 +5,177 @@ FastAPI application for content strategy generation and planning.
 """
 
 import logging
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
+import httpx
+import orjson
+from fastapi import FastAPI, Request, Response
+from openai import AsyncOpenAI
+import redis.asyncio as aioredis
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-# Add shared directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'shared'))
-
-try:
-    from middleware.request_id import RequestIDMiddleware
-    has_middleware = True
-except ImportError:
-    has_middleware = False
+from autopublisher_shared.health.checks import close_health_session
+from autopublisher_shared.logging import JSONFormatter
+from autopublisher_shared.middleware.request_id import RequestIDMiddleware
 
 from .core.config import get_settings
 from .api import strategy
+from .services.strategy_generator import StrategyGenerator
 
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging: one structured JSON line per record on stdout
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(JSONFormatter())
+logging.basicConfig(level=logging.INFO, handlers=[_log_handler])
 
 logger = logging.getLogger(__name__)
 
-# Get settings
-settings = get_settings()
-
-# Create FastAPI app
-app = FastAPI(
-    title="AutoPublisher Strategy Service",
-    description="""
-    # Content Strategy AI Service
+# Long-form API description shown on /docs, kept out of the code
+_DESCRIPTION = Path(__file__).with_name("description.md").read_text(encoding="utf-8")
+
+# Constant response bodies, encoded once
+_ROOT_BODY = orjson.dumps({
+    "service": "AutoPublisher Strategy Service",
+    "version": "1.0.0",
+    "status": "running",
+    "docs": "/docs"
+})
+
+# In production, specify allowed origins
+_CORS_ORIGINS = frozenset({
+    "http://localhost:3000",
+    "http://localhost:5173",
+    "http://localhost:8080",
+    "http://127.0.0.1:3000",
+    "http://127.0.0.1:5173",
+    "http://127.0.0.1:8080",
+})
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Lifespan context manager for startup and shutdown events.
+    
+    Settings are resolved once here and kept on app.state, so handlers
+    read request.app.state.settings instead of calling get_settings().
+    The OpenAI client (with its connection pool), the strategy generator
+    and the Redis pool are also built here, so the first request doesn't
+    pay for their construction.
+    """
+    settings = get_settings()
+    app.state.settings = settings
     
-    This service provides AI-powered content strategy generation for AutoPublisher.
+    # Startup
+    logger.info(f"Starting {settings.APP_NAME}")
+    logger.info(f"Environment: {settings.APP_ENV}")
+    logger.info(f"Debug mode: {settings.DEBUG}")
     
-    ## Features
+    # Verify OpenAI API key
+    if not settings.OPENAI_API_KEY:
+        logger.error("OPENAI_API_KEY not set!")
+    else:
+        logger.info("OpenAI API key configured")
+    
+    # Shared clients
+    app.state.openai_client = AsyncOpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+    )
+    app.state.redis = aioredis.from_url(settings.REDIS_URL)
+    app.state.strategy_generator = StrategyGenerator(
+        settings.OPENAI_API_KEY,
+        client=app.state.openai_client,
+        cache=app.state.redis
+    )
+    
+    # Health body depends only on settings, which don't change after startup
+    app.state.health_body = orjson.dumps({
+        "service": "strategy-service",
+        "status": "healthy",
+        "environment": settings.APP_ENV,
+        "openai_configured": bool(settings.OPENAI_API_KEY),
+        "version": "1.0.0"
+    })
     
-    - **Comprehensive Strategy Generation**: 90-day content plans with keyword research
-    - **SEO Optimization**: Keyword clustering and difficulty analysis
-    - **Traffic Projections**: Estimate growth and performance
-    - **Article Ideas**: AI-generated article titles and descriptions
-    - **Publishing Schedule**: Optimized weekly content calendar
+    # Build the OpenAPI schema once now; FastAPI serves the cached copy
+    app.openapi()
     
-    ## How It Works
+    yield
     
-    1. Provide your industry, target audience, and main topics
-    2. AI analyzes market and generates keyword clusters
-    3. Creates 90 article ideas optimized for SEO
-    4. Organizes into weekly publishing schedule
-    5. Projects traffic growth over time
+    # Shutdown
+    logger.info(f"Shutting down {settings.APP_NAME}")
     
-    ## Powered By
+    await app.state.openai_client.close()
+    await app.state.redis.aclose()
     
-    - GPT-4 for content analysis and generation
-    - Advanced SEO algorithms
-    - Traffic projection models
-    """,
+    # Close the shared health-check HTTP session, if one was opened
+    await close_health_session()
+
+
+# Create FastAPI app
+app = FastAPI(
+    title="AutoPublisher Strategy Service",
+    description=_DESCRIPTION,
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Add CORS middleware
 # Add Request ID Middleware
-if has_middleware:
-    app.add_middleware(RequestIDMiddleware)
+app.add_middleware(RequestIDMiddleware)
 
+# Add CORS middleware (origins as a frozenset: O(1) membership per request).
+# Credentials are allowed, so methods and headers are listed explicitly
+# rather than wildcarded.
 app.add_middleware(
     CORSMiddleware,
-        allow_origins=[
-        "http://localhost:3000",
-        "http://localhost:5173",
-        "http://localhost:8080",
-        "http://127.0.0.1:3000",
-        "http://127.0.0.1:5173",
-        "http://127.0.0.1:8080",
-    ],,  # In production, specify allowed origins
+    allow_origins=_CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-    expose_headers=["X-Request-ID"],
+    allow_methods=("GET", "POST", "OPTIONS"),
+    allow_headers=("Authorization", "Content-Type", "X-Request-ID", "X-Cache-Policy"),
+    expose_headers=("X-Request-ID",),
 )
 
 # Include routers
 app.include_router(strategy.router)
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Run on application startup."""
-    logger.info(f"Starting {settings.APP_NAME}")
-    logger.info(f"Environment: {settings.APP_ENV}")
-    logger.info(f"Debug mode: {settings.DEBUG}")
-    
-    # Verify OpenAI API key
-    if not settings.OPENAI_API_KEY:
-        logger.error("OPENAI_API_KEY not set!")
-    else:
-        logger.info("OpenAI API key configured")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Run on application shutdown."""
-    logger.info(f"Shutting down {settings.APP_NAME}")
-
-
 @app.get("/")
 async def root():
     """Root endpoint."""
-    return {
-        "service": "AutoPublisher Strategy Service",
-        "version": "1.0.0",
-        "status": "running",
-        "docs": "/docs"
-    }
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """
     Health check endpoint.
     
-    Returns service status and configuration.
+    Returns service status and configuration (pre-encoded at startup).
     """
-    return {
-        "service": "strategy-service",
-        "status": "healthy",
-        "environment": settings.APP_ENV,
-        "openai_configured": bool(settings.OPENAI_API_KEY),
-        "version": "1.0.0"
-    }
+    return Response(request.app.state.health_body, media_type="application/json")
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
     
+    debug = get_settings().DEBUG
+    
+    # uvicorn refuses to combine --reload with multiple workers
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.DEBUG
+        reload=debug,
+        loop="uvloop",
+        http="httptools",
+        workers=1 if debug else (os.cpu_count() or 1)
     )
 
@@ -4,13 +4,33 @@ Content Strategy Models
 Data models for content strategy planning and analysis.
 """
 
-from typing import List, Optional, Dict, Any
-from datetime import datetime, date
-from pydantic import BaseModel, Field
-from enum import Enum
+from typing import Annotated, List, Optional, Dict
+from datetime import datetime, date, timezone
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+from typing_extensions import TypedDict
+from enum import StrEnum
+import time
 
 
-class IndustryType(str, Enum):
+_UTC = timezone.utc
+
+
+def utcnow() -> datetime:
+    """Current time as an aware UTC datetime, from a single time_ns() read."""
+    return datetime.fromtimestamp(time.time_ns() / 1e9, tz=_UTC)
+
+
+# Shared by the request/response models: instances are never mutated after
+# validation, enums are stored as their plain string values, and unknown
+# keys (e.g. extra fields in an AI response) are dropped.
+_MODEL_CONFIG = ConfigDict(
+    frozen=True,
+    use_enum_values=True,
+    extra='ignore'
+)
+
+
+class IndustryType(StrEnum):
     """Industry categories."""
     TECHNOLOGY = "technology"
     BUSINESS = "business"
@@ -28,7 +48,7 @@ class IndustryType(str, Enum):
     OTHER = "other"
 
 
-class ContentType(str, Enum):
+class ContentType(StrEnum):
     """Content types."""
     BLOG_POST = "blog_post"
     TUTORIAL = "tutorial"
@@ -40,7 +60,7 @@ class ContentType(str, Enum):
     OPINION = "opinion"
 
 
-class PublishingFrequency(str, Enum):
+class PublishingFrequency(StrEnum):
     """Publishing frequency options."""
     DAILY = "daily"
     EVERY_OTHER_DAY = "every_other_day"
@@ -49,26 +69,40 @@ class PublishingFrequency(str, Enum):
     WEEKLY = "weekly"
 
 
+class JobStatus(StrEnum):
+    """Background strategy job status."""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class CachePolicy(StrEnum):
+    """Strategy response cache policy (X-Cache-Policy header)."""
+    ENABLED = "enabled"        # read and write the cache
+    REPLAY = "replay"          # read only; never store new results
+    WRITE_ONLY = "write_only"  # always regenerate, then store
+    DISABLED = "disabled"      # bypass the cache entirely
+
+
 class StrategyRequest(BaseModel):
     """Request model for generating content strategy."""
     
+    model_config = ConfigDict(**_MODEL_CONFIG, validate_default=True)
+    
     industry: IndustryType = Field(
         ...,
         description="Industry or niche of the website"
     )
     
-    target_audience: str = Field(
+    target_audience: Annotated[str, StringConstraints(min_length=10, max_length=500)] = Field(
         ...,
-        description="Description of target audience",
-        min_length=10,
-        max_length=500
+        description="Description of target audience"
     )
     
-    main_topics: List[str] = Field(
+    main_topics: Annotated[List[str], Field(min_length=3, max_length=10)] = Field(
         ...,
-        description="Main topics to cover (3-10 topics)",
-        min_length=3,
-        max_length=10
+        description="Main topics to cover (3-10 topics)"
     )
     
     competitors: Optional[List[str]] = Field(
@@ -96,17 +130,23 @@ class StrategyRequest(BaseModel):
         description="Content language (ar, en, etc.)"
     )
     
-    duration_days: int = Field(
+    duration_days: Annotated[int, Field(ge=30, le=365)] = Field(
         default=90,
-        description="Strategy duration in days",
-        ge=30,
-        le=365
+        description="Strategy duration in days"
+    )
+    
+    batch_mode: bool = Field(
+        default=False,
+        description="Generate article ideas via the OpenAI Batch API (half price, "
+                    "up to 24h; only for /generate-async)"
     )
 
 
 class ArticleIdea(BaseModel):
     """Single article idea with metadata."""
     
+    model_config = _MODEL_CONFIG
+    
     title: str = Field(..., description="Article title")
     
     description: str = Field(..., description="Brief description")
@@ -123,12 +163,32 @@ class ArticleIdea(BaseModel):
     
     priority: int = Field(..., description="Priority score (1-10)")
     
-    suggested_publish_date: date = Field(..., description="Suggested publish date")
+    suggested_publish_date: date = Field(
+        default_factory=date.today,
+        description="Suggested publish date (assigned when the plan is scheduled)"
+    )
+
+
+class QuickIdea(BaseModel):
+    """Article idea as returned by the quick-ideas endpoint."""
+    
+    model_config = _MODEL_CONFIG
+    
+    title: str
+    description: str
+    content_type: ContentType
+    keywords: List[str]
+    estimated_word_count: int
+    difficulty: str
+    estimated_traffic: int
+    priority: int
 
 
 class WeeklyPlan(BaseModel):
     """Weekly content plan."""
     
+    model_config = _MODEL_CONFIG
+    
     week_number: int = Field(..., description="Week number (1-13 for 90 days)")
     
     start_date: date = Field(..., description="Week start date")
@@ -145,6 +205,8 @@ class WeeklyPlan(BaseModel):
 class TrafficProjection(BaseModel):
     """Traffic growth projection."""
     
+    model_config = _MODEL_CONFIG
+    
     month: int = Field(..., description="Month number (1-3 for 90 days)")
     
     estimated_traffic: int = Field(..., description="Estimated monthly traffic")
@@ -157,6 +219,8 @@ class TrafficProjection(BaseModel):
 class KeywordCluster(BaseModel):
     """Keyword cluster for topic organization."""
     
+    model_config = _MODEL_CONFIG
+    
     cluster_name: str = Field(..., description="Cluster name")
     
     main_keyword: str = Field(..., description="Main keyword")
@@ -170,12 +234,36 @@ class KeywordCluster(BaseModel):
     article_count: int = Field(..., description="Number of articles in this cluster")
 
 
+class StrategySummary(BaseModel):
+    """Headline numbers of a content strategy."""
+    
+    model_config = _MODEL_CONFIG
+    
+    duration_days: int = Field(..., description="Strategy duration")
+    
+    total_articles: int = Field(..., description="Total number of articles")
+    
+    total_words: int = Field(..., description="Estimated words across all articles")
+    
+    avg_words_per_article: int = Field(..., description="Average estimated word count")
+    
+    publishing_frequency: PublishingFrequency = Field(..., description="Publishing frequency")
+    
+    estimated_final_traffic: int = Field(..., description="Projected traffic in the last month")
+    
+    total_growth_percentage: float = Field(..., description="Growth in the last projected month")
+    
+    content_types: Dict[ContentType, int] = Field(..., description="Article count per content type")
+
+
 class ContentStrategy(BaseModel):
     """Complete content strategy response."""
     
+    model_config = _MODEL_CONFIG
+    
     strategy_id: str = Field(..., description="Unique strategy ID")
     
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
     
     industry: IndustryType = Field(..., description="Industry")
     
@@ -191,14 +279,110 @@ class ContentStrategy(BaseModel):
     
     traffic_projections: List[TrafficProjection] = Field(..., description="Traffic projections")
     
-    summary: Dict[str, Any] = Field(..., description="Strategy summary")
+    summary: StrategySummary = Field(..., description="Strategy summary")
     
     recommendations: List[str] = Field(..., description="Strategic recommendations")
 
 
+# ==============================================
+# Response payloads
+# ==============================================
+# A generated strategy carries ~90 article ideas; it is trusted internal
+# data, so it is assembled as plain dicts and serialized with orjson rather
+# than re-validated through the models above (which document its schema).
+
+class KeywordClusterDict(TypedDict):
+    """Keyword cluster as returned in a strategy payload."""
+    cluster_name: str
+    main_keyword: str
+    related_keywords: List[str]
+    search_volume: int
+    difficulty: str
+    article_count: int
+
+
+class ArticleIdeaDict(TypedDict):
+    """Article idea as returned in a strategy payload."""
+    title: str
+    description: str
+    content_type: str
+    keywords: List[str]
+    estimated_word_count: int
+    difficulty: str
+    estimated_traffic: int
+    priority: int
+    suggested_publish_date: date
+
+
+class WeeklyPlanDict(TypedDict):
+    """Weekly plan as returned in a strategy payload."""
+    week_number: int
+    start_date: date
+    end_date: date
+    articles: List[ArticleIdeaDict]
+    focus_topic: str
+    estimated_traffic: int
+
+
+class TrafficProjectionDict(TypedDict):
+    """Traffic projection as returned in a strategy payload."""
+    month: int
+    estimated_traffic: int
+    growth_percentage: float
+    new_articles: int
+
+
+class StrategySummaryDict(TypedDict):
+    """Strategy summary as returned in a strategy payload."""
+    duration_days: int
+    total_articles: int
+    total_words: int
+    avg_words_per_article: int
+    publishing_frequency: str
+    estimated_final_traffic: int
+    total_growth_percentage: float
+    content_types: Dict[str, int]
+
+
+class ContentStrategyDict(TypedDict):
+    """Complete content strategy payload (see ContentStrategy)."""
+    strategy_id: str
+    created_at: datetime
+    industry: str
+    target_audience: str
+    duration_days: int
+    total_articles: int
+    keyword_clusters: List[KeywordClusterDict]
+    weekly_plans: List[WeeklyPlanDict]
+    traffic_projections: List[TrafficProjectionDict]
+    summary: StrategySummaryDict
+    recommendations: List[str]
+
+
+class StrategyJob(BaseModel):
+    """Background strategy generation job."""
+    
+    # Updated in place by the background job runner, so not frozen
+    model_config = ConfigDict(use_enum_values=True, extra='ignore')
+    
+    job_id: str = Field(..., description="Unique job ID")
+    
+    status: JobStatus = Field(default=JobStatus.PENDING, description="Job status")
+    
+    status_url: str = Field(..., description="URL to poll for the job status")
+    
+    created_at: datetime = Field(default_factory=utcnow)
+    
+    result: Optional[ContentStrategyDict] = Field(None, description="Generated strategy once completed")
+    
+    error: Optional[str] = Field(None, description="Error code if the job failed")
+
+
 class StrategyAnalysis(BaseModel):
     """Analysis of existing content strategy."""
     
+    model_config = _MODEL_CONFIG
+    
     total_articles: int
     avg_word_count: int
     top_keywords: List[str]
@@ -4,27 +4,243 @@ Content Strategy Generator
 This module uses AI to generate comprehensive content strategies.
 """
 
-import json
+import asyncio
+from collections import Counter
+import hashlib
 import logging
-from typing import List, Dict, Any
-from datetime import datetime, timedelta, date
+from typing import Any, List, Optional, Tuple
+from datetime import timedelta, date
 import uuid
+import numpy as np
+import orjson
 from openai import AsyncOpenAI
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from typing_extensions import TypedDict
 
 from ..models.strategy import (
     StrategyRequest,
-    ContentStrategy,
+    ContentStrategyDict,
+    StrategySummaryDict,
     ArticleIdea,
-    WeeklyPlan,
-    TrafficProjection,
+    WeeklyPlanDict,
+    TrafficProjectionDict,
     KeywordCluster,
     ContentType,
-    PublishingFrequency
+    PublishingFrequency,
+    utcnow
 )
 
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent chat completions per generator, to stay clear
+# of OpenAI rate limits when cluster requests fan out
+_MAX_CONCURRENT_COMPLETIONS = 4
+
+# JSON mode: completions are guaranteed to be a single parseable JSON object
+# (no code fences or commentary), so lists are requested wrapped in one
+_JSON_OBJECT = {"type": "json_object"}
+
+# ==============================================
+# Prompts
+# ==============================================
+# Each system prompt holds the full static rubric and output format, so it
+# is byte-identical on every call and OpenAI can reuse the cached prefix;
+# the user message carries only the request-specific fields.
+
+_CLUSTERS_SYSTEM_PROMPT = """You are an expert SEO strategist. Generate keyword clusters for a content strategy.
+
+You will be given the industry, target audience, main topics and language.
+
+Generate 5-8 keyword clusters. For each cluster:
+1. Choose a main keyword with good search volume
+2. Find 5-10 related long-tail keywords
+3. Estimate monthly search volume
+4. Assess SEO difficulty (easy/medium/hard)
+5. Suggest number of articles for this cluster
+
+Return a JSON object with this structure:
+{
+  "clusters": [
+    {
+      "cluster_name": "Cluster Name",
+      "main_keyword": "main keyword",
+      "related_keywords": ["keyword 1", "keyword 2", ...],
+      "search_volume": 10000,
+      "difficulty": "medium",
+      "article_count": 12
+    }
+  ]
+}
+"""
+
+_ARTICLES_SYSTEM_PROMPT = """You are an expert content strategist. Generate article ideas for a keyword cluster.
+
+You will be given the number of articles, the cluster, its main and related keywords, the industry, target audience and language.
+
+For each article, provide:
+1. Compelling, SEO-optimized title
+2. Brief description (2-3 sentences)
+3. Content type (blog_post, tutorial, guide, listicle, case_study, review, news, opinion)
+4. Target keywords (3-5)
+5. Estimated word count (800-3000)
+6. SEO difficulty (easy/medium/hard)
+7. Estimated monthly traffic potential
+8. Priority score (1-10, based on traffic potential and difficulty)
+
+Return a JSON object with this structure:
+{
+  "articles": [
+    {
+      "title": "Article Title",
+      "description": "Brief description",
+      "content_type": "blog_post",
+      "keywords": ["keyword1", "keyword2"],
+      "estimated_word_count": 1500,
+      "difficulty": "medium",
+      "estimated_traffic": 500,
+      "priority": 8
+    }
+  ]
+}
+"""
+
+_RECS_SYSTEM_PROMPT = """You are an expert content strategist. Based on a content strategy, provide 5-7 actionable recommendations.
+
+You will be given the industry, target audience, main topics, publishing frequency and number of keyword clusters.
+
+Provide specific, actionable recommendations for:
+1. Content optimization
+2. SEO best practices
+3. Audience engagement
+4. Distribution channels
+5. Performance tracking
+
+Return a JSON object with this structure:
+{"recommendations": ["Recommendation 1", "Recommendation 2", ...]}
+"""
+
+# Clusters and recommendations in one completion: both depend only on the
+# request, so they share the context instead of paying for two round-trips
+_PLAN_SYSTEM_PROMPT = """You are an expert SEO and content strategist. Plan a content strategy.
+
+You will be given the industry, target audience, main topics, publishing frequency and language.
+
+First, generate 5-8 keyword clusters. For each cluster:
+1. Choose a main keyword with good search volume
+2. Find 5-10 related long-tail keywords
+3. Estimate monthly search volume
+4. Assess SEO difficulty (easy/medium/hard)
+5. Suggest number of articles for this cluster
+
+Then, based on those clusters, provide 5-7 specific, actionable recommendations for:
+1. Content optimization
+2. SEO best practices
+3. Audience engagement
+4. Distribution channels
+5. Performance tracking
+
+Return a JSON object with this structure:
+{
+  "clusters": [
+    {
+      "cluster_name": "Cluster Name",
+      "main_keyword": "main keyword",
+      "related_keywords": ["keyword 1", "keyword 2", ...],
+      "search_volume": 10000,
+      "difficulty": "medium",
+      "article_count": 12
+    }
+  ],
+  "recommendations": ["Recommendation 1", "Recommendation 2", ...]
+}
+"""
+
+# User message templates: only the request-specific fields are filled in
+_CLUSTERS_USER_TEMPLATE = """Industry: {industry}
+Target Audience: {audience}
+Main Topics: {topics}
+Language: {language}
+"""
+
+_ARTICLES_USER_TEMPLATE = """Number of Articles: {count}
+Cluster: {name}
+Main Keyword: {main_keyword}
+Related Keywords: {related}
+Industry: {industry}
+Target Audience: {audience}
+Language: {language}
+"""
+
+_RECS_USER_TEMPLATE = """Industry: {industry}
+Target Audience: {audience}
+Main Topics: {topics}
+Publishing Frequency: {frequency}
+Keyword Clusters: {cluster_count}
+"""
+
+_PLAN_USER_TEMPLATE = """Industry: {industry}
+Target Audience: {audience}
+Main Topics: {topics}
+Publishing Frequency: {frequency}
+Language: {language}
+"""
+
+
+def _cluster_articles_prompt(
+    request: StrategyRequest,
+    cluster: KeywordCluster,
+    count: int
+) -> str:
+    """User message asking for `count` article ideas for one cluster."""
+    return _ARTICLES_USER_TEMPLATE.format(
+        count=count,
+        name=cluster.cluster_name,
+        main_keyword=cluster.main_keyword,
+        related=', '.join(cluster.related_keywords[:5]),
+        industry=request.industry,
+        audience=request.target_audience,
+        language=request.language
+    )
+
+
+# Batch API polling (article ideas for background jobs)
+_BATCH_POLL_INTERVAL = 60  # seconds
+_BATCH_FINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Completion cache: keyed by the exact request sent to the model. Bump the
+# version whenever prompts change in ways that should invalidate old entries.
+_COMPLETION_CACHE_PREFIX = "llm:"
+_COMPLETION_CACHE_VERSION = 3
+_COMPLETION_CACHE_TTL = 30 * 86400  # seconds
+
+
+class _ClustersPayload(TypedDict):
+    clusters: List[KeywordCluster]
+
+
+class _ArticlesPayload(TypedDict):
+    articles: List[ArticleIdea]
+
+
+class _RecommendationsPayload(TypedDict):
+    recommendations: List[str]
+
+
+class _PlanPayload(TypedDict):
+    clusters: List[KeywordCluster]
+    recommendations: List[str]
+
+
+# Completions are parsed and validated in one pass straight from the raw
+# JSON text (Rust parser), instead of json.loads + per-item construction
+_CLUSTERS_ADAPTER = TypeAdapter(_ClustersPayload)
+_ARTICLES_ADAPTER = TypeAdapter(_ArticlesPayload)
+_RECS_ADAPTER = TypeAdapter(_RecommendationsPayload)
+_PLAN_ADAPTER = TypeAdapter(_PlanPayload)
+
 
 class StrategyGenerator:
     """
@@ -34,30 +250,127 @@ class StrategyGenerator:
     content strategies with keyword research and traffic projections.
     """
     
-    def __init__(self, openai_api_key: str):
+    def __init__(
+        self,
+        openai_api_key: str,
+        client: Optional[AsyncOpenAI] = None,
+        cache: Optional[Redis] = None,
+        fused_plan: bool = True
+    ):
         """
         Initialize strategy generator.
         
         Args:
             openai_api_key: OpenAI API key
+            client: Shared OpenAI client (one is created if omitted)
+            cache: Redis client for caching completions (None disables it)
+            fused_plan: Request clusters and recommendations in a single
+                completion (False restores the separate calls)
         """
-        self.client = AsyncOpenAI(api_key=openai_api_key)
+        self.client = client or AsyncOpenAI(api_key=openai_api_key)
+        self.cache = cache
+        self.fused_plan = fused_plan
+        self._completions_sem = asyncio.Semaphore(_MAX_CONCURRENT_COMPLETIONS)
         self.model = "gpt-4-turbo-preview"
     
-    async def generate_strategy(self, request: StrategyRequest) -> ContentStrategy:
+    async def _complete(
+        self,
+        system: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        adapter: TypeAdapter
+    ) -> Any:
+        """
+        Run a JSON-mode chat completion, served from the cache when possible.
+        
+        Popular industries and topics recur across users, so identical
+        requests (same model, messages and sampling settings) reuse the
+        stored completion instead of paying for another round-trip. Only
+        completions that validate against `adapter` are cached.
+        
+        Args:
+            system: System message
+            prompt: User message
+            temperature: Sampling temperature
+            max_tokens: Completion token limit
+            adapter: TypeAdapter the completion JSON must validate against
+            
+        Returns:
+            Validated completion payload
+            
+        Raises:
+            ValueError: If the completion stopped before finishing or
+                failed validation
+        """
+        messages = [
+            {"role": "system", "content": system},
+            {"role": "user", "content": prompt}
+        ]
+        
+        key = None
+        if self.cache is not None:
+            key = _COMPLETION_CACHE_PREFIX + hashlib.sha256(orjson.dumps({
+                "v": _COMPLETION_CACHE_VERSION,
+                "model": self.model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens
+            })).hexdigest()
+            try:
+                cached = await self.cache.get(key)
+            except RedisError as e:
+                logger.warning("Completion cache read failed: %r", e)
+                cached = None
+            if cached is not None:
+                try:
+                    return adapter.validate_json(cached)
+                except ValueError as e:
+                    logger.warning("Ignoring invalid cached completion: %r", e)
+        
+        async with self._completions_sem:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format=_JSON_OBJECT
+            )
+        
+        # A completion cut off by max_tokens is truncated JSON: fail here so
+        # callers fall back and the broken text never reaches the cache
+        choice = response.choices[0]
+        if choice.finish_reason != "stop":
+            raise ValueError(f"Completion did not finish (finish_reason={choice.finish_reason})")
+        
+        content = choice.message.content
+        payload = adapter.validate_json(content)
+        
+        if key is not None:
+            try:
+                await self.cache.set(key, content, ex=_COMPLETION_CACHE_TTL)
+            except RedisError as e:
+                logger.warning("Completion cache write failed: %r", e)
+        
+        return payload
+    
+    async def generate_strategy(self, request: StrategyRequest) -> ContentStrategyDict:
         """
         Generate complete content strategy.
         
+        AI output (clusters, article ideas) is validated through the models;
+        the assembled strategy itself is returned as a plain dict.
+        
         Args:
             request: Strategy request parameters
             
         Returns:
-            Complete content strategy
+            Complete content strategy payload
         """
         logger.info(f"Generating content strategy for {request.industry}")
         
-        # Step 1: Generate keyword clusters
-        keyword_clusters = await self._generate_keyword_clusters(request)
+        # Step 1: Generate keyword clusters (and recommendations with them)
+        keyword_clusters, recommendations = await self._generate_plan(request)
         
         # Step 2: Generate article ideas
         article_ideas = await self._generate_article_ideas(request, keyword_clusters)
@@ -68,87 +381,97 @@ class StrategyGenerator:
         # Step 4: Project traffic growth
         traffic_projections = self._project_traffic(request, len(article_ideas))
         
-        # Step 5: Generate recommendations
-        recommendations = await self._generate_recommendations(request, keyword_clusters)
-        
         # Create strategy
-        strategy = ContentStrategy(
-            strategy_id=str(uuid.uuid4()),
-            created_at=datetime.utcnow(),
-            industry=request.industry,
-            target_audience=request.target_audience,
-            duration_days=request.duration_days,
-            total_articles=len(article_ideas),
-            keyword_clusters=keyword_clusters,
-            weekly_plans=weekly_plans,
-            traffic_projections=traffic_projections,
-            summary=self._create_summary(request, article_ideas, traffic_projections),
-            recommendations=recommendations
-        )
+        strategy: ContentStrategyDict = {
+            "strategy_id": str(uuid.uuid4()),
+            "created_at": utcnow(),
+            "industry": request.industry,
+            "target_audience": request.target_audience,
+            "duration_days": request.duration_days,
+            "total_articles": len(article_ideas),
+            "keyword_clusters": [cluster.model_dump() for cluster in keyword_clusters],
+            "weekly_plans": weekly_plans,
+            "traffic_projections": traffic_projections,
+            "summary": self._create_summary(request, article_ideas, traffic_projections),
+            "recommendations": recommendations
+        }
         
-        logger.info(f"Strategy generated: {strategy.total_articles} articles planned")
+        logger.info(f"Strategy generated: {strategy['total_articles']} articles planned")
         
         return strategy
     
+    async def _generate_plan(
+        self,
+        request: StrategyRequest
+    ) -> Tuple[List[KeywordCluster], List[str]]:
+        """
+        Generate keyword clusters and strategic recommendations.
+        
+        Both come from one completion when fused_plan is set. Article ideas
+        stay per-cluster: a full strategy's worth of ideas would not fit in
+        a single completion's output budget. If the fused call fails or
+        yields no clusters, the separate calls are used instead.
+        
+        Args:
+            request: Strategy request parameters
+            
+        Returns:
+            (keyword clusters, recommendations)
+        """
+        if self.fused_plan:
+            prompt = _PLAN_USER_TEMPLATE.format(
+                industry=request.industry,
+                audience=request.target_audience,
+                topics=', '.join(request.main_topics),
+                frequency=request.publishing_frequency,
+                language=request.language
+            )
+            
+            try:
+                plan = await self._complete(
+                    system=_PLAN_SYSTEM_PROMPT,
+                    prompt=prompt,
+                    temperature=0.7,
+                    max_tokens=3000,
+                    adapter=_PLAN_ADAPTER
+                )
+                
+                if plan["clusters"]:
+                    return plan["clusters"], plan["recommendations"]
+                
+                logger.warning("Fused strategy plan returned no clusters, falling back")
+                
+            except Exception as e:
+                logger.warning(f"Error generating fused strategy plan, falling back: {e}")
+        
+        keyword_clusters = await self._generate_keyword_clusters(request)
+        recommendations = await self._generate_recommendations(request, keyword_clusters)
+        
+        return keyword_clusters, recommendations
+    
     async def _generate_keyword_clusters(
         self,
         request: StrategyRequest
     ) -> List[KeywordCluster]:
         """Generate keyword clusters for the strategy."""
         
-        prompt = f"""
-You are an expert SEO strategist. Generate keyword clusters for a content strategy.
-
-Industry: {request.industry.value}
-Target Audience: {request.target_audience}
-Main Topics: {', '.join(request.main_topics)}
-Language: {request.language}
-
-Generate 5-8 keyword clusters. For each cluster:
-1. Choose a main keyword with good search volume
-2. Find 5-10 related long-tail keywords
-3. Estimate monthly search volume
-4. Assess SEO difficulty (easy/medium/hard)
-5. Suggest number of articles for this cluster
-
-Return ONLY a valid JSON array of clusters with this structure:
-[
-  {{
-    "cluster_name": "Cluster Name",
-    "main_keyword": "main keyword",
-    "related_keywords": ["keyword 1", "keyword 2", ...],
-    "search_volume": 10000,
-    "difficulty": "medium",
-    "article_count": 12
-  }}
-]
-"""
+        prompt = _CLUSTERS_USER_TEMPLATE.format(
+            industry=request.industry,
+            audience=request.target_audience,
+            topics=', '.join(request.main_topics),
+            language=request.language
+        )
         
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert SEO strategist."},
-                    {"role": "user", "content": prompt}
-                ],
+            payload = await self._complete(
+                system=_CLUSTERS_SYSTEM_PROMPT,
+                prompt=prompt,
                 temperature=0.7,
-                max_tokens=2000
+                max_tokens=2000,
+                adapter=_CLUSTERS_ADAPTER
             )
             
-            content = response.choices[0].message.content.strip()
-            
-            # Extract JSON from response
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-            
-            clusters_data = json.loads(content)
-            
-            # Convert to KeywordCluster objects
-            clusters = [KeywordCluster(**cluster) for cluster in clusters_data]
-            
-            return clusters
+            return payload["clusters"]
             
         except Exception as e:
             logger.error(f"Error generating keyword clusters: {e}")
@@ -172,45 +495,63 @@ Return ONLY a valid JSON array of clusters with this structure:
     ) -> List[ArticleIdea]:
         """Generate article ideas based on keyword clusters."""
         
-        # Calculate total articles needed
+        # Calculate total articles needed (keyed by value: the request
+        # stores enum fields as plain strings)
         frequency_map = {
-            PublishingFrequency.DAILY: 1,
-            PublishingFrequency.EVERY_OTHER_DAY: 2,
-            PublishingFrequency.THREE_TIMES_WEEK: 2.33,
-            PublishingFrequency.TWICE_WEEK: 3.5,
-            PublishingFrequency.WEEKLY: 7
+            PublishingFrequency.DAILY.value: 1,
+            PublishingFrequency.EVERY_OTHER_DAY.value: 2,
+            PublishingFrequency.THREE_TIMES_WEEK.value: 2.33,
+            PublishingFrequency.TWICE_WEEK.value: 3.5,
+            PublishingFrequency.WEEKLY.value: 7
         }
         
         days_between_posts = frequency_map[request.publishing_frequency]
         total_articles = int(request.duration_days / days_between_posts)
         
-        # Generate article ideas for each cluster
-        all_articles = []
+        # Split the article budget across clusters up front, then generate
+        # every cluster's ideas concurrently
+        plan = []
+        remaining = total_articles
         
         for cluster in keyword_clusters:
-            articles_for_cluster = min(cluster.article_count, total_articles - len(all_articles))
+            articles_for_cluster = min(cluster.article_count, remaining)
             
             if articles_for_cluster <= 0:
                 break
             
-            cluster_articles = await self._generate_cluster_articles(
-                request,
-                cluster,
-                articles_for_cluster
+            plan.append((cluster, articles_for_cluster))
+            remaining -= articles_for_cluster
+        
+        if request.batch_mode:
+            results = await self._generate_articles_batch(request, plan)
+        else:
+            results = await asyncio.gather(
+                *(self._generate_cluster_articles(request, cluster, count) for cluster, count in plan),
+                return_exceptions=True
             )
-            
-            all_articles.extend(cluster_articles)
+        
+        all_articles = []
+        for (cluster, _), result in zip(plan, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error generating articles for cluster {cluster.cluster_name}: {result}")
+                continue
+            all_articles.extend(result)
         
         # Sort by priority
         all_articles.sort(key=lambda x: x.priority, reverse=True)
         
-        # Assign publish dates
-        start_date = date.today()
-        for i, article in enumerate(all_articles):
-            days_offset = int(i * days_between_posts)
-            article.suggested_publish_date = start_date + timedelta(days=days_offset)
-        
-        return all_articles[:total_articles]
+        # Assign publish dates in one vectorized step: day offsets are
+        # truncated like int(i * days_between_posts), and tolist() on a
+        # datetime64[D] array yields datetime.date objects. Ideas are
+        # frozen, so each is copied with its date set.
+        articles = all_articles[:total_articles]
+        offsets = (np.arange(len(articles)) * days_between_posts).astype(np.int64)
+        publish_dates = (np.datetime64(date.today(), 'D') + offsets).tolist()
+        
+        return [
+            article.model_copy(update={"suggested_publish_date": publish_date})
+            for article, publish_date in zip(articles, publish_dates)
+        ]
     
     async def _generate_cluster_articles(
         self,
@@ -220,79 +561,101 @@ Return ONLY a valid JSON array of clusters with this structure:
     ) -> List[ArticleIdea]:
         """Generate article ideas for a specific cluster."""
         
-        prompt = f"""
-Generate {count} article ideas for this keyword cluster:
-
-Cluster: {cluster.cluster_name}
-Main Keyword: {cluster.main_keyword}
-Related Keywords: {', '.join(cluster.related_keywords[:5])}
-Industry: {request.industry.value}
-Target Audience: {request.target_audience}
-Language: {request.language}
-
-For each article, provide:
-1. Compelling, SEO-optimized title
-2. Brief description (2-3 sentences)
-3. Content type (blog_post, tutorial, guide, listicle, case_study, review, news, opinion)
-4. Target keywords (3-5)
-5. Estimated word count (800-3000)
-6. SEO difficulty (easy/medium/hard)
-7. Estimated monthly traffic potential
-8. Priority score (1-10, based on traffic potential and difficulty)
-
-Return ONLY a valid JSON array:
-[
-  {{
-    "title": "Article Title",
-    "description": "Brief description",
-    "content_type": "blog_post",
-    "keywords": ["keyword1", "keyword2"],
-    "estimated_word_count": 1500,
-    "difficulty": "medium",
-    "estimated_traffic": 500,
-    "priority": 8
-  }}
-]
-"""
+        prompt = _cluster_articles_prompt(request, cluster, count)
         
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert content strategist."},
-                    {"role": "user", "content": prompt}
-                ],
+            payload = await self._complete(
+                system=_ARTICLES_SYSTEM_PROMPT,
+                prompt=prompt,
                 temperature=0.8,
-                max_tokens=2000
+                max_tokens=2000,
+                adapter=_ARTICLES_ADAPTER
             )
             
-            content = response.choices[0].message.content.strip()
-            
-            # Extract JSON
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-            
-            articles_data = json.loads(content)
-            
-            # Convert to ArticleIdea objects
-            articles = []
-            for article_data in articles_data:
-                article_data["suggested_publish_date"] = date.today()  # Temporary, will be updated
-                articles.append(ArticleIdea(**article_data))
-            
-            return articles
+            # suggested_publish_date defaults to today until scheduled
+            return payload["articles"]
             
         except Exception as e:
             logger.error(f"Error generating cluster articles: {e}")
             return []
     
+    async def _generate_articles_batch(
+        self,
+        request: StrategyRequest,
+        plan: List[Tuple[KeywordCluster, int]]
+    ) -> List[List[ArticleIdea]]:
+        """
+        Generate every cluster's article ideas through the OpenAI Batch API.
+        
+        Batch requests are billed at half the interactive price and draw on
+        a separate rate-limit pool, but may take up to 24 hours, so this is
+        only used for background strategy jobs.
+        
+        Args:
+            request: Strategy request parameters
+            plan: (cluster, article count) pairs
+            
+        Returns:
+            Article ideas per cluster, in plan order (empty where a cluster
+            failed)
+        """
+        # custom_id is the plan index: cluster names aren't guaranteed unique
+        lines = [
+            orjson.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "system", "content": _ARTICLES_SYSTEM_PROMPT},
+                        {"role": "user", "content": _cluster_articles_prompt(request, cluster, count)}
+                    ],
+                    "temperature": 0.8,
+                    "max_tokens": 2000,
+                    "response_format": _JSON_OBJECT
+                }
+            })
+            for index, (cluster, count) in enumerate(plan)
+        ]
+        
+        batch_file = await self.client.files.create(
+            file=("article_ideas.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Submitted article ideas batch {batch.id} ({len(plan)} clusters)")
+        
+        while batch.status not in _BATCH_FINAL_STATUSES:
+            await asyncio.sleep(_BATCH_POLL_INTERVAL)
+            batch = await self.client.batches.retrieve(batch.id)
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Article ideas batch {batch.id} ended as {batch.status}")
+        
+        output = await self.client.files.content(batch.output_file_id)
+        
+        results: List[List[ArticleIdea]] = [[] for _ in plan]
+        for line in output.content.splitlines():
+            record = orjson.loads(line)
+            index = int(record["custom_id"])
+            try:
+                content = record["response"]["body"]["choices"][0]["message"]["content"]
+                results[index] = _ARTICLES_ADAPTER.validate_json(content)["articles"]
+            except Exception as e:
+                logger.error(f"Error parsing batch articles for cluster {plan[index][0].cluster_name}: {e}")
+        
+        return results
+    
     def _create_weekly_plans(
         self,
         articles: List[ArticleIdea],
         request: StrategyRequest
-    ) -> List[WeeklyPlan]:
+    ) -> List[WeeklyPlanDict]:
         """Create weekly content plans."""
         
         weeks = []
@@ -312,23 +675,23 @@ Return ONLY a valid JSON array:
             week_end = week_start + timedelta(days=6)
             week_articles = articles_by_week[week_num]
             
-            # Determine focus topic (most common keyword)
-            all_keywords = []
-            for article in week_articles:
-                all_keywords.extend(article.keywords)
-            focus_topic = max(set(all_keywords), key=all_keywords.count) if all_keywords else "General"
+            # Determine focus topic (most common keyword, single counting pass)
+            keyword_counts = Counter(
+                keyword for article in week_articles for keyword in article.keywords
+            )
+            focus_topic = keyword_counts.most_common(1)[0][0] if keyword_counts else "General"
             
             # Calculate estimated traffic
             estimated_traffic = sum(article.estimated_traffic for article in week_articles)
             
-            weeks.append(WeeklyPlan(
-                week_number=week_num,
-                start_date=week_start,
-                end_date=week_end,
-                articles=week_articles,
-                focus_topic=focus_topic,
-                estimated_traffic=estimated_traffic
-            ))
+            weeks.append({
+                "week_number": week_num,
+                "start_date": week_start,
+                "end_date": week_end,
+                "articles": [article.model_dump() for article in week_articles],
+                "focus_topic": focus_topic,
+                "estimated_traffic": estimated_traffic
+            })
         
         return weeks
     
@@ -336,42 +699,43 @@ Return ONLY a valid JSON array:
         self,
         request: StrategyRequest,
         total_articles: int
-    ) -> List[TrafficProjection]:
+    ) -> List[TrafficProjectionDict]:
         """Project traffic growth over time."""
         
         current_traffic = request.current_traffic or 100
         months = request.duration_days // 30
         
-        projections = []
-        
-        for month in range(1, months + 1):
-            # Calculate articles in this month
-            articles_per_month = total_articles // months
-            
-            # Estimate traffic growth (compound growth)
-            # Assume each article brings 200-500 visitors/month after 30 days
-            avg_traffic_per_article = 350
-            new_traffic = articles_per_month * avg_traffic_per_article
-            
-            # Add cumulative effect (older articles gain more traffic)
-            cumulative_boost = (month - 1) * 0.2  # 20% boost per month
-            estimated_traffic = int(current_traffic + new_traffic * (1 + cumulative_boost))
-            
-            # Calculate growth percentage
-            if month == 1:
-                growth_percentage = (estimated_traffic - current_traffic) / current_traffic * 100
-            else:
-                prev_traffic = projections[-1].estimated_traffic
-                growth_percentage = (estimated_traffic - prev_traffic) / prev_traffic * 100
-            
-            projections.append(TrafficProjection(
-                month=month,
-                estimated_traffic=estimated_traffic,
-                growth_percentage=round(growth_percentage, 2),
-                new_articles=articles_per_month
-            ))
-            
-            current_traffic = estimated_traffic
+        # Articles published each month
+        articles_per_month = total_articles // months
+        
+        # Assume each article brings 200-500 visitors/month after 30 days
+        avg_traffic_per_article = 350
+        new_traffic = articles_per_month * avg_traffic_per_article
+        
+        # Each month adds the new articles' traffic with a cumulative 20%
+        # boost per month (older articles gain more traffic). Every month
+        # builds on the previous total with whole visitors, so the totals
+        # are the base plus a running sum of the truncated increments
+        # (rounded first so e.g. 700 * 1.4 counts as 980, not 979).
+        month_numbers = np.arange(1, months + 1)
+        increments = np.floor(
+            np.round(new_traffic * (1 + (month_numbers - 1) * 0.2), 6)
+        ).astype(np.int64)
+        estimated = current_traffic + np.cumsum(increments)
+        previous = np.concatenate(([current_traffic], estimated[:-1]))
+        growth = (estimated - previous) / previous * 100
+        
+        projections: List[TrafficProjectionDict] = [
+            {
+                "month": month,
+                "estimated_traffic": traffic,
+                "growth_percentage": round(growth_percentage, 2),
+                "new_articles": articles_per_month
+            }
+            for month, traffic, growth_percentage in zip(
+                month_numbers.tolist(), estimated.tolist(), growth.tolist()
+            )
+        ]
         
         return projections
     
@@ -382,48 +746,24 @@ Return ONLY a valid JSON array:
     ) -> List[str]:
         """Generate strategic recommendations."""
         
-        prompt = f"""
-Based on this content strategy, provide 5-7 actionable recommendations:
-
-Industry: {request.industry.value}
-Target Audience: {request.target_audience}
-Main Topics: {', '.join(request.main_topics)}
-Publishing Frequency: {request.publishing_frequency.value}
-Keyword Clusters: {len(keyword_clusters)}
-
-Provide specific, actionable recommendations for:
-1. Content optimization
-2. SEO best practices
-3. Audience engagement
-4. Distribution channels
-5. Performance tracking
-
-Return ONLY a JSON array of strings:
-["Recommendation 1", "Recommendation 2", ...]
-"""
+        prompt = _RECS_USER_TEMPLATE.format(
+            industry=request.industry,
+            audience=request.target_audience,
+            topics=', '.join(request.main_topics),
+            frequency=request.publishing_frequency,
+            cluster_count=len(keyword_clusters)
+        )
         
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert content strategist."},
-                    {"role": "user", "content": prompt}
-                ],
+            payload = await self._complete(
+                system=_RECS_SYSTEM_PROMPT,
+                prompt=prompt,
                 temperature=0.7,
-                max_tokens=1000
+                max_tokens=1000,
+                adapter=_RECS_ADAPTER
             )
             
-            content = response.choices[0].message.content.strip()
-            
-            # Extract JSON
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-            
-            recommendations = json.loads(content)
-            
-            return recommendations
+            return payload["recommendations"]
             
         except Exception as e:
             logger.error(f"Error generating recommendations: {e}")
@@ -439,26 +779,29 @@ Return ONLY a JSON array of strings:
         self,
         request: StrategyRequest,
         articles: List[ArticleIdea],
-        projections: List[TrafficProjection]
-    ) -> Dict[str, Any]:
+        projections: List[TrafficProjectionDict]
+    ) -> StrategySummaryDict:
         """Create strategy summary."""
         
         total_words = sum(article.estimated_word_count for article in articles)
         avg_words = total_words // len(articles) if articles else 0
         
-        final_traffic = projections[-1].estimated_traffic if projections else 0
-        total_growth = projections[-1].growth_percentage if projections else 0
+        final_traffic = projections[-1]["estimated_traffic"] if projections else 0
+        total_growth = projections[-1]["growth_percentage"] if projections else 0.0
+        
+        # One counting pass; every content type is still reported
+        type_counts = Counter(article.content_type for article in articles)
         
         return {
             "duration_days": request.duration_days,
             "total_articles": len(articles),
             "total_words": total_words,
             "avg_words_per_article": avg_words,
-            "publishing_frequency": request.publishing_frequency.value,
+            "publishing_frequency": request.publishing_frequency,
             "estimated_final_traffic": final_traffic,
             "total_growth_percentage": total_growth,
             "content_types": {
-                content_type.value: len([a for a in articles if a.content_type == content_type])
+                content_type.value: type_counts[content_type.value]
                 for content_type in ContentType
             }
         }
@@ -5,11 +5,62 @@ This module provides JWT token generation and validation for API authentication.
 Uses industry-standard practices for secure token management.
 """
 
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, Tuple
 import jwt
 from jwt.exceptions import InvalidTokenError
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
+from cryptography.hazmat.primitives.serialization import load_pem_private_key, load_pem_public_key
 import os
+import threading
+import time
+
+
+# Verified tokens are remembered briefly so a chatty client doesn't pay for
+# signature verification on every request
+_VERIFY_CACHE_SIZE = 10_000
+_VERIFY_CACHE_TTL = 60  # seconds; never past the token's own exp
+
+_PLACEHOLDER_SECRET = "CHANGE_THIS_TO_RANDOM_SECRET_KEY_IN_PRODUCTION"
+
+
+def _load_ed25519_keys(
+    private_key: Optional[str],
+    public_key: Optional[str]
+) -> Tuple[Optional[Ed25519PrivateKey], Ed25519PublicKey]:
+    """
+    Load an Ed25519 key pair from PEM strings.
+    
+    Args:
+        private_key: PEM private key (None for verify-only services)
+        public_key: PEM public key (derived from the private key if None)
+        
+    Returns:
+        (signing key or None, verifying key)
+        
+    Raises:
+        ValueError: If neither key is given or a key is not Ed25519
+    """
+    signing_key = None
+    if private_key:
+        signing_key = load_pem_private_key(private_key.encode(), password=None)
+        if not isinstance(signing_key, Ed25519PrivateKey):
+            raise ValueError("JWT_PRIVATE_KEY must be an Ed25519 private key")
+    
+    if public_key:
+        verifying_key = load_pem_public_key(public_key.encode())
+        if not isinstance(verifying_key, Ed25519PublicKey):
+            raise ValueError("JWT_PUBLIC_KEY must be an Ed25519 public key")
+    elif signing_key is not None:
+        verifying_key = signing_key.public_key()
+    else:
+        raise ValueError(
+            "JWT_PRIVATE_KEY or JWT_PUBLIC_KEY must be set for EdDSA. "
+            "Generate a key with: openssl genpkey -algorithm ed25519"
+        )
+    
+    return signing_key, verifying_key
 
 
 class JWTHandler:
@@ -17,31 +68,58 @@ class JWTHandler:
     Handles JWT token creation and validation.
     
     This class implements secure JWT authentication following OWASP guidelines.
+    
+    Tokens are signed with Ed25519 (EdDSA) when a key pair is configured:
+    only the issuing service needs the private key, every other service
+    verifies with the public key. Without one, the shared HS256 secret is
+    used as before.
     """
     
     def __init__(
         self,
         secret_key: Optional[str] = None,
-        algorithm: str = "HS256",
-        access_token_expire_minutes: int = 30
+        algorithm: Optional[str] = None,
+        access_token_expire_minutes: int = 30,
+        private_key: Optional[str] = None,
+        public_key: Optional[str] = None
     ):
         """
         Initialize JWT handler.
         
         Args:
-            secret_key: Secret key for signing tokens (from environment)
-            algorithm: JWT signing algorithm (default: HS256)
+            secret_key: Secret key for HS256 tokens (from environment)
+            algorithm: JWT signing algorithm (default: EdDSA if a key pair
+                is configured, otherwise HS256)
             access_token_expire_minutes: Token expiration time in minutes
+            private_key: Ed25519 PEM private key (from environment)
+            public_key: Ed25519 PEM public key (from environment)
         """
+        private_key = private_key or os.getenv("JWT_PRIVATE_KEY")
+        public_key = public_key or os.getenv("JWT_PUBLIC_KEY")
+        
         self.secret_key = secret_key or os.getenv("JWT_SECRET_KEY")
-        if not self.secret_key or self.secret_key == "CHANGE_THIS_TO_RANDOM_SECRET_KEY_IN_PRODUCTION":
-            raise ValueError(
-                "JWT_SECRET_KEY must be set in environment variables. "
-                "Generate one with: openssl rand -hex 32"
-            )
+        if self.secret_key == _PLACEHOLDER_SECRET:
+            self.secret_key = None
+        
+        self.algorithm = algorithm or ("EdDSA" if private_key or public_key else "HS256")
+        
+        if self.algorithm == "EdDSA":
+            # The HS256 secret, if still set, only verifies tokens issued
+            # before the switch (e.g. year-long API keys)
+            self.signing_key, self.verifying_key = _load_ed25519_keys(private_key, public_key)
+        else:
+            if not self.secret_key:
+                raise ValueError(
+                    "JWT_SECRET_KEY must be set in environment variables. "
+                    "Generate one with: openssl rand -hex 32"
+                )
+            self.signing_key = self.verifying_key = self.secret_key
         
-        self.algorithm = algorithm
         self.access_token_expire_minutes = access_token_expire_minutes
+        
+        # token -> (cache expiry as time.time(), payload), oldest first
+        self._verified: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._verified_lock = threading.Lock()
     
     def create_access_token(
         self,
@@ -57,26 +135,35 @@ class JWTHandler:
             
         Returns:
             Encoded JWT token string
+            
+        Raises:
+            ValueError: If the handler is verify-only (no private key)
         """
+        if self.signing_key is None:
+            raise ValueError("JWT_PRIVATE_KEY must be set to issue tokens")
+        
         to_encode = data.copy()
         
+        # One clock read for both claims, so exp - iat is exactly the lifetime
+        now = datetime.now(timezone.utc)
+        
         # Set expiration time
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = now + expires_delta
         else:
-            expire = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
+            expire = now + timedelta(minutes=self.access_token_expire_minutes)
         
         # Add standard claims
         to_encode.update({
             "exp": expire,
-            "iat": datetime.utcnow(),
+            "iat": now,
             "type": "access"
         })
         
         # Encode token
         encoded_jwt = jwt.encode(
             to_encode,
-            self.secret_key,
+            self.signing_key,
             algorithm=self.algorithm
         )
         
@@ -86,6 +173,9 @@ class JWTHandler:
         """
         Verify and decode a JWT token.
         
+        Successfully verified tokens are cached for up to a minute (never
+        past their exp claim), so repeat requests skip signature checks.
+        
         Args:
             token: JWT token string to verify
             
@@ -95,15 +185,43 @@ class JWTHandler:
         Raises:
             InvalidTokenError: If token is invalid or expired
         """
+        now = time.time()
+        
+        with self._verified_lock:
+            cached = self._verified.get(token)
+            if cached is not None:
+                if cached[0] > now:
+                    self._verified.move_to_end(token)
+                    return cached[1]
+                del self._verified[token]
+        
+        key, algorithm = self.verifying_key, self.algorithm
+        
         try:
+            if (
+                algorithm == "EdDSA"
+                and self.secret_key
+                and jwt.get_unverified_header(token).get("alg") == "HS256"
+            ):
+                key, algorithm = self.secret_key, "HS256"
+            
             payload = jwt.decode(
                 token,
-                self.secret_key,
-                algorithms=[self.algorithm]
+                key,
+                algorithms=[algorithm]
             )
-            return payload
         except InvalidTokenError as e:
             raise InvalidTokenError(f"Token validation failed: {str(e)}")
+        
+        # Only valid tokens are cached, and never beyond their expiry
+        expires_at = min(now + _VERIFY_CACHE_TTL, payload.get("exp", now))
+        if expires_at > now:
+            with self._verified_lock:
+                self._verified[token] = (expires_at, payload)
+                if len(self._verified) > _VERIFY_CACHE_SIZE:
+                    self._verified.popitem(last=False)
+        
+        return payload
     
     def create_api_key(self, user_id: str, api_key_name: str) -> str:
         """
@@ -128,19 +246,46 @@ class JWTHandler:
         return self.create_access_token(data, expires_delta)
 
 
-# Global JWT handler instance
-jwt_handler = None
+def _default_handler() -> Optional[JWTHandler]:
+    """Build the handler from the environment, or None if not configured."""
+    try:
+        return JWTHandler()
+    except ValueError:
+        return None
+
+
+# Global JWT handler instance, built once at import so the auth path only
+# reads it (None when no JWT key is configured yet)
+jwt_handler: Optional[JWTHandler] = _default_handler()
 
 
 def get_jwt_handler() -> JWTHandler:
     """
-    Get or create global JWT handler instance.
+    Get the global JWT handler instance.
     
     Returns:
         JWTHandler instance
+        
+    Raises:
+        ValueError: If no JWT key is configured
     """
-    global jwt_handler
     if jwt_handler is None:
-        jwt_handler = JWTHandler()
+        return reset_jwt_handler()
     return jwt_handler
 
+
+def reset_jwt_handler() -> JWTHandler:
+    """
+    Rebuild the global JWT handler from the current environment.
+    
+    Useful in tests, or after rotating JWT keys.
+    
+    Returns:
+        New JWTHandler instance
+        
+    Raises:
+        ValueError: If no JWT key is configured
+    """
+    global jwt_handler
+    jwt_handler = JWTHandler()
+    return jwt_handler
@@ -11,6 +11,12 @@ from fastapi import HTTPException, status
 class AutoPublisherException(Exception):
     """Base exception for all AutoPublisher errors."""
     
+    # Attributes live in slots, so raising one never allocates an instance dict
+    __slots__ = ('message', 'error_code', 'details')
+    
+    # HTTP status reported by to_http_exception; inherited by subclasses
+    http_status = status.HTTP_500_INTERNAL_SERVER_ERROR
+    
     def __init__(
         self,
         message: str,
@@ -26,6 +32,9 @@ class AutoPublisherException(Exception):
 class ServiceUnavailableError(AutoPublisherException):
     """Raised when an external service is unavailable."""
     
+    __slots__ = ('service_name',)
+    http_status = status.HTTP_503_SERVICE_UNAVAILABLE
+    
     def __init__(
         self,
         service_name: str,
@@ -55,16 +64,19 @@ class DatabaseError(AutoPublisherException):
 class ValidationError(AutoPublisherException):
     """Raised when input validation fails."""
     
+    http_status = status.HTTP_422_UNPROCESSABLE_ENTITY
+    
     def __init__(self, message: str, field: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
-        details = details or {}
         if field:
-            details["field"] = field
+            details = {**details, "field": field} if details else {"field": field}
         super().__init__(message, "VALIDATION_ERROR", details)
 
 
 class AuthenticationError(AutoPublisherException):
     """Raised when authentication fails."""
     
+    http_status = status.HTTP_401_UNAUTHORIZED
+    
     def __init__(self, message: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
         message = message or "Authentication failed"
         super().__init__(message, "AUTHENTICATION_ERROR", details)
@@ -73,6 +85,8 @@ class AuthenticationError(AutoPublisherException):
 class AuthorizationError(AutoPublisherException):
     """Raised when user doesn't have permission."""
     
+    http_status = status.HTTP_403_FORBIDDEN
+    
     def __init__(self, message: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
         message = message or "Insufficient permissions"
         super().__init__(message, "AUTHORIZATION_ERROR", details)
@@ -81,6 +95,8 @@ class AuthorizationError(AutoPublisherException):
 class ResourceNotFoundError(AutoPublisherException):
     """Raised when a requested resource is not found."""
     
+    http_status = status.HTTP_404_NOT_FOUND
+    
     def __init__(
         self,
         resource_type: str,
@@ -96,6 +112,8 @@ class ResourceNotFoundError(AutoPublisherException):
 class RateLimitError(AutoPublisherException):
     """Raised when rate limit is exceeded."""
     
+    http_status = status.HTTP_429_TOO_MANY_REQUESTS
+    
     def __init__(
         self,
         retry_after: int,
@@ -103,8 +121,10 @@ class RateLimitError(AutoPublisherException):
         details: Optional[Dict[str, Any]] = None
     ):
         message = f"Rate limit exceeded. Try again in {retry_after} seconds."
-        details = details or {}
-        details.update({"retry_after": retry_after, "limit": limit})
+        details = (
+            {**details, "retry_after": retry_after, "limit": limit}
+            if details else {"retry_after": retry_after, "limit": limit}
+        )
         super().__init__(message, "RATE_LIMIT_EXCEEDED", details)
 
 
@@ -126,8 +146,7 @@ class PublishingError(AutoPublisherException):
         details: Optional[Dict[str, Any]] = None
     ):
         message = message or f"Failed to publish to {platform}"
-        details = details or {}
-        details["platform"] = platform
+        details = {**details, "platform": platform} if details else {"platform": platform}
         super().__init__(message, "PUBLISHING_ERROR", details)
 
 
@@ -143,26 +162,29 @@ class ConfigurationError(AutoPublisherException):
     """Raised when configuration is invalid or missing."""
     
     def __init__(self, message: str, config_key: Optional[str] = None, details: Optional[Dict[str, Any]] = None):
-        details = details or {}
         if config_key:
-            details["config_key"] = config_key
+            details = {**details, "config_key": config_key} if details else {"config_key": config_key}
         super().__init__(message, "CONFIGURATION_ERROR", details)
 
 
-# Mapping of custom exceptions to HTTP status codes
+# Mapping of custom exceptions to HTTP status codes (kept for callers that
+# look statuses up by type; to_http_exception reads http_status directly)
 EXCEPTION_STATUS_MAP = {
-    ServiceUnavailableError: status.HTTP_503_SERVICE_UNAVAILABLE,
-    OpenAIError: status.HTTP_503_SERVICE_UNAVAILABLE,
-    DatabaseError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-    ValidationError: status.HTTP_422_UNPROCESSABLE_ENTITY,
-    AuthenticationError: status.HTTP_401_UNAUTHORIZED,
-    AuthorizationError: status.HTTP_403_FORBIDDEN,
-    ResourceNotFoundError: status.HTTP_404_NOT_FOUND,
-    RateLimitError: status.HTTP_429_TOO_MANY_REQUESTS,
-    ContentGenerationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-    PublishingError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-    WorkflowError: status.HTTP_500_INTERNAL_SERVER_ERROR,
-    ConfigurationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
+    exc_type: exc_type.http_status
+    for exc_type in (
+        ServiceUnavailableError,
+        OpenAIError,
+        DatabaseError,
+        ValidationError,
+        AuthenticationError,
+        AuthorizationError,
+        ResourceNotFoundError,
+        RateLimitError,
+        ContentGenerationError,
+        PublishingError,
+        WorkflowError,
+        ConfigurationError,
+    )
 }
 
 
@@ -176,13 +198,11 @@ def to_http_exception(exc: AutoPublisherException) -> HTTPException:
     Returns:
         HTTPException with appropriate status code and details
     """
-    status_code = EXCEPTION_STATUS_MAP.get(type(exc), status.HTTP_500_INTERNAL_SERVER_ERROR)
-    
-    detail = {
-        "error": exc.error_code,
-        "message": exc.message,
-        "details": exc.details
-    }
-    
-    return HTTPException(status_code=status_code, detail=detail)
-
+    return HTTPException(
+        status_code=exc.http_status,
+        detail={
+            "error": exc.error_code,
+            "message": exc.message,
+            "details": exc.details
+        }
+    )
@@ -31,17 +31,17 @@ async def autopublisher_exception_handler(
     Returns:
         JSON response with error details
     """
-    # Log the error
-    logger.error(
+    # Log the error (one call; the traceback comes from exc itself)
+    logger.exception(
         f"AutoPublisher error: {exc.error_code}",
+        exc_info=exc,
         extra={
             "error_code": exc.error_code,
-            "message": exc.message,
+            "error_message": exc.message,  # "message" is reserved on LogRecord
             "details": exc.details,
             "path": request.url.path,
             "method": request.method
-        },
-        exc_info=True
+        }
     )
     
     # Convert to HTTP exception
@@ -76,11 +76,12 @@ async def validation_exception_handler(
             "type": error["type"]
         })
     
+    path = request.url.path
     logger.warning(
-        f"Validation error on {request.url.path}",
+        f"Validation error on {path}",
         extra={
             "errors": errors,
-            "path": request.url.path,
+            "path": path,
             "method": request.method
         }
     )
@@ -112,14 +113,14 @@ async def generic_exception_handler(
         JSON response with generic error message
     """
     # Log the error with full traceback
-    logger.error(
+    logger.exception(
         f"Unexpected error: {str(exc)}",
+        exc_info=exc,
         extra={
             "path": request.url.path,
             "method": request.method,
             "exception_type": type(exc).__name__
-        },
-        exc_info=True
+        }
     )
     
     # Don't expose internal error details in production
@@ -146,6 +147,9 @@ def register_error_handlers(app):
     
     Args:
         app: FastAPI application instance
+    
+    Handlers are registered directly on the app's exception middleware;
+    nothing here wraps requests in BaseHTTPMiddleware.
     """
     # Custom exceptions
     app.add_exception_handler(AutoPublisherException, autopublisher_exception_handler)
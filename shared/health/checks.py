@@ -6,14 +6,51 @@ This module provides health check endpoints for monitoring service status.
 
 import asyncio
 from typing import Dict, Any, Optional, List, Callable
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 import logging
+import time
 
 
 logger = logging.getLogger(__name__)
 
 
+# aiohttp session shared by every check_external_service call (created on
+# first use, so aiohttp stays an optional dependency)
+_health_session = None
+
+
+def _get_health_session():
+    """Get the shared health-check HTTP session, creating it if needed."""
+    global _health_session
+    
+    if _health_session is None or _health_session.closed:
+        import aiohttp
+        
+        _health_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+        )
+    return _health_session
+
+
+async def close_health_session() -> None:
+    """
+    Close the shared health-check HTTP session.
+    
+    Call on application shutdown if check_external_service is used.
+    """
+    global _health_session
+    
+    if _health_session is not None:
+        await _health_session.close()
+        _health_session = None
+
+
+def _iso_timestamp(ns: int) -> str:
+    """Format a time.time_ns() value as an ISO 8601 UTC timestamp."""
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+
+
 class HealthStatus(str, Enum):
     """Health check status values."""
     HEALTHY = "healthy"
@@ -26,6 +63,8 @@ class HealthCheck:
     Health check result.
     """
     
+    __slots__ = ('name', 'status', 'message', 'details', 'response_time_ms', 'created_ns')
+    
     def __init__(
         self,
         name: str,
@@ -39,7 +78,13 @@ class HealthCheck:
         self.message = message or status.value
         self.details = details or {}
         self.response_time_ms = response_time_ms
-        self.timestamp = datetime.utcnow().isoformat()
+        # Raw clock reading; only formatted when the result is serialized
+        self.created_ns = time.time_ns()
+    
+    @property
+    def timestamp(self) -> str:
+        """ISO 8601 UTC time the check result was created."""
+        return _iso_timestamp(self.created_ns)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -60,14 +105,17 @@ class HealthChecker:
     Manages multiple health checks and provides aggregated status.
     """
     
-    def __init__(self, service_name: str):
+    def __init__(self, service_name: str, check_timeout: float = 5.0):
         """
         Initialize health checker.
         
         Args:
             service_name: Name of the service
+            check_timeout: Seconds a single check may take before it is
+                reported as degraded
         """
         self.service_name = service_name
+        self.check_timeout = check_timeout
         self.checks: Dict[str, Callable] = {}
     
     def register_check(self, name: str, check_func: Callable):
@@ -100,7 +148,7 @@ class HealthChecker:
         
         try:
             start_time = asyncio.get_event_loop().time()
-            result = await check_func()
+            result = await asyncio.wait_for(check_func(), timeout=self.check_timeout)
             end_time = asyncio.get_event_loop().time()
             
             response_time_ms = (end_time - start_time) * 1000
@@ -108,6 +156,16 @@ class HealthChecker:
             
             return result
             
+        except asyncio.TimeoutError:
+            # A slow dependency shouldn't hold up (or fail) the whole probe
+            logger.warning(f"Health check '{name}' timed out after {self.check_timeout}s")
+            return HealthCheck(
+                name=name,
+                status=HealthStatus.DEGRADED,
+                message=f"Check timed out after {self.check_timeout}s",
+                response_time_ms=self.check_timeout * 1000
+            )
+            
         except Exception as e:
             logger.error(f"Health check '{name}' failed: {e}", exc_info=True)
             return HealthCheck(
@@ -123,23 +181,12 @@ class HealthChecker:
         Returns:
             List of HealthCheck results
         """
-        tasks = [self.run_check(name) for name in self.checks.keys()]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # run_check never raises (failures and timeouts become results),
+        # so the group always completes with one result per check
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self.run_check(name)) for name in self.checks]
         
-        # Convert exceptions to unhealthy checks
-        health_checks = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                name = list(self.checks.keys())[i]
-                health_checks.append(HealthCheck(
-                    name=name,
-                    status=HealthStatus.UNHEALTHY,
-                    message=f"Check failed: {str(result)}"
-                ))
-            else:
-                health_checks.append(result)
-        
-        return health_checks
+        return [task.result() for task in tasks]
     
     async def get_health_status(self) -> Dict[str, Any]:
         """
@@ -163,7 +210,7 @@ class HealthChecker:
         return {
             "service": self.service_name,
             "status": overall_status.value,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _iso_timestamp(time.time_ns()),
             "checks": [check.to_dict() for check in checks]
         }
 
@@ -245,21 +292,21 @@ async def check_external_service(
     import aiohttp
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=timeout) as response:
-                if response.status == 200:
-                    return HealthCheck(
-                        name=service_name,
-                        status=HealthStatus.HEALTHY,
-                        message=f"{service_name} is available"
-                    )
-                else:
-                    return HealthCheck(
-                        name=service_name,
-                        status=HealthStatus.DEGRADED,
-                        message=f"{service_name} returned status {response.status}"
-                    )
-                    
+        session = _get_health_session()
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            if response.status == 200:
+                return HealthCheck(
+                    name=service_name,
+                    status=HealthStatus.HEALTHY,
+                    message=f"{service_name} is available"
+                )
+            else:
+                return HealthCheck(
+                    name=service_name,
+                    status=HealthStatus.DEGRADED,
+                    message=f"{service_name} returned status {response.status}"
+                )
+                
     except Exception as e:
         return HealthCheck(
             name=service_name,
@@ -326,7 +373,7 @@ def create_health_router(health_checker: HealthChecker):
         return {
             "service": health_checker.service_name,
             "status": "alive",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _iso_timestamp(time.time_ns())
         }
     
     @router.get("/health/ready")
@@ -1,6 +1,6 @@
 """Logging utilities."""
 
-from .logger import setup_logging, get_logger, RequestLogger, JSONFormatter
+from .logger import setup_logging, shutdown_logging, get_logger, RequestLogger, JSONFormatter
 
-__all__ = ['setup_logging', 'get_logger', 'RequestLogger', 'JSONFormatter']
+__all__ = ['setup_logging', 'shutdown_logging', 'get_logger', 'RequestLogger', 'JSONFormatter']
 
@@ -5,12 +5,44 @@ Centralized logging configuration for all services.
 """
 
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+import time
+from logging.handlers import (
+    MemoryHandler,
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
 from pathlib import Path
-from typing import Optional
-import json
-from datetime import datetime
+from typing import Dict, List, Optional
+from datetime import datetime, timezone
+import orjson
+
+
+# File writes are buffered this many records at a time (ERROR and above
+# flush immediately)
+_FILE_BUFFER_CAPACITY = 1000
+
+# Background file-writing listeners, by service name
+_listeners: Dict[str, QueueListener] = {}
+
+
+class _LocalQueueHandler(QueueHandler):
+    """
+    QueueHandler for an in-process queue.
+    
+    The stock prepare() pre-formats records for pickling and drops
+    exc_info; here records never leave the process, so only the message
+    is resolved (args may change after the call) and the target
+    formatters still see the exception.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 
 class JSONFormatter(logging.Formatter):
@@ -20,8 +52,9 @@ class JSONFormatter(logging.Formatter):
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
+        # The record's own creation time, serialized by orjson as ...Z
         log_data = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': datetime.fromtimestamp(record.created, tz=timezone.utc),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -35,16 +68,19 @@ class JSONFormatter(logging.Formatter):
             log_data['exception'] = self.formatException(record.exc_info)
         
         # Add extra fields
-        if hasattr(record, 'request_id'):
-            log_data['request_id'] = record.request_id
+        extra = record.__dict__
         
-        if hasattr(record, 'user_id'):
-            log_data['user_id'] = record.user_id
+        if 'request_id' in extra:
+            log_data['request_id'] = extra['request_id']
         
-        if hasattr(record, 'duration'):
-            log_data['duration_ms'] = record.duration
+        if 'user_id' in extra:
+            log_data['user_id'] = extra['user_id']
         
-        return json.dumps(log_data)
+        if 'duration' in extra:
+            log_data['duration_ms'] = extra['duration']
+        
+        # default=str: an unserializable extra shouldn't lose the record
+        return orjson.dumps(log_data, default=str, option=orjson.OPT_UTC_Z).decode()
 
 
 def setup_logging(
@@ -70,6 +106,7 @@ def setup_logging(
     
     # Remove existing handlers
     logger.handlers.clear()
+    _stop_listener(service_name)
     
     # Choose formatter
     if json_format:
@@ -102,7 +139,6 @@ def setup_logging(
         )
         file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
         
         # Error log file (rotating by time)
         error_log = log_dir / f"{service_name}_error.log"
@@ -115,7 +151,18 @@ def setup_logging(
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(formatter)
-        logger.addHandler(error_handler)
+        
+        # File I/O happens on a listener thread, in buffered batches, so
+        # logging calls never block on disk writes
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(_LocalQueueHandler(log_queue))
+        listener = QueueListener(
+            log_queue,
+            *_buffered(file_handler, error_handler),
+            respect_handler_level=True
+        )
+        listener.start()
+        _listeners[service_name] = listener
     
     # Prevent propagation to root logger
     logger.propagate = False
@@ -123,6 +170,43 @@ def setup_logging(
     return logger
 
 
+def _buffered(*targets: logging.Handler) -> List[MemoryHandler]:
+    """Wrap file handlers in memory buffers at the same levels."""
+    buffers = []
+    for target in targets:
+        buffer = MemoryHandler(
+            capacity=_FILE_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=target
+        )
+        buffer.setLevel(target.level)
+        buffers.append(buffer)
+    return buffers
+
+
+def _stop_listener(service_name: str) -> None:
+    """Drain, flush and close a service's file logging, if running."""
+    listener = _listeners.pop(service_name, None)
+    if listener is None:
+        return
+    
+    listener.stop()
+    for buffer in listener.handlers:
+        target = buffer.target
+        buffer.close()  # flushes to the file handler
+        target.close()
+
+
+def shutdown_logging() -> None:
+    """
+    Flush buffered log records and stop background file logging.
+    
+    Call on application shutdown (e.g. at the end of the lifespan).
+    """
+    for service_name in list(_listeners):
+        _stop_listener(service_name)
+
+
 class RequestLogger:
     """
     Context manager for request logging with timing.
@@ -135,7 +219,7 @@ class RequestLogger:
         self.start_time = None
     
     def __enter__(self):
-        self.start_time = datetime.utcnow()
+        self.start_time = time.perf_counter_ns()
         self.logger.info(
             f"Request started: {self.endpoint}",
             extra={'request_id': self.request_id}
@@ -143,7 +227,7 @@ class RequestLogger:
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = (datetime.utcnow() - self.start_time).total_seconds() * 1000
+        duration = (time.perf_counter_ns() - self.start_time) / 1e6  # ms
         
         if exc_type is None:
             self.logger.info(
@@ -5,13 +5,12 @@ Adds unique request ID to each request for tracing across microservices.
 """
 
 import uuid
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 from starlette.requests import Request
-from starlette.responses import Response
-from typing import Callable
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """
     Middleware to add unique request ID to each request.
     
@@ -23,39 +22,53 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
     - Stored in request.state.request_id
     - Added to response headers as X-Request-ID
     - Available for logging and tracing
+    
+    Implemented as plain ASGI middleware, so requests aren't routed
+    through BaseHTTPMiddleware's extra task and stream per call.
     """
     
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable
-    ) -> Response:
+    def __init__(self, app: ASGIApp):
         """
-        Process request and add request ID.
+        Initialize middleware.
         
         Args:
-            request: Incoming request
-            call_next: Next middleware/endpoint
+            app: ASGI application
+        """
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Process request and add request ID.
         
-        Returns:
-            Response with X-Request-ID header
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
         # Get request ID from header or generate new one
-        request_id = request.headers.get('X-Request-ID')
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
         
         if not request_id:
             request_id = str(uuid.uuid4())
         
         # Store in request state
-        request.state.request_id = request_id
-        
-        # Process request
-        response = await call_next(request)
+        scope.setdefault("state", {})["request_id"] = request_id
         
-        # Add to response headers
-        response.headers['X-Request-ID'] = request_id
+        async def send_with_request_id(message: Message) -> None:
+            # Add to response headers
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
         
-        return response
+        await self.app(scope, receive, send_with_request_id)
 
 
 def get_request_id(request: Request) -> str: